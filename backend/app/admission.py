@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+import math
+import os
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import AsyncIterator
+
+
+# Lower number = served first. Live interview assist always beats interactive evaluations,
+# which always beat batch work (file uploads, background jobs).
+LANES: dict[str, int] = {"live": 0, "interactive": 1, "batch": 2}
+
+_DEFAULT_LIMITS = {"live": 8, "interactive": 4, "batch": 2}
+_DEFAULT_QUEUES = {"live": 32, "interactive": 16, "batch": 16}
+
+
+class Overloaded(Exception):
+    """Raised when a lane's wait queue is full or a waiter times out (maps to HTTP 503)."""
+
+    def __init__(self, lane: str, retry_after: int) -> None:
+        super().__init__(f"{lane} capacity exhausted")
+        self.lane = lane
+        self.retry_after = retry_after
+
+
+def _env_int(name: str, default: int) -> int:
+    try:
+        return int(os.getenv(name, "") or default)
+    except ValueError:
+        return default
+
+
+@dataclass
+class _Lane:
+    name: str
+    priority: int
+    limit: int
+    max_queue: int
+    active: int = 0
+    # tenant -> FIFO of waiters; dict order is the round-robin order across tenants.
+    waiters: OrderedDict[str, deque[asyncio.Future[None]]] = field(default_factory=OrderedDict)
+    avg_service_s: float = 1.0
+
+    @property
+    def queued(self) -> int:
+        return sum(len(q) for q in self.waiters.values())
+
+    def next_waiter(self) -> asyncio.Future[None] | None:
+        while self.waiters:
+            tenant, queue = next(iter(self.waiters.items()))
+            fut = queue.popleft() if queue else None
+            if queue:
+                self.waiters.move_to_end(tenant)
+            else:
+                del self.waiters[tenant]
+            if fut is not None and not fut.done():
+                return fut
+        return None
+
+    def discard(self, tenant: str, fut: asyncio.Future[None]) -> None:
+        queue = self.waiters.get(tenant)
+        if queue is None:
+            return
+        try:
+            queue.remove(fut)
+        except ValueError:
+            pass
+        if not queue:
+            del self.waiters[tenant]
+
+
+class AdmissionController:
+    """Concurrency limits per endpoint class with bounded, priority + per-tenant fair queues.
+
+    A request runs when both the global ``capacity`` and its lane's ``limit`` have room.
+    Freed slots go to the highest-priority lane with waiters, round-robin across tenants
+    within the lane. Full queues and waits longer than ``max_wait_s`` raise ``Overloaded``.
+    """
+
+    def __init__(self, *, capacity: int, lanes: dict[str, _Lane], max_wait_s: float) -> None:
+        self.capacity = capacity
+        self.max_wait_s = max_wait_s
+        self._lanes = lanes
+        self._by_priority = sorted(lanes.values(), key=lambda lane: lane.priority)
+
+    @classmethod
+    def from_env(cls) -> "AdmissionController":
+        lanes = {
+            name: _Lane(
+                name=name,
+                priority=priority,
+                limit=max(1, _env_int(f"PANELAI_LIMIT_{name.upper()}", _DEFAULT_LIMITS[name])),
+                max_queue=max(0, _env_int(f"PANELAI_QUEUE_{name.upper()}", _DEFAULT_QUEUES[name])),
+            )
+            for name, priority in LANES.items()
+        }
+        return cls(
+            capacity=max(1, _env_int("PANELAI_MAX_CONCURRENCY", 8)),
+            lanes=lanes,
+            max_wait_s=float(_env_int("PANELAI_QUEUE_TIMEOUT_S", 10)),
+        )
+
+    @property
+    def _active(self) -> int:
+        return sum(lane.active for lane in self._by_priority)
+
+    def retry_after(self, lane_name: str) -> int:
+        lane = self._lanes[lane_name]
+        return max(1, math.ceil(lane.avg_service_s * (lane.queued + 1) / lane.limit))
+
+    def check(self, lane_name: str) -> None:
+        """Fail fast if a new request on this lane would not even fit in the queue."""
+        lane = self._lanes[lane_name]
+        if lane.queued >= lane.max_queue and (lane.active >= lane.limit or self._active >= self.capacity):
+            raise Overloaded(lane_name, self.retry_after(lane_name))
+
+    def stats(self) -> dict[str, dict[str, int]]:
+        return {
+            lane.name: {"active": lane.active, "queued": lane.queued, "limit": lane.limit, "max_queue": lane.max_queue}
+            for lane in self._by_priority
+        }
+
+    def _dispatch(self) -> None:
+        while self._active < self.capacity:
+            for lane in self._by_priority:
+                if lane.active < lane.limit and lane.waiters:
+                    fut = lane.next_waiter()
+                    if fut is not None:
+                        lane.active += 1
+                        fut.set_result(None)
+                        break
+            else:
+                return
+
+    def _release(self, lane: _Lane, started: float) -> None:
+        lane.active -= 1
+        lane.avg_service_s = 0.8 * lane.avg_service_s + 0.2 * (time.monotonic() - started)
+        self._dispatch()
+
+    @asynccontextmanager
+    async def slot(self, lane_name: str, tenant: str = "default", *, bounded: bool = True) -> AsyncIterator[None]:
+        """Hold one execution slot on ``lane_name``; ``bounded=False`` waits without queue/time limits."""
+        lane = self._lanes[lane_name]
+        if bounded and lane.queued >= lane.max_queue:
+            self._dispatch()
+            if lane.queued >= lane.max_queue:
+                raise Overloaded(lane_name, self.retry_after(lane_name))
+
+        fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        lane.waiters.setdefault(tenant, deque()).append(fut)
+        self._dispatch()
+        try:
+            if bounded and self.max_wait_s > 0:
+                await asyncio.wait_for(fut, self.max_wait_s)
+            else:
+                await fut
+        except BaseException as exc:
+            if fut.done() and not fut.cancelled():
+                # Granted just as we gave up: hand the slot straight back.
+                lane.active -= 1
+                self._dispatch()
+            else:
+                fut.cancel()
+                lane.discard(tenant, fut)
+            if isinstance(exc, asyncio.TimeoutError):
+                raise Overloaded(lane_name, self.retry_after(lane_name)) from None
+            raise
+
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            self._release(lane, started)
@@ -1,7 +1,14 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Any, Literal, Protocol
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, ClassVar, Literal, Protocol
+
+from ..llm.provider import LLMProvider
+from ..llm.registry import ProviderRegistry, get_registry
+from ..llm.usage import MeteredProvider, UsageLedger
+
+if TYPE_CHECKING:
+    from .gap_analysis import JDProfile
 
 
 @dataclass(frozen=True)
@@ -10,6 +17,39 @@ class PanelContext:
     resume: str
     transcript: str
     config: dict[str, Any] = field(default_factory=dict)
+    providers: ProviderRegistry | None = None
+    usage: UsageLedger | None = None
+    stage: str = ""
+    tenant: str = "default"
+    # Caller's stable name for the candidate (the evaluation label, a /rank id); "" when unknown.
+    candidate: str = ""
+    jd_profile: "JDProfile | None" = None
+    on_event: Callable[[str, dict[str, Any]], Awaitable[None]] | None = None
+
+    def llm(self, role: str) -> LLMProvider:
+        """Provider routed for an agent role; falls back to the app-wide registry.
+
+        When the context carries a usage ledger, calls are metered under ``role`` and ``stage``.
+        """
+        provider = (self.providers or get_registry()).for_role(role)
+        if self.usage is None:
+            return provider
+        return MeteredProvider(inner=provider, ledger=self.usage, agent=role, stage=self.stage)
+
+    async def emit(self, event: str, data: dict[str, Any]) -> None:
+        """Publish a progress event to a streaming consumer, if one is attached."""
+        if self.on_event is not None:
+            await self.on_event(event, data)
+
+
+@dataclass(frozen=True)
+class Span:
+    """Character range [start, end) in one of the input documents."""
+
+    doc: Literal["transcript", "resume", "job_description"]
+    start: int
+    end: int
+    turn: int | None = None
 
 
 @dataclass(frozen=True)
@@ -20,6 +60,7 @@ class Finding:
     claim: str | None = None
     evidence: str | None = None
     explanation: str | None = None
+    evidence_span: Span | None = None
 
 
 @dataclass(frozen=True)
@@ -49,6 +90,9 @@ class AgentResult:
 
 class PanelAgent(Protocol):
     name: str
+    # PanelContext fields the result is a pure function of ("config.<key>" for one config entry);
+    # None means the agent must always run (see agents/memo.py).
+    depends_on: ClassVar[tuple[str, ...] | None]
 
     async def run(self, ctx: PanelContext) -> AgentResult:
         ...
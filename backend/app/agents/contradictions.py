@@ -2,9 +2,11 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import ClassVar
 
 from .base import AgentResult, Finding, PanelContext
-from .transcript_evidence import _chunk_transcript
+from .transcript_evidence import _chunk_transcript_spans
 
 
 _RED_FLAGS = [
@@ -19,14 +21,9 @@ _RED_FLAGS = [
 ]
 
 
-def _find_red_flag_snippets(transcript: str) -> list[str]:
-    chunks = _chunk_transcript(transcript)
-    out: list[str] = []
-    for ch in chunks:
-        lower = ch.lower()
-        if any(p in lower for p in _RED_FLAGS):
-            out.append(ch)
-    return out[:8]
+def _is_red_flag(chunk: str) -> bool:
+    lower = chunk.lower()
+    return any(p in lower for p in _RED_FLAGS)
 
 
 def _extract_skill_terms(resume: str) -> set[str]:
@@ -40,17 +37,103 @@ def _extract_skill_terms(resume: str) -> set[str]:
     return set(sorted(keep))
 
 
+# A run of skill characters not glued to a preceding [A-Za-z0-9_+#]. Skills are single tokens of
+# these characters, so every mention lies inside one run.
+_RUN = re.compile(r"(?<![A-Za-z0-9_+#])[A-Za-z][A-Za-z0-9+.#-]*")
+_SUBSTART = re.compile(r"[.-](?=[A-Za-z])")
+_CUT = re.compile(r"[.-]")
+
+
+@dataclass(frozen=True)
+class SkillMatcher:
+    """Case-insensitive, word-bounded lookup of a resume's skill terms.
+
+    A mention is a skill not touching [A-Za-z0-9_+#] on either side, the longest one winning where
+    several start at the same place. Matching walks the text once and, per candidate start, checks
+    at most ``max_len`` end positions against a dict: linear in the text whatever the number of
+    skills (a regex alternation of all skills costs text length x skill count).
+    """
+
+    skills: tuple[str, ...]
+    canonical: dict[str, str]
+    max_len: int = 0
+
+    def _in_run(self, run: str, tail_ok: bool) -> list[str]:
+        if "." not in run and "-" not in run:
+            # Common case: a plain word, one possible mention.
+            skill = self.canonical.get(run.lower()) if tail_ok and len(run) <= self.max_len else None
+            return [skill] if skill else []
+        starts = [0] + [m.end() for m in _SUBSTART.finditer(run)]
+        ends = [m.start() for m in _CUT.finditer(run)] + ([len(run)] if tail_ok else [])
+        found: list[str] = []
+        lower = run.lower()
+        pos = 0
+        for a in starts:
+            if a < pos:
+                continue
+            for b in reversed(ends):
+                if b <= a or b - a > self.max_len:
+                    continue
+                skill = self.canonical.get(lower[a:b])
+                if skill:
+                    found.append(skill)
+                    pos = b
+                    break
+        return found
+
+    def mentions(self, text: str) -> list[str]:
+        """Skills mentioned in ``text``, in order of first mention."""
+        if not self.canonical:
+            return []
+        out: dict[str, None] = {}
+        for m in _RUN.finditer(text):
+            # The character after the run is outside the skill alphabet; only "_" also blocks a match.
+            tail_ok = m.end() == len(text) or text[m.end()] != "_"
+            for skill in self._in_run(m.group(), tail_ok):
+                out.setdefault(skill, None)
+        return list(out)
+
+    def skill_chunks(self, chunks: list[str]) -> dict[str, list[int]]:
+        """Skill -> indexes of the chunks mentioning it (one scan per chunk)."""
+        out: dict[str, list[int]] = {}
+        for i, ch in enumerate(chunks):
+            for skill in self.mentions(ch):
+                out.setdefault(skill, []).append(i)
+        return out
+
+
+@lru_cache(maxsize=256)
+def skill_matcher(resume: str) -> SkillMatcher:
+    skills = tuple(sorted(_extract_skill_terms(resume)))
+    canonical: dict[str, str] = {}
+    for skill in skills:
+        canonical.setdefault(skill.lower(), skill)
+    return SkillMatcher(skills=skills, canonical=canonical, max_len=max(map(len, canonical), default=0))
+
+
 @dataclass
 class ContradictionHunterAgent:
+    """Flags candidate answers admitting uncertainty, high severity when they name a resume skill.
+
+    Artifacts: ``skills_detected`` (the resume's skill terms, first 120) and ``skill_chunks``,
+    skill -> indexes into TranscriptEvidenceAgent's ``chunks`` mentioning it. Nothing in a single
+    panel run reads ``skill_chunks``; it is the per-round input the dossier re-bases onto the
+    merged chunks of all rounds.
+    """
+
     name: str = "contradiction-hunter"
+    depends_on: ClassVar[tuple[str, ...] | None] = ("resume", "transcript")
 
     async def run(self, ctx: PanelContext) -> AgentResult:
-        skills = _extract_skill_terms(ctx.resume)
-        red_flags = _find_red_flag_snippets(ctx.transcript)
+        matcher = skill_matcher(ctx.resume)
+        # Same chunks (and indexes) as TranscriptEvidenceAgent's "chunks" artifact.
+        chunks = _chunk_transcript_spans(ctx.transcript)
+        skill_chunks = matcher.skill_chunks([ch for ch, _ in chunks])
+        red_flags = [(ch, span) for ch, span in chunks if _is_red_flag(ch)][:8]
 
         findings: list[Finding] = []
-        for snippet in red_flags:
-            mentioned = [s for s in list(skills)[:80] if s.lower() in snippet.lower()]
+        for snippet, span in red_flags:
+            mentioned = matcher.mentions(snippet)
             findings.append(
                 Finding(
                     category="contradiction_or_uncertainty",
@@ -58,6 +141,7 @@ class ContradictionHunterAgent:
                     severity="high" if mentioned else "medium",
                     claim=", ".join(mentioned) if mentioned else None,
                     evidence=snippet,
+                    evidence_span=span,
                     explanation=(
                         "Uncertainty is not automatically disqualifying, but becomes a discrepancy "
                         "when it conflicts with strong resume claims or role-critical requirements."
@@ -65,7 +149,10 @@ class ContradictionHunterAgent:
                 )
             )
 
-        return AgentResult(findings=findings, artifacts={"skills_detected": sorted(list(skills))[:120]})
+        return AgentResult(
+            findings=findings,
+            artifacts={"skills_detected": list(matcher.skills[:120]), "skill_chunks": skill_chunks},
+        )
 
     async def respond_to_challenge(self, ctx: PanelContext, challenge: str) -> str:
         return (
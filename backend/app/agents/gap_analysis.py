@@ -1,83 +1,291 @@
 from __future__ import annotations
 
 import re
+import threading
+from collections import Counter, OrderedDict
+from collections.abc import Set as AbstractSet
 from dataclasses import dataclass
+from functools import lru_cache
+from typing import ClassVar
 
-from ..llm.factory import get_provider
 from .base import AgentResult, Finding, PanelContext
+from .transcript_turns import candidate_text
+
+
+_REQUIREMENT_WORD = re.compile(r"\b(must|required|requirements?)\b", re.I)
+_SPACES = re.compile(r"\s+")
+MAX_REQUIREMENTS = 40
 
 
 def _extract_requirements(jd: str) -> list[str]:
-    lines = [ln.strip() for ln in jd.splitlines() if ln.strip()]
-    reqs: list[str] = []
-    for ln in lines:
-        if ln.startswith(("-", "•", "*")):
-            reqs.append(ln.lstrip("-*• ").strip())
-            continue
-        if re.search(r"\b(must|required|requirements?)\b", ln, re.I):
-            reqs.append(ln)
+    """First ``MAX_REQUIREMENTS`` distinct requirement lines, in order. Stops reading once it has them."""
     seen: set[str] = set()
     out: list[str] = []
-    for r in reqs:
-        r2 = re.sub(r"\s+", " ", r).strip()
-        if r2 and r2 not in seen:
-            out.append(r2)
-            seen.add(r2)
-    return out[:40]
-
-
-def _mentions(text: str, requirement: str) -> bool:
-    # crude but effective: match main keywords
-    req_words = re.findall(r"[a-zA-Z][a-zA-Z0-9_+-]{1,}", requirement.lower())
-    stop = {
-        "and",
-        "with",
-        "for",
-        "the",
-        "to",
-        "a",
-        "of",
-        "must",
-        "have",
-        "required",
-        "requirements",
-        "requirement",
-        "experience",
-        "years",
-        "year",
-    }
-    short_ok = {"go", "c", "js", "ts", "ai", "ml"}
-    req_words = [w for w in req_words if w not in stop and (len(w) >= 3 or w in short_ok)]
+    for raw in jd.splitlines():
+        ln = raw.strip()
+        if not ln:
+            continue
+        if ln.startswith(("-", "•", "*")):
+            req = ln.lstrip("-*• ").strip()
+        elif _REQUIREMENT_WORD.search(ln):
+            req = ln
+        else:
+            continue
+        req = _SPACES.sub(" ", req).strip()
+        if req and req not in seen:
+            out.append(req)
+            seen.add(req)
+            if len(out) >= MAX_REQUIREMENTS:
+                break
+    return out
+
+
+_STOP = {
+    "and",
+    "with",
+    "for",
+    "the",
+    "to",
+    "a",
+    "of",
+    "must",
+    "have",
+    "required",
+    "requirements",
+    "requirement",
+    "experience",
+    "years",
+    "year",
+}
+_SHORT_OK = {"go", "c", "js", "ts", "ai", "ml"}
+
+
+_TOKEN = re.compile(r"[a-z][a-z0-9_+-]{1,}")
+
+
+def _norm(word: str) -> str:
+    # Light suffix folding, applied to both sides, so "designed"/"scaling"/"databases" still
+    # satisfy "design"/"scale"/"database" now that matching is on whole words.
+    if len(word) > 5 and word.endswith("ing"):
+        word = word[:-3]
+    elif len(word) > 4 and word.endswith("ed"):
+        word = word[:-2]
+    elif len(word) > 4 and word.endswith("s") and not word.endswith("ss"):
+        word = word[:-1]
+    return word[:-1] if len(word) > 4 and word.endswith("e") else word
+
+
+def _terms_of(text: str) -> set[str]:
+    """Normalized word set of ``text``; hyphenated words also contribute their parts."""
+    out: set[str] = set()
+    for w in _TOKEN.findall(text.lower()):
+        out.add(_norm(w))
+        if "-" in w:
+            out.update(_norm(p) for p in w.split("-") if len(p) >= 2)
+    return out
+
+
+def _requirement_terms(requirement: str) -> tuple[tuple[str, ...], int]:
+    """Keywords checked for a requirement and how many must appear."""
+    req_words = _TOKEN.findall(requirement.lower())
+    req_words = [w for w in req_words if w not in _STOP and (len(w) >= 3 or w in _SHORT_OK)]
     if not req_words:
-        return False
-    hits = sum(1 for w in set(req_words[:8]) if w in text.lower())
-    return hits >= max(1, min(3, len(set(req_words)) // 4))
+        return (), 0
+    terms = tuple(dict.fromkeys(_norm(w) for w in req_words[:8]))
+    return terms, max(1, min(3, len(set(req_words)) // 4))
+
+
+@dataclass(frozen=True)
+class RequirementMatcher:
+    requirement: str
+    terms: tuple[str, ...]
+    needed: int
+    # Per-term weight: 1 / number of requirements using the term, so distinctive terms count most.
+    weights: tuple[float, ...] = ()
+
+    def hits(self, terms: AbstractSet[str]) -> int:
+        return sum(1 for t in self.terms if t in terms)
+
+    def matches(self, terms: AbstractSet[str]) -> bool:
+        return bool(self.terms) and self.hits(terms) >= self.needed
+
+    def score(self, terms: AbstractSet[str]) -> float:
+        """Weighted share of this requirement's terms found, 0..1."""
+        weights = self.weights or (1.0,) * len(self.terms)
+        total = sum(weights)
+        return sum(w for t, w in zip(self.terms, weights) if t in terms) / total if total else 0.0
+
+
+@dataclass(frozen=True)
+class Coverage:
+    covered: list[str]
+    gaps: list[str]
+    scores: dict[str, float]
+
+    @property
+    def ratio(self) -> float:
+        total = len(self.covered) + len(self.gaps)
+        return len(self.covered) / total if total else 0.0
+
+    @property
+    def score(self) -> float:
+        return sum(self.scores.values()) / len(self.scores) if self.scores else 0.0
+
+
+@dataclass(frozen=True)
+class JDProfile:
+    """A job description compiled once: requirements plus their keyword matchers.
+
+    Evaluating a candidate against a profile is matching only; nothing about the JD is re-parsed.
+    """
+
+    job_description: str
+    matchers: tuple[RequirementMatcher, ...]
+    profile_id: str | None = None
+    title: str = ""
+
+    @property
+    def requirements(self) -> list[str]:
+        return [m.requirement for m in self.matchers]
+
+    @property
+    def keywords(self) -> list[str]:
+        return sorted({t for m in self.matchers for t in m.terms})
+
+    def coverage(self, terms: AbstractSet[str]) -> Coverage:
+        """Requirement coverage for a candidate's term set (see ``candidate_terms``)."""
+        covered: list[str] = []
+        gaps: list[str] = []
+        scores: dict[str, float] = {}
+        for m in self.matchers:
+            (covered if m.matches(terms) else gaps).append(m.requirement)
+            scores[m.requirement] = round(m.score(terms), 3)
+        return Coverage(covered=covered, gaps=gaps, scores=scores)
+
+
+def compile_jd_profile(
+    job_description: str, *, requirements: list[str] | None = None, profile_id: str | None = None, title: str = ""
+) -> JDProfile:
+    reqs = _extract_requirements(job_description) if requirements is None else requirements
+    parsed = [(r, *_requirement_terms(r)) for r in reqs]
+    df = Counter(t for _, terms, _ in parsed for t in terms)
+    return JDProfile(
+        job_description=job_description,
+        matchers=tuple(
+            RequirementMatcher(r, terms, needed, weights=tuple(1.0 / df[t] for t in terms)) for r, terms, needed in parsed
+        ),
+        profile_id=profile_id,
+        title=title,
+    )
+
+
+@lru_cache(maxsize=512)
+def _resume_terms(resume: str) -> frozenset[str]:
+    return frozenset(_terms_of(resume))
+
+
+# Live transcripts only grow: keep, per recent transcript, the terms of everything up to its
+# last whitespace (tokens can't straddle it) so the next tick only tokenizes the new tail.
+_TRANSCRIPT_TERMS: OrderedDict[str, tuple[int, frozenset[str], frozenset[str]]] = OrderedDict()
+_TRANSCRIPT_TERMS_MAX = 128
+_TRANSCRIPT_TERMS_MAX_CHARS = 4_000_000
+_TRANSCRIPT_TERMS_LOCK = threading.Lock()
+_transcript_terms_chars = 0
+
+
+def _spoken_terms(spoken: str) -> frozenset[str]:
+    global _transcript_terms_chars
+    with _TRANSCRIPT_TERMS_LOCK:
+        hit = _TRANSCRIPT_TERMS.get(spoken)
+        if hit is not None:
+            _TRANSCRIPT_TERMS.move_to_end(spoken)
+            return hit[2]
+        base = next(
+            ((text, entry) for text, entry in reversed(_TRANSCRIPT_TERMS.items()) if spoken.startswith(text)),
+            None,
+        )
+    start, stable = (base[1][0], base[1][1]) if base else (0, frozenset())
+    cut = max(start, max(spoken.rfind(" "), spoken.rfind("\n")))
+    new_stable = stable | _terms_of(spoken[start:cut])
+    entry = (cut, frozenset(new_stable), frozenset(new_stable | _terms_of(spoken[cut:])))
+    with _TRANSCRIPT_TERMS_LOCK:
+        if spoken not in _TRANSCRIPT_TERMS:
+            _transcript_terms_chars += len(spoken)
+        _TRANSCRIPT_TERMS[spoken] = entry
+        while len(_TRANSCRIPT_TERMS) > 1 and (
+            len(_TRANSCRIPT_TERMS) > _TRANSCRIPT_TERMS_MAX or _transcript_terms_chars > _TRANSCRIPT_TERMS_MAX_CHARS
+        ):
+            old, _ = _TRANSCRIPT_TERMS.popitem(last=False)
+            _transcript_terms_chars -= len(old)
+    return entry[2]
+
+
+def candidate_terms(resume: str, transcript: str) -> frozenset[str]:
+    """Word set of the resume plus candidate speech, tokenized once and cached across ticks."""
+    return _resume_terms(resume) | _spoken_terms(candidate_text(transcript))
+
+
+@lru_cache(maxsize=256)
+def jd_profile_for(job_description: str) -> JDProfile:
+    """Compiled profile for ad-hoc JD text; repeated requests (assist ticks) hit the cache."""
+    return compile_jd_profile(job_description)
+
+
+def _heuristic_gap_summary(covered: list[str], gaps: list[str]) -> str:
+    top_gaps = gaps[:6]
+    return (
+        "Heuristic gap summary:\n"
+        + ("Covered (signals in resume/transcript):\n" + "\n".join(f"- {c}" for c in covered[:6]) + "\n\n" if covered else "")
+        + ("Missing/weak coverage:\n" + "\n".join(f"- {g}" for g in top_gaps) if top_gaps else "No major gaps detected.")
+    )
+
+
+def gap_result(profile: JDProfile, coverage: Coverage, narrative_text: str) -> AgentResult:
+    """The gap-analysis ``AgentResult`` for a coverage; shared with callers that merge coverage themselves."""
+    covered, gaps = coverage.covered, coverage.gaps
+    findings = [
+        Finding(
+            category="role_alignment",
+            summary=f"Identified {len(gaps)} requirement areas with weak evidence.",
+            severity="medium" if gaps else "low",
+            evidence=narrative_text,
+        )
+    ]
+    next_questions = [f"Can you walk through your experience with: {g}?" for g in gaps[:6]]
+
+    strengths = [f"Evidence suggests coverage of: {c}" for c in covered[:6]]
+    risks = [f"Weak or missing evidence for: {g}" for g in gaps[:6]]
+
+    return AgentResult(
+        findings=findings,
+        next_questions=next_questions,
+        strengths=strengths,
+        risks=risks,
+        artifacts={
+            "requirements": profile.requirements,
+            "gaps": gaps,
+            "covered": covered,
+            "coverage_scores": coverage.scores,
+            "coverage_score": round(coverage.score, 3),
+            "jd_profile_id": profile.profile_id,
+        },
+    )
 
 
 @dataclass
 class GapAnalysisAgent:
     name: str = "gap-analysis"
+    depends_on: ClassVar[tuple[str, ...] | None] = ("job_description", "resume", "transcript", "jd_profile")
 
     async def run(self, ctx: PanelContext) -> AgentResult:
-        reqs = _extract_requirements(ctx.job_description)
-        corpus = ctx.resume + "\n" + ctx.transcript
-
-        covered: list[str] = []
-        gaps: list[str] = []
-        for r in reqs:
-            if _mentions(corpus, r):
-                covered.append(r)
-            else:
-                gaps.append(r)
+        profile = ctx.jd_profile or jd_profile_for(ctx.job_description)
+        reqs = profile.requirements
+        coverage = profile.coverage(candidate_terms(ctx.resume, ctx.transcript))
+        gaps = coverage.gaps
 
-        llm = get_provider()
+        llm = ctx.llm(self.name)
         if getattr(llm, "name", "") == "heuristic":
-            top_gaps = gaps[:6]
-            narrative_text = (
-                "Heuristic gap summary:\n"
-                + ("Covered (signals in resume/transcript):\n" + "\n".join(f"- {c}" for c in covered[:6]) + "\n\n" if covered else "")
-                + ("Missing/weak coverage:\n" + "\n".join(f"- {g}" for g in top_gaps) if top_gaps else "No major gaps detected.")
-            )
+            narrative_text = _heuristic_gap_summary(coverage.covered, gaps)
         else:
             narrative = await llm.complete(
                 system="You identify gaps between role requirements and demonstrated evidence.",
@@ -91,29 +299,10 @@ class GapAnalysisAgent:
             )
             narrative_text = narrative.text
 
-        findings = [
-            Finding(
-                category="role_alignment",
-                summary=f"Identified {len(gaps)} requirement areas with weak evidence.",
-                severity="medium" if gaps else "low",
-                evidence=narrative_text,
-            )
-        ]
-        next_questions = [f"Can you walk through your experience with: {g}?" for g in gaps[:6]]
-
-        strengths = [f"Evidence suggests coverage of: {c}" for c in covered[:6]]
-        risks = [f"Weak or missing evidence for: {g}" for g in gaps[:6]]
-
-        return AgentResult(
-            findings=findings,
-            next_questions=next_questions,
-            strengths=strengths,
-            risks=risks,
-            artifacts={"requirements": reqs, "gaps": gaps, "covered": covered},
-        )
+        return gap_result(profile, coverage, narrative_text)
 
     async def respond_to_challenge(self, ctx: PanelContext, challenge: str) -> str:
-        llm = get_provider()
+        llm = ctx.llm(self.name)
         resp = await llm.complete(
             system="You justify gap analysis with role requirements and avoid nitpicks.",
             user=f"Challenge: {challenge}\n\nJD:\n{ctx.job_description}\n\nResume:\n{ctx.resume}\n\nTranscript:\n{ctx.transcript}\n",
@@ -2,9 +2,14 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from typing import ClassVar
 
-from ..llm.factory import get_provider
 from .base import AgentResult, Dimension, PanelContext, Vote
+from .transcript_turns import candidate_text
+
+
+# Judges read the documents plus the orchestrator's derived signals, nothing else from config.
+_JUDGE_INPUTS = ("job_description", "resume", "transcript", "config.panelai_signals")
 
 
 def _clamp(value: float, lo: float, hi: float) -> float:
@@ -69,10 +74,12 @@ def _get_signals(ctx: PanelContext) -> dict:
 @dataclass
 class SystemsDesignJudgeAgent:
     name: str = "judge-systems"
+    depends_on: ClassVar[tuple[str, ...] | None] = _JUDGE_INPUTS
 
     async def run(self, ctx: PanelContext) -> AgentResult:
-        depth = _depth_markers(ctx.transcript)
-        uncertainty = _uncertainty_markers(ctx.transcript)
+        spoken = candidate_text(ctx.transcript)
+        depth = _depth_markers(spoken)
+        uncertainty = _uncertainty_markers(spoken)
         adjusted = max(0, depth - 2 * uncertainty)
         score = _score_bucket(adjusted, low=2, high=10)
 
@@ -80,7 +87,7 @@ class SystemsDesignJudgeAgent:
         gaps_count = int(signals.get("gaps_count", 0) or 0)
         coverage_ratio = float(signals.get("coverage_ratio", 0.0) or 0.0)
 
-        llm = get_provider()
+        llm = ctx.llm(self.name)
         if getattr(llm, "name", "") == "heuristic":
             rationale_text = (
                 f"Signals: depth={depth}, uncertainty={uncertainty}. "
@@ -140,7 +147,7 @@ class SystemsDesignJudgeAgent:
 
 
     async def respond_to_challenge(self, ctx: PanelContext, challenge: str) -> str:
-        llm = get_provider()
+        llm = ctx.llm(self.name)
         resp = await llm.complete(
             system="You defend a systems design score by citing transcript evidence and tradeoff reasoning.",
             user=f"Challenge: {challenge}\n\nTranscript:\n{ctx.transcript}",
@@ -151,9 +158,10 @@ class SystemsDesignJudgeAgent:
 @dataclass
 class CodingJudgeAgent:
     name: str = "judge-coding"
+    depends_on: ClassVar[tuple[str, ...] | None] = _JUDGE_INPUTS
 
     async def run(self, ctx: PanelContext) -> AgentResult:
-        t = ctx.transcript.lower()
+        t = candidate_text(ctx.transcript).lower()
         # crude: detect whether they discuss complexity, testing, edge cases
         signals = 0
         present: list[str] = []
@@ -175,7 +183,7 @@ class CodingJudgeAgent:
         contradiction_count = int(meta.get("contradiction_count", 0) or 0)
         weak_claims_count = int(meta.get("weak_claims_count", 0) or 0)
 
-        llm = get_provider()
+        llm = ctx.llm(self.name)
         if getattr(llm, "name", "") == "heuristic":
             rationale_text = (
                 f"Signals: {signals} (complexity/edge-cases/tests/refactor mentions). "
@@ -224,9 +232,10 @@ class CodingJudgeAgent:
 @dataclass
 class HiringManagerAgent:
     name: str = "hiring-manager"
+    depends_on: ClassVar[tuple[str, ...] | None] = _JUDGE_INPUTS
 
     async def run(self, ctx: PanelContext) -> AgentResult:
-        llm = get_provider()
+        llm = ctx.llm(self.name)
         signals = _get_signals(ctx)
         coverage_ratio = float(signals.get("coverage_ratio", 0.0) or 0.0)
         gaps_count = int(signals.get("gaps_count", 0) or 0)
@@ -242,27 +251,35 @@ class HiringManagerAgent:
                 + (f" Top gaps: {gaps_preview}." if gaps_preview else "")
             )
         else:
-            rationale = await llm.complete(
-                system=(
-                    "You are a hiring manager on an interview panel. You care about role fit, scope, ownership, "
-                    "communication clarity, and risk."
-                ),
-                user=(
-                    "Based on the resume and transcript, provide a concise hire recommendation (hire/no-hire/lean). "
-                    "List top strengths and top risks.\n\nJD:\n"
-                    + ctx.job_description
-                    + "\n\nResume:\n"
-                    + ctx.resume
-                    + "\n\nTranscript:\n"
-                    + ctx.transcript
-                ),
+            system = (
+                "You are a hiring manager on an interview panel. You care about role fit, scope, ownership, "
+                "communication clarity, and risk."
+            )
+            user = (
+                "Based on the resume and transcript, provide a concise hire recommendation (hire/no-hire/lean). "
+                "List top strengths and top risks.\n\nJD:\n"
+                + ctx.job_description
+                + "\n\nResume:\n"
+                + ctx.resume
+                + "\n\nTranscript:\n"
+                + ctx.transcript
             )
+            stream = getattr(llm, "stream", None)
+            if ctx.on_event is not None and stream is not None:
+                # The HM summary is the longest completion; stream it so the UI can render it as it arrives.
+                async def _on_delta(delta: str) -> None:
+                    await ctx.emit("token", {"agent": self.name, "delta": delta})
+
+                rationale = await stream(system=system, user=user, on_delta=_on_delta)
+            else:
+                rationale = await llm.complete(system=system, user=user)
             hm_text = rationale.text
 
         # Heuristic vote: combine role coverage + ownership + depth, penalize high discrepancies.
-        t = ctx.transcript.lower()
+        spoken = candidate_text(ctx.transcript)
+        t = spoken.lower()
         ownership = 1 if re.search(r"\b(i\s+owned|i\s+led|i\s+was\s+responsible|i\s+drove|i\s+designed)\b", t) else (1 if re.search(r"\bowned\b|\bled\b|\bdrove\b", t) else 0)
-        depth = 1 if _depth_markers(ctx.transcript) >= 4 else 0
+        depth = 1 if _depth_markers(spoken) >= 4 else 0
         risk = 1 if high_discrepancy_count >= 2 else 0
 
         score = 0.0
@@ -295,7 +312,7 @@ class HiringManagerAgent:
         )
 
     async def respond_to_challenge(self, ctx: PanelContext, challenge: str) -> str:
-        llm = get_provider()
+        llm = ctx.llm(self.name)
         resp = await llm.complete(
             system="You defend your hiring recommendation using concrete evidence.",
             user=f"Challenge: {challenge}\n\nContext:\nJD:\n{ctx.job_description}\n\nResume:\n{ctx.resume}\n\nTranscript:\n{ctx.transcript}",
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import os
+import threading
+from collections import OrderedDict
+from dataclasses import asdict, is_dataclass
+from typing import Any
+
+from .base import AgentResult, PanelAgent, PanelContext
+
+
+def _field(ctx: PanelContext, path: str) -> Any:
+    if path.startswith("config."):
+        return (ctx.config or {}).get(path[len("config.") :])
+    return getattr(ctx, path)
+
+
+def _provider_identity(ctx: PanelContext, role: str) -> str:
+    provider = ctx.llm(role)
+    provider = getattr(provider, "inner", provider)  # unwrap MeteredProvider
+    return f"{type(provider).__name__}:{getattr(provider, 'name', '')}:{getattr(provider, 'model', '')}"
+
+
+def _encode(value: Any) -> str:
+    if is_dataclass(value) and not isinstance(value, type):
+        value = asdict(value)
+    return json.dumps(value, sort_keys=True, default=repr)
+
+
+def memo_key(agent: PanelAgent, ctx: PanelContext) -> str | None:
+    """Hash of exactly the inputs ``agent`` declares, plus the provider serving it."""
+    depends_on = getattr(agent, "depends_on", None)
+    if depends_on is None:
+        return None
+    h = hashlib.sha256()
+    for part in (agent.name, _provider_identity(ctx, agent.name), *depends_on):
+        h.update(part.encode("utf-8", "replace") + b"\x00")
+    for path in depends_on:
+        h.update(_encode(_field(ctx, path)).encode("utf-8", "replace") + b"\x00")
+    return h.hexdigest()
+
+
+class AgentMemo:
+    """In-process LRU of agent results keyed by ``memo_key``.
+
+    A re-evaluation after a transcript fix reuses resume-claims (resume only) and so on; agents
+    with ``depends_on = None`` always run. Hits hand out deep copies so callers can't share state.
+    """
+
+    def __init__(self, max_entries: int = 1024) -> None:
+        self.max_entries = max_entries
+        self._items: OrderedDict[str, AgentResult] = OrderedDict()
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "AgentMemo":
+        return cls(max_entries=int(os.getenv("PANELAI_AGENT_MEMO_SIZE", "1024") or 0))
+
+    def get(self, key: str) -> AgentResult | None:
+        with self._lock:
+            hit = self._items.get(key)
+            if hit is None:
+                return None
+            self._items.move_to_end(key)
+        return copy.deepcopy(hit)
+
+    def put(self, key: str, result: AgentResult) -> None:
+        if self.max_entries <= 0:
+            return
+        stored = copy.deepcopy(result)
+        with self._lock:
+            self._items[key] = stored
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+
+    async def run(self, agent: PanelAgent, ctx: PanelContext) -> tuple[AgentResult, bool]:
+        """``agent.run(ctx)`` or a cached result for identical inputs; returns (result, was_hit)."""
+        key = memo_key(agent, ctx) if (ctx.config or {}).get("memo", True) else None
+        if key is not None and (hit := self.get(key)) is not None:
+            return hit, True
+        result = await agent.run(ctx)
+        if key is not None:
+            self.put(key, result)
+        return result, False
+
+
+_MEMO: AgentMemo | None = None
+
+
+def get_memo() -> AgentMemo:
+    global _MEMO
+    if _MEMO is None:
+        _MEMO = AgentMemo.from_env()
+    return _MEMO
@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+from dataclasses import dataclass
+from typing import ClassVar
+
+from ..near_dup import enabled, get_index
+from .base import AgentResult, Finding, PanelContext
+from .resume_claims import _extract_resume_claims
+from .transcript_evidence import _chunk_transcript_spans
+
+
+def _owner(ctx: PanelContext) -> str:
+    """Who the indexed content belongs to; a candidate's own earlier content never counts as a match.
+
+    The candidate label is the identity when the caller gives one, so an edited resume still
+    belongs to the same person. Without a label the resume itself is: re-evaluating the same
+    resume must not match itself. The index is already partitioned by tenant.
+    """
+    key = "label:" + " ".join(ctx.candidate.split()).casefold() if ctx.candidate.strip() else ctx.resume.strip()
+    return hashlib.sha256(key.encode("utf-8", "replace")).hexdigest()[:24]
+
+
+@dataclass
+class NearDuplicateAgent:
+    """Flags resume bullets and answers that closely match other candidates' (opt-in).
+
+    Per-candidate agents can't see copy-pasted bullets or rehearsed answers; this one checks
+    each claim and candidate answer against a persistent MinHash/LSH index of prior evaluations,
+    then adds this candidate's content to it.
+    """
+
+    name: str = "near-duplicates"
+    # Reads and writes the cross-candidate index: never memoized.
+    depends_on: ClassVar[tuple[str, ...] | None] = None
+
+    async def run(self, ctx: PanelContext) -> AgentResult:
+        if not enabled(ctx.config or {}):
+            return AgentResult(artifacts={"enabled": False})
+
+        claims = _extract_resume_claims(ctx.resume)
+        answers = _chunk_transcript_spans(ctx.transcript)
+        spans = {text: span for text, span in answers}
+        owner = _owner(ctx)
+        docs = [("claim", c) for c in claims] + [("answer", text) for text, _ in answers]
+        dups = await asyncio.to_thread(get_index().check_and_add, tenant=ctx.tenant, owner=owner, docs=docs)
+
+        findings = [
+            Finding(
+                category="near_duplicate_content",
+                summary=f"{'Resume claim' if d.kind == 'claim' else 'Answer'} closely matches another candidate's {d.match_kind}.",
+                severity="high" if d.similarity >= 0.9 else "medium",
+                claim=d.text if d.kind == "claim" else None,
+                # This candidate's own text, which the span points at; the match is referenced by id.
+                evidence=d.text,
+                explanation=(
+                    f"~{d.similarity:.0%} similar to content previously seen from a different candidate "
+                    f"(near-duplicate index entry {d.match_id}). "
+                    "Copied resume bullets or rehearsed answers are worth probing for first-hand detail."
+                ),
+                evidence_span=spans.get(d.text) if d.kind == "answer" else None,
+            )
+            for d in dups[:8]
+        ]
+        return AgentResult(findings=findings, artifacts={"enabled": True, "indexed": len(docs), "matches": len(dups)})
+
+    async def respond_to_challenge(self, ctx: PanelContext, challenge: str) -> str:
+        return "Near-duplicate flags are similarity measurements against prior candidates, not judgments."
@@ -2,43 +2,49 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from typing import ClassVar
 
-from ..llm.factory import get_provider
 from .base import AgentResult, Finding, PanelAgent, PanelContext
 
 
+_CLAIM_VERB = re.compile(r"\b(built|designed|led|owned|implemented|scaled|migrated|optimized|architected)\b", re.I)
+_YEARS = re.compile(r"\b\d+\+?\s*(years|yrs)\b", re.I)
+_SPACES = re.compile(r"\s+")
+MAX_CLAIMS = 40
+
+
 def _extract_resume_claims(resume: str) -> list[str]:
-    lines = [ln.strip() for ln in resume.splitlines() if ln.strip()]
-    claims: list[str] = []
-    for ln in lines:
-        if ln.startswith(("-", "•", "*")):
-            claims.append(ln.lstrip("-*• ").strip())
-            continue
-        if re.search(r"\b(built|designed|led|owned|implemented|scaled|migrated|optimized|architected)\b", ln, re.I):
-            claims.append(ln)
-            continue
-        if re.search(r"\b\d+\+?\s*(years|yrs)\b", ln, re.I):
-            claims.append(ln)
-            continue
-    # de-dup, preserve order
+    """First ``MAX_CLAIMS`` distinct claims, in order. Stops reading once it has them."""
     seen: set[str] = set()
     out: list[str] = []
-    for c in claims:
-        c2 = re.sub(r"\s+", " ", c).strip()
-        if c2 and c2 not in seen:
-            out.append(c2)
-            seen.add(c2)
-    return out[:40]
+    for raw in resume.splitlines():
+        ln = raw.strip()
+        if not ln:
+            continue
+        if ln.startswith(("-", "•", "*")):
+            claim = ln.lstrip("-*• ").strip()
+        elif _CLAIM_VERB.search(ln) or _YEARS.search(ln):
+            claim = ln
+        else:
+            continue
+        claim = _SPACES.sub(" ", claim).strip()
+        if claim and claim not in seen:
+            out.append(claim)
+            seen.add(claim)
+            if len(out) >= MAX_CLAIMS:
+                break
+    return out
 
 
 @dataclass
 class ResumeClaimsAgent:
     name: str = "resume-claims"
+    depends_on: ClassVar[tuple[str, ...] | None] = ("resume",)
 
     async def run(self, ctx: PanelContext) -> AgentResult:
         claims = _extract_resume_claims(ctx.resume)
 
-        llm = get_provider()
+        llm = ctx.llm(self.name)
         if getattr(llm, "name", "") == "heuristic":
             synthesis_text = "\n".join(f"{i+1}. {c}" for i, c in enumerate(claims))
         else:
@@ -64,7 +70,7 @@ class ResumeClaimsAgent:
         return AgentResult(findings=findings, artifacts={"claims": claims, "claims_normalized": synthesis_text})
 
     async def respond_to_challenge(self, ctx: PanelContext, challenge: str) -> str:
-        llm = get_provider()
+        llm = ctx.llm(self.name)
         resp = await llm.complete(
             system="You defend/clarify what counts as a resume claim and how it should be tested.",
             user=f"Challenge: {challenge}\n\nResume:\n{ctx.resume}\n",
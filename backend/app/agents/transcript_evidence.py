@@ -2,9 +2,10 @@ from __future__ import annotations
 
 import re
 from dataclasses import dataclass
+from typing import ClassVar
 
-from ..llm.factory import get_provider
-from .base import AgentResult, Finding, PanelContext
+from .base import AgentResult, Finding, PanelContext, Span
+from .transcript_turns import Turn, transcript_index
 
 
 def _heuristic_transcript_summary(transcript: str) -> str:
@@ -34,19 +35,86 @@ def _heuristic_transcript_summary(transcript: str) -> str:
     return "Heuristic summary (evidence-oriented):\n" + "\n".join(f"- {b}" for b in bullets)
 
 
+# A single turn longer than this (a pasted wall of text, a multi-megabyte line) is split into
+# pieces, so no chunk -- and no evidence snippet scored against every claim -- grows with the input.
+_MAX_CHUNK_CHARS = 2000
+
+
+def _split_long_turn(transcript: str, turn: Turn) -> list[tuple[str, Span]]:
+    """``turn`` cut at spaces into pieces of at most ``_MAX_CHUNK_CHARS``, each with its span.
+
+    Turn text joins continuation lines with a space, so piece offsets are found by locating each
+    word in the transcript after the previous one: every character is scanned once.
+    """
+    out: list[tuple[str, Span]] = []
+    text = turn.text
+    cursor = turn.start
+    pos = 0
+    while pos < len(text):
+        end = min(len(text), pos + _MAX_CHUNK_CHARS)
+        if end < len(text):
+            cut = text.rfind(" ", pos + 1, end)
+            end = cut if cut > pos else end
+        piece = text[pos:end].strip()
+        pos = end
+        if not piece:
+            continue
+        if transcript.startswith(piece, cursor):
+            start, cursor = cursor, cursor + len(piece)
+        else:
+            start = -1
+            for word in piece.split(" "):
+                if not word:
+                    continue
+                at = transcript.find(word, cursor, turn.end)
+                if at < 0:
+                    break
+                start = at if start < 0 else start
+                cursor = at + len(word)
+            start = max(start, turn.start)
+        out.append((piece, Span(doc="transcript", start=start, end=cursor, turn=turn.index)))
+        # Skip the whitespace (or line break) between this piece and the next.
+        while cursor < turn.end and transcript[cursor].isspace():
+            cursor += 1
+    return out
+
+
+def _chunk_transcript_spans(transcript: str) -> list[tuple[str, Span]]:
+    """Chunks of candidate speech with their location in the original transcript.
+
+    Consecutive candidate turns are packed up to ~360 chars; a chunk never spans an
+    interviewer turn, so its span covers candidate text only. Linear in the transcript length.
+    """
+    chunks: list[tuple[str, Span]] = []
+    buf: list[Turn] = []
+    size = 0  # len(" ".join(t.text for t in buf))
+
+    def _flush() -> None:
+        nonlocal size
+        if buf:
+            span = Span(doc="transcript", start=buf[0].start, end=buf[-1].end, turn=buf[0].index)
+            chunks.append((" ".join(t.text for t in buf), span))
+            buf.clear()
+            size = 0
+
+    for turn in transcript_index(transcript).candidate_turns:
+        if buf and turn.index != buf[-1].index + 1:
+            _flush()
+        if len(turn.text) > _MAX_CHUNK_CHARS:
+            _flush()
+            chunks.extend(_split_long_turn(transcript, turn))
+            continue
+        size += len(turn.text) + (1 if buf else 0)
+        buf.append(turn)
+        if size > 360:
+            _flush()
+    _flush()
+    return chunks
+
+
 def _chunk_transcript(transcript: str) -> list[str]:
     # Split into short chunks for evidence retrieval.
-    lines = [ln.strip() for ln in transcript.splitlines() if ln.strip()]
-    chunks: list[str] = []
-    buf: list[str] = []
-    for ln in lines:
-        buf.append(ln)
-        if len(" ".join(buf)) > 360:
-            chunks.append(" ".join(buf))
-            buf = []
-    if buf:
-        chunks.append(" ".join(buf))
-    return chunks
+    return [text for text, _ in _chunk_transcript_spans(transcript)]
 
 
 def _tokenize(text: str) -> set[str]:
@@ -77,11 +145,19 @@ def _tokenize(text: str) -> set[str]:
     return {w for w in words if w not in stop and (len(w) >= 3 or w in short_ok)}
 
 
-def _best_evidence(claim: str, chunks: list[str]) -> tuple[str, float]:
+def _best_evidence_index(
+    claim: str, chunks: list[str], chunk_tokens: list[set[str]] | None = None
+) -> tuple[int, float]:
+    """Index of the best supporting chunk (-1 if none) and its score.
+
+    ``chunk_tokens`` (``_tokenize`` of each chunk) lets callers scoring many claims tokenize once.
+    """
     c = _tokenize(claim)
-    best = ("", 0.0)
-    for ch in chunks:
-        t = _tokenize(ch)
+    best = (-1, 0.0)
+    if not c:
+        return best
+    for i, ch in enumerate(chunks):
+        t = chunk_tokens[i] if chunk_tokens is not None else _tokenize(ch)
         if not c or not t:
             continue
         overlap = len(c & t)
@@ -92,20 +168,28 @@ def _best_evidence(claim: str, chunks: list[str]) -> tuple[str, float]:
         if claim.strip() and claim.strip().lower() in ch.lower():
             score = max(score, 0.85)
         if score > best[1]:
-            best = (ch, score)
+            best = (i, score)
     return best
 
 
+def _best_evidence(claim: str, chunks: list[str]) -> tuple[str, float]:
+    idx, score = _best_evidence_index(claim, chunks)
+    return (chunks[idx] if idx >= 0 else "", score)
+
+
 @dataclass
 class TranscriptEvidenceAgent:
     name: str = "transcript-evidence"
+    depends_on: ClassVar[tuple[str, ...] | None] = ("transcript",)
 
     async def run(self, ctx: PanelContext) -> AgentResult:
-        llm = get_provider()
-        chunks = _chunk_transcript(ctx.transcript)
+        llm = ctx.llm(self.name)
+        spans = _chunk_transcript_spans(ctx.transcript)
+        chunks = [text for text, _ in spans]
+        index = transcript_index(ctx.transcript)
 
         if getattr(llm, "name", "") == "heuristic":
-            summary_text = _heuristic_transcript_summary(ctx.transcript)
+            summary_text = _heuristic_transcript_summary(index.candidate_text)
         else:
             summary = await llm.complete(
                 system="You summarize interview transcripts for a technical interview panel.",
@@ -125,11 +209,17 @@ class TranscriptEvidenceAgent:
                     evidence=summary_text,
                 )
             ],
-            artifacts={"chunks": chunks, "summary": summary_text},
+            artifacts={
+                "chunks": chunks,
+                "chunk_spans": [span for _, span in spans],
+                "turns_count": len(index.turns),
+                "candidate_turns_count": len(index.candidate_turns),
+                "summary": summary_text,
+            },
         )
 
     async def respond_to_challenge(self, ctx: PanelContext, challenge: str) -> str:
-        llm = get_provider()
+        llm = ctx.llm(self.name)
         resp = await llm.complete(
             system="You cite transcript evidence precisely and avoid overclaiming.",
             user=f"Challenge: {challenge}\n\nTranscript:\n{ctx.transcript}\n",
@@ -138,4 +228,10 @@ class TranscriptEvidenceAgent:
 
 
 # Export helpers for orchestrator
-__all__ = ["_chunk_transcript", "_best_evidence", "TranscriptEvidenceAgent"]
+__all__ = [
+    "_chunk_transcript",
+    "_chunk_transcript_spans",
+    "_best_evidence",
+    "_best_evidence_index",
+    "TranscriptEvidenceAgent",
+]
@@ -0,0 +1,258 @@
+from __future__ import annotations
+
+import re
+import threading
+from collections import Counter, OrderedDict
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Literal
+
+
+Role = Literal["candidate", "interviewer", "unknown"]
+
+# "[00:12:03] Interviewer: ...", "12:03 - Alex Kim: ...", "Q: ...", or plain text.
+_TIMESTAMP = re.compile(r"[ \t]*[\[(]?(\d{1,2}:\d{2}(?::\d{2})?(?:\.\d+)?)[\])]?[ \t]*(?:[-–—][ \t]*)?")
+_SPEAKER = re.compile(r"[ \t]*([A-Za-z][A-Za-z0-9._'-]*(?:[ \t][A-Za-z0-9._'-]+){0,3})[ \t]*:(?:[ \t]+|$)")
+
+# Markdown headings, e.g. the "## Round 2 (Sam)" line each dossier round starts with.
+_HEADING = re.compile(r"[ \t]*#{1,6}[ \t]")
+
+_INTERVIEWER_LABELS = {"interviewer", "q", "question", "panel", "panelist", "recruiter", "hiring manager", "hm", "host"}
+_CANDIDATE_LABELS = {"candidate", "a", "answer", "applicant", "interviewee"}
+_KNOWN_LABELS = _INTERVIEWER_LABELS | _CANDIDATE_LABELS
+
+
+def _label(speaker: str) -> str:
+    return re.sub(r"[\s\d._-]+$", "", speaker.strip().lower())
+
+
+@dataclass(frozen=True)
+class Turn:
+    index: int
+    speaker: str | None
+    text: str
+    start: int  # offset of the turn's first content character in the transcript
+    end: int  # offset just past its last content character
+    timestamp: str | None = None
+    role: Role = "unknown"
+    line_start: int = 0  # offset of the line the turn begins on (its label, when it has one)
+
+
+@dataclass(frozen=True)
+class TranscriptIndex:
+    """Speaker turns of a transcript with character offsets and inferred roles.
+
+    Unlabelled lines continue the previous speaker's turn. Transcripts without any speaker
+    labels are treated as one turn per line, all attributed to the candidate. ``speakers`` holds
+    every label accepted so far, which later lines (and incremental re-parses) check against.
+    """
+
+    transcript: str
+    turns: tuple[Turn, ...] = field(default_factory=tuple)
+    speakers: frozenset[str] = frozenset()
+
+    @cached_property
+    def has_speakers(self) -> bool:
+        return any(t.speaker for t in self.turns)
+
+    @cached_property
+    def candidate_turns(self) -> tuple[Turn, ...]:
+        return tuple(t for t in self.turns if t.role == "candidate")
+
+    @cached_property
+    def candidate_text(self) -> str:
+        return "\n".join(t.text for t in self.candidate_turns)
+
+
+def _is_speaker(speaker: str, *, own_line: bool, timestamped: bool, speakers: set[str], roles_seen: bool) -> bool:
+    if _label(speaker) in _KNOWN_LABELS or speaker in speakers:
+        return True
+    if not speaker[0].isupper():
+        return False
+    # A new name starts a turn when the label stands on its own (complete) line or after a
+    # timestamp, or while no role label has been seen (named speakers only). Otherwise
+    # "Note: I led..." in the middle of an answer would be taken for a speaker and cut out of the
+    # candidate's text.
+    return own_line or timestamped or not roles_seen
+
+
+def _parse_turns(transcript: str, *, offset: int = 0, first_index: int = 0, speakers: set[str] | None = None) -> list[Turn]:
+    """Turns of ``transcript[offset:]``; ``speakers`` (updated in place) are the labels accepted before it."""
+    speakers = set() if speakers is None else speakers
+    roles_seen = any(_label(sp) in _KNOWN_LABELS for sp in speakers)
+    # Raw turns before role assignment: [speaker, timestamp, parts, start, end, line_start]
+    raw: list[list] = []
+    labelled = bool(speakers)
+    pos = offset
+    for line in transcript[offset:].splitlines(keepends=True):
+        line_start = pos
+        pos += len(line)
+        body = line.rstrip("\r\n")
+        if not body or body.isspace():
+            continue  # blank: neither a new turn nor a continuation
+        at = 0
+        ts_match = _TIMESTAMP.match(body)
+        ts = ts_match.group(1) if ts_match else None
+        if ts_match:
+            at = ts_match.end()
+        sp_match = _SPEAKER.match(body, at)
+        speaker = sp_match.group(1).strip() if sp_match else None
+        if speaker and _is_speaker(
+            speaker,
+            # Only a terminated line: "Note:" at the end of a live transcript may still get its text.
+            own_line=len(body) < len(line) and not body[sp_match.end():].strip(),
+            timestamped=ts is not None,
+            speakers=speakers,
+            roles_seen=roles_seen,
+        ):
+            at = sp_match.end()
+            if speaker not in speakers:
+                speakers.add(speaker)
+                roles_seen = roles_seen or _label(speaker) in _KNOWN_LABELS
+        else:
+            speaker = None
+        rest = body[at:]
+        content = rest.strip()
+        start = line_start + at + (len(rest) - len(rest.lstrip()))
+        end = start + len(content)
+        if speaker:
+            labelled = True
+            raw.append([speaker, ts, [content] if content else [], start, end, line_start])
+        elif not content:
+            continue
+        elif labelled and _HEADING.match(body):
+            # A section heading between labelled turns is nobody's speech: a turn of its own.
+            raw.append([None, ts, [content], start, end, line_start])
+        elif labelled and raw:
+            # Continuation of the previous speaker's turn.
+            if not raw[-1][2]:
+                raw[-1][3] = start
+            raw[-1][2].append(content)
+            raw[-1][4] = end
+        else:
+            raw.append([None, ts, [content], start, end, line_start])
+    return [
+        Turn(first_index + i, sp, " ".join(parts), start, end, ts, "unknown", line)
+        for i, (sp, ts, parts, start, end, line) in enumerate(raw)
+    ]
+
+
+def _assign_roles(turns: list[Turn]) -> list[Turn]:
+    speakers = {t.speaker for t in turns if t.speaker}
+    if not speakers:
+        return [Turn(t.index, t.speaker, t.text, t.start, t.end, t.timestamp, "candidate", t.line_start) for t in turns]
+
+    roles: dict[str, Role] = {}
+    for sp in sorted(speakers):
+        label = _label(sp)
+        roles[sp] = "interviewer" if label in _INTERVIEWER_LABELS else "candidate" if label in _CANDIDATE_LABELS else "unknown"
+    unknown = [sp for sp, r in roles.items() if r == "unknown"]
+    if unknown:
+        known = set(roles.values()) - {"unknown"}
+        if len(known) == 1:
+            other: Role = "candidate" if known == {"interviewer"} else "interviewer"
+            for sp in unknown:
+                roles[sp] = other
+        elif not known:
+            # Named speakers only: whoever asks the most questions is interviewing.
+            totals = Counter(t.speaker for t in turns if t.speaker)
+            questions = Counter(t.speaker for t in turns if t.speaker and t.text.rstrip().endswith("?"))
+            asker = max(unknown, key=lambda sp: questions[sp] / max(1, totals[sp]))
+            for sp in unknown:
+                roles[sp] = "interviewer" if sp == asker and len(unknown) > 1 else "candidate"
+        # Both roles already labelled: other named speakers stay "unknown".
+    # Positional construction: ``dataclasses.replace`` per turn dominates on transcripts with many short turns.
+    return [
+        Turn(t.index, t.speaker, t.text, t.start, t.end, t.timestamp, roles.get(t.speaker or "", "unknown"), t.line_start)
+        for t in turns
+    ]
+
+
+def parse_transcript(transcript: str, *, previous: TranscriptIndex | None = None) -> TranscriptIndex:
+    """Parse ``transcript`` into turns; reuses ``previous`` when the new text only appends to it."""
+    if previous is not None and previous.turns and transcript.startswith(previous.transcript):
+        # Live append: turns before the last one are final; re-parse from the line the last turn
+        # starts on (its label), with the speakers accepted so far.
+        last = previous.turns[-1]
+        speakers = set(previous.speakers)
+        tail = _parse_turns(transcript, offset=last.line_start, first_index=last.index, speakers=speakers)
+        turns = list(previous.turns[:-1]) + tail
+    else:
+        speakers = set()
+        turns = _parse_turns(transcript, speakers=speakers)
+    return TranscriptIndex(transcript=transcript, turns=tuple(_assign_roles(turns)), speakers=frozenset(speakers))
+
+
+_RECENT: OrderedDict[str, TranscriptIndex] = OrderedDict()
+_RECENT_MAX = 64
+# Turn objects cost several times their text; bound the cache by text size too so a few huge
+# transcripts can't hold on to hundreds of megabytes.
+_RECENT_MAX_CHARS = 2_000_000
+_RECENT_LOCK = threading.Lock()
+_recent_chars = 0
+
+
+def _remember(index: TranscriptIndex) -> None:
+    # Caller holds _RECENT_LOCK.
+    global _recent_chars
+    if index.transcript not in _RECENT:
+        _recent_chars += len(index.transcript)
+    _RECENT[index.transcript] = index
+    _RECENT.move_to_end(index.transcript)
+    while len(_RECENT) > 1 and (len(_RECENT) > _RECENT_MAX or _recent_chars > _RECENT_MAX_CHARS):
+        old, _ = _RECENT.popitem(last=False)
+        _recent_chars -= len(old)
+
+
+def transcript_index(transcript: str) -> TranscriptIndex:
+    """Cached parse shared by every agent looking at the same transcript."""
+    with _RECENT_LOCK:
+        hit = _RECENT.get(transcript)
+        if hit is not None:
+            _RECENT.move_to_end(transcript)
+            return hit
+        base = next(
+            (ix for ix in reversed(_RECENT.values()) if ix.transcript and transcript.startswith(ix.transcript)),
+            None,
+        )
+    index = parse_transcript(transcript, previous=base)
+    with _RECENT_LOCK:
+        _remember(index)
+    return index
+
+
+def prime_transcript_index(index: TranscriptIndex) -> None:
+    """Make an index parsed elsewhere (see ``TranscriptBuilder``) the cached parse of its transcript."""
+    with _RECENT_LOCK:
+        _remember(index)
+
+
+class TranscriptBuilder:
+    """Parse a transcript while it arrives in pieces (e.g. an upload read in chunks).
+
+    Complete lines are parsed as they come in, reusing the previous parse, so ``finish()`` only
+    handles the tail. The result equals ``transcript_index(text.strip())`` and is cached as such.
+    """
+
+    def __init__(self) -> None:
+        self._text = ""
+        self._index: TranscriptIndex | None = None
+
+    def feed(self, piece: str) -> None:
+        if not self._text:
+            piece = piece.lstrip()
+        self._text += piece
+        cut = self._text.rfind("\n", len(self._text) - len(piece))
+        if cut > 0:
+            self._index = parse_transcript(self._text[:cut].rstrip(), previous=self._index)
+
+    def finish(self) -> str:
+        text = self._text.rstrip()
+        if text:
+            prime_transcript_index(parse_transcript(text, previous=self._index))
+        return text
+
+
+def candidate_text(transcript: str) -> str:
+    """Only what the candidate said (the whole transcript when there are no speaker labels)."""
+    return transcript_index(transcript).candidate_text
@@ -2,12 +2,18 @@ from __future__ import annotations
 
 import asyncio
 import re
+from dataclasses import replace
 from typing import Any
 
-from .agents.base import PanelContext
+from .agents.base import AgentResult, PanelContext
 from .agents.contradictions import ContradictionHunterAgent
 from .agents.gap_analysis import GapAnalysisAgent
-from .agents.transcript_evidence import TranscriptEvidenceAgent, _best_evidence
+from .agents.memo import get_memo
+from .agents.transcript_evidence import TranscriptEvidenceAgent, _best_evidence_index, _tokenize
+from .delta import assign_ids, discrepancy_key, followup_key
+from .evidence import apply_evidence_mode, chunk_span, evidence_mode, to_evidence_span
+from .limits import cap_inputs
+from .llm.usage import get_tenant_budgets, new_ledger
 from .models import AssistResult, Discrepancy, FollowUp
 
 
@@ -22,7 +28,7 @@ def _extract_gap_from_question(q: str) -> str:
     return q.strip()
 
 
-async def run_assist(*, ctx: PanelContext) -> AssistResult:
+async def run_assist(*, ctx: PanelContext, analysis: dict[str, AgentResult] | None = None) -> AssistResult:
     """Assist-mode analysis for live interviews.
 
     Runs lightweight agents only:
@@ -30,19 +36,31 @@ async def run_assist(*, ctx: PanelContext) -> AssistResult:
     - GapAnalysisAgent: requirements coverage + follow-up questions
     - ContradictionHunterAgent: uncertainty / contradictions
 
-    Returns live discrepancies + follow-ups with evidence snippets.
+    Returns live discrepancies + follow-ups with evidence snippets. When ``analysis`` is given it
+    receives each agent's ``AgentResult`` by name, so a session can later be finalized with
+    ``run_panel(seed=...)`` without re-running them.
     """
 
+    ctx, truncated = cap_inputs(ctx)
+    if ctx.usage is None:
+        ctx = replace(ctx, usage=new_ledger(config=ctx.config or {}, tenant=ctx.tenant))
+    ctx = replace(ctx, stage="assist")
+
     te = TranscriptEvidenceAgent()
     ga = GapAnalysisAgent()
     ch = ContradictionHunterAgent()
 
-    te_res, ga_res, ch_res = await asyncio.gather(te.run(ctx), ga.run(ctx), ch.run(ctx))
+    memo = get_memo()
+    (te_res, _), (ga_res, _), (ch_res, _) = await asyncio.gather(memo.run(te, ctx), memo.run(ga, ctx), memo.run(ch, ctx))
+    if analysis is not None:
+        analysis.update({te.name: te_res, ga.name: ga_res, ch.name: ch_res})
 
     chunks = te_res.artifacts.get("chunks", [])
     if not isinstance(chunks, list):
         chunks = []
     chunks = [str(x) for x in chunks]
+    chunk_tokens = [_tokenize(ch) for ch in chunks]
+    chunk_spans = te_res.artifacts.get("chunk_spans", [])
 
     discrepancies: list[Discrepancy] = []
 
@@ -55,6 +73,7 @@ async def run_assist(*, ctx: PanelContext) -> AssistResult:
                 claim=f.claim or "(unspecified)",
                 evidence=f.evidence or "",
                 explanation=f.explanation or f.summary,
+                evidence_span=to_evidence_span(f.evidence_span),
             )
         )
 
@@ -62,8 +81,9 @@ async def run_assist(*, ctx: PanelContext) -> AssistResult:
     gaps = ga_res.artifacts.get("gaps", [])
     if isinstance(gaps, list):
         for g in [str(x) for x in gaps[:10]]:
-            ev, score = _best_evidence(g, chunks) if chunks else ("", 0.0)
-            evidence = ev if score >= 0.20 and ev else "(no supporting transcript snippet yet)"
+            idx, score = _best_evidence_index(g, chunks, chunk_tokens) if chunks else (-1, 0.0)
+            supported = score >= 0.20 and idx >= 0
+            evidence = chunks[idx] if supported else "(no supporting transcript snippet yet)"
             discrepancies.append(
                 Discrepancy(
                     severity="medium",
@@ -74,6 +94,7 @@ async def run_assist(*, ctx: PanelContext) -> AssistResult:
                         "Job requirement has weak or missing evidence so far in the live transcript. "
                         "This is a prompt for targeted follow-up questions."
                     ),
+                    evidence_span=chunk_span(chunk_spans, idx) if supported else None,
                 )
             )
 
@@ -83,13 +104,15 @@ async def run_assist(*, ctx: PanelContext) -> AssistResult:
     for q in ga_res.next_questions[:8]:
         q2 = str(q)
         gap = _extract_gap_from_question(q2)
-        ev, score = _best_evidence(gap, chunks) if chunks else ("", 0.0)
+        idx, score = _best_evidence_index(gap, chunks, chunk_tokens) if chunks else (-1, 0.0)
+        supported = score >= 0.25 and idx >= 0
         followups.append(
             FollowUp(
                 question=q2,
                 reason="Weak or missing coverage of a job requirement so far.",
-                evidence=(ev if score >= 0.25 else ""),
+                evidence=(chunks[idx] if supported else ""),
                 evidence_score=float(score),
+                evidence_span=chunk_span(chunk_spans, idx) if supported else None,
             )
         )
         if len(followups) >= 5:
@@ -110,6 +133,7 @@ async def run_assist(*, ctx: PanelContext) -> AssistResult:
                     reason="Clarifies a potential contradiction or uncertainty signal.",
                     evidence=str(f.evidence or ""),
                     evidence_score=1.0,
+                    evidence_span=to_evidence_span(f.evidence_span),
                 )
             )
 
@@ -123,14 +147,23 @@ async def run_assist(*, ctx: PanelContext) -> AssistResult:
         "chunks_count": len(chunks),
         "gap_count": len(gaps) if isinstance(gaps, list) else 0,
         "contradiction_findings": len(ch_res.findings),
+        "usage": ctx.usage.summary(),
     }
+    if truncated:
+        artifacts["truncated"] = truncated
+    get_tenant_budgets().charge(ctx.tenant, ctx.usage.total.total_tokens)
 
     # Sort discrepancies for UI (high -> medium -> low)
     discrepancies = sorted(discrepancies, key=lambda d: _severity_rank(d.severity))[:20]
 
+    ev_mode = evidence_mode(ctx.config)
+    discrepancies = assign_ids(discrepancies, discrepancy_key)
+    followups = assign_ids(followups[:5], followup_key)
+    apply_evidence_mode([*discrepancies, *followups], ev_mode)
+
     return AssistResult(
         discrepancies=discrepancies,
-        followups=followups[:5],
+        followups=followups,
         risks=risks[:6],
         artifacts=artifacts,
     )
@@ -0,0 +1,200 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import hmac
+import json
+import os
+import random
+import threading
+import time
+from pathlib import Path
+from typing import Any, Literal
+
+from starlette.datastructures import Headers
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from .storage import data_dir
+
+CaptureMode = Literal["off", "redact", "hash", "full"]
+
+CAPTURED_PATHS = ("/evaluate", "/evaluate/stream", "/assist", "/assist/delta")
+TEXT_FIELDS = ("job_description", "resume", "transcript")
+# Requests sent by the replay tool carry this header, set to PANELAI_REPLAY_TOKEN, and are not
+# captured again. Without a configured token the header is ignored: any client could send it.
+REPLAY_HEADER = "x-panelai-replay"
+
+
+def capture_mode() -> CaptureMode:
+    value = (os.getenv("PANELAI_CAPTURE") or "off").strip().lower()
+    return value if value in ("redact", "hash", "full") else "off"  # type: ignore[return-value]
+
+
+def _digest(value: str) -> str:
+    return hashlib.sha256(value.encode("utf-8", "replace")).hexdigest()[:16]
+
+
+def capture_record(
+    *,
+    mode: CaptureMode,
+    endpoint: str,
+    tenant: str,
+    body: dict[str, Any],
+    ts: float,
+    status: int,
+    latency_ms: float,
+    ttfb_ms: float,
+) -> dict[str, Any]:
+    """One log line. Sizes and config are always kept; text is kept (``full``), hashed (``hash``) or dropped."""
+    texts = {f: str(body.get(f) or "") for f in TEXT_FIELDS}
+    record: dict[str, Any] = {
+        "ts": round(ts, 3),
+        "endpoint": endpoint,
+        "status": status,
+        "latency_ms": round(latency_ms, 2),
+        "ttfb_ms": round(ttfb_ms, 2),
+        "mode": mode,
+        "tenant": tenant if mode == "full" else _digest(tenant),
+        "sizes": {f: len(t) for f, t in texts.items()},
+        "config": body.get("config") if isinstance(body.get("config"), dict) else {},
+        "jd_profile_id": body.get("jd_profile_id"),
+        "session_id": body.get("session_id") if mode == "full" or not body.get("session_id") else _digest(str(body["session_id"])),
+        "transcript_version": body.get("transcript_version"),
+    }
+    if endpoint == "/assist/delta":
+        record["since"] = bool(body.get("since"))
+    if mode == "full":
+        record["texts"] = texts
+    elif mode == "hash":
+        record["hashes"] = {f: _digest(t) for f, t in texts.items() if t}
+    return record
+
+
+class CaptureLog:
+    """Append-only JSONL log of captured requests (``PANELAI_CAPTURE_PATH``).
+
+    When the file passes ``max_bytes`` it is renamed to ``<path>.1`` (replacing any previous one)
+    and a new log is started.
+    """
+
+    def __init__(self, path: Path, *, max_bytes: int = 256 * 1024 * 1024) -> None:
+        self.path = path
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "CaptureLog":
+        return cls(
+            Path(os.getenv("PANELAI_CAPTURE_PATH") or data_dir() / "capture.jsonl"),
+            max_bytes=int(os.getenv("PANELAI_CAPTURE_MAX_BYTES") or 256 * 1024 * 1024),
+        )
+
+    def append(self, record: dict[str, Any]) -> None:
+        line = (json.dumps(record, separators=(",", ":"), default=str) + "\n").encode("utf-8")
+        with self._lock:
+            try:
+                if self.max_bytes > 0 and self.path.stat().st_size + len(line) > self.max_bytes:
+                    self.path.replace(self.path.with_name(self.path.name + ".1"))
+            except FileNotFoundError:
+                pass
+            # O_APPEND: lines from several worker processes don't interleave mid-line.
+            fd = os.open(self.path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o600)
+            try:
+                os.write(fd, line)
+            finally:
+                os.close(fd)
+
+
+class CaptureMiddleware:
+    """Opt-in capture of ``/evaluate`` and ``/assist`` traffic (``PANELAI_CAPTURE``).
+
+    The JSON body is buffered as it is read by the route. Once the response has been sent, the
+    request is logged with its status, time to first byte and total latency (the whole stream for
+    ``/evaluate/stream``). ``PANELAI_CAPTURE_SAMPLE`` (0..1) captures a fraction of requests.
+    """
+
+    def __init__(
+        self,
+        app: ASGIApp,
+        *,
+        mode: CaptureMode,
+        log: CaptureLog | None = None,
+        sample: float = 1.0,
+        replay_token: str = "",
+    ) -> None:
+        self.app = app
+        self.mode = mode
+        self.log = log if log is not None or mode == "off" else CaptureLog.from_env()
+        self.sample = sample
+        self.replay_token = replay_token
+
+    @classmethod
+    def options_from_env(cls) -> dict[str, Any]:
+        return {
+            "mode": capture_mode(),
+            "sample": float(os.getenv("PANELAI_CAPTURE_SAMPLE") or 1.0),
+            "replay_token": (os.getenv("PANELAI_REPLAY_TOKEN") or "").strip(),
+        }
+
+    def _is_replay(self, headers: Headers) -> bool:
+        token = headers.get(REPLAY_HEADER)
+        return bool(self.replay_token and token) and hmac.compare_digest(token.encode(), self.replay_token.encode())
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if (
+            self.mode == "off"
+            or scope["type"] != "http"
+            or scope["method"] != "POST"
+            or scope["path"] not in CAPTURED_PATHS
+            or (self.sample < 1.0 and random.random() >= self.sample)
+        ):
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        if self._is_replay(headers):
+            await self.app(scope, receive, send)
+            return
+
+        ts, t0 = time.time(), time.perf_counter()
+        chunks: list[bytes] = []
+        status = 500
+        ttfb = 0.0
+
+        async def _receive() -> Message:
+            message = await receive()
+            if message["type"] == "http.request":
+                chunks.append(message.get("body", b""))
+            return message
+
+        async def _send(message: Message) -> None:
+            nonlocal status, ttfb
+            if message["type"] == "http.response.start":
+                status = message["status"]
+                ttfb = time.perf_counter() - t0
+            await send(message)
+
+        try:
+            await self.app(scope, _receive, _send)
+        finally:
+            latency = time.perf_counter() - t0
+            try:
+                body = json.loads(b"".join(chunks) or b"{}")
+            except ValueError:
+                body = {}
+            if isinstance(body, dict) and self.log is not None:
+                tenant = (headers.get("x-tenant-id") or "default").strip() or "default"
+                record = capture_record(
+                    mode=self.mode,
+                    endpoint=scope["path"],
+                    tenant=tenant,
+                    body=body,
+                    ts=ts,
+                    status=status,
+                    latency_ms=latency * 1000,
+                    ttfb_ms=ttfb * 1000,
+                )
+                try:
+                    # Off the loop: rotation and a slow disk must not stall other requests.
+                    await asyncio.to_thread(self.log.append, record)
+                except OSError:
+                    pass  # capture must never fail the request it observes
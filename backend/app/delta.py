@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from typing import Callable, Sequence, TypeVar
+
+from .models import AssistDelta, AssistResult, Discrepancy, FollowUp
+
+
+T = TypeVar("T", Discrepancy, FollowUp)
+
+
+def _digest(*parts: str) -> str:
+    return hashlib.sha1("\x00".join(parts).encode("utf-8", "replace")).hexdigest()[:12]
+
+
+def discrepancy_key(d: Discrepancy) -> tuple[str, ...]:
+    return (d.category, d.claim)
+
+
+def followup_key(f: FollowUp) -> tuple[str, ...]:
+    return (f.question,)
+
+
+def assign_ids(items: Sequence[T], key: Callable[[T], tuple[str, ...]]) -> list[T]:
+    """Give each item an id derived from its identity (not its evidence), stable across ticks.
+
+    Repeated identities get an occurrence suffix so ids stay unique within one response.
+    """
+    seen: dict[str, int] = {}
+    for item in items:
+        base = _digest(*key(item))
+        n = seen.get(base, 0)
+        seen[base] = n + 1
+        item.id = base if n == 0 else f"{base}-{n}"
+    return list(items)
+
+
+def assist_etag(result: AssistResult) -> str:
+    # Artifacts (counters, token usage) are excluded: they change every tick without changing what the UI shows.
+    payload = result.model_dump_json(include={"discrepancies", "followups", "risks"})
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:20]
+
+
+def _diff(base: list[T], current: list[T]) -> tuple[list[T], list[T], list[str]]:
+    before = {item.id: item for item in base}
+    now_ids = {item.id for item in current}
+    added = [item for item in current if item.id not in before]
+    changed = [item for item in current if item.id in before and item != before[item.id]]
+    removed = [item.id for item in base if item.id not in now_ids]
+    return added, changed, removed
+
+
+def diff_assist(current: AssistResult, *, etag: str, base: AssistResult | None, base_etag: str | None) -> AssistDelta:
+    """Delta of ``current`` against ``base``; with no usable base, everything is reported as added."""
+    full = base is None
+    base = base or AssistResult(discrepancies=[], followups=[])
+    d_added, d_changed, d_removed = _diff(base.discrepancies, current.discrepancies)
+    f_added, f_changed, f_removed = _diff(base.followups, current.followups)
+    return AssistDelta(
+        etag=etag,
+        base_etag=None if full else base_etag,
+        full=full,
+        discrepancies_added=d_added,
+        discrepancies_changed=d_changed,
+        discrepancies_removed=d_removed,
+        discrepancy_order=[d.id for d in current.discrepancies],
+        followups_added=f_added,
+        followups_changed=f_changed,
+        followups_removed=f_removed,
+        followup_order=[f.id for f in current.followups],
+        risks=current.risks if full or current.risks != base.risks else None,
+        artifacts=current.artifacts,
+    )
+
+
+class AssistSnapshots:
+    """Bounded LRU of recent assist results, used as delta bases.
+
+    Keyed by (tenant, session id, ETag): a client only ever gets a delta against a result it was
+    served for that session, never against another tenant's or session's result that happens to
+    share the ETag.
+    """
+
+    def __init__(self, max_entries: int = 2048) -> None:
+        self.max_entries = max_entries
+        self._items: OrderedDict[tuple[str, str, str], AssistResult] = OrderedDict()
+
+    def get(self, tenant: str, session_id: str | None, etag: str | None) -> AssistResult | None:
+        key = (tenant, session_id or "", etag or "")
+        if not etag or key not in self._items:
+            return None
+        self._items.move_to_end(key)
+        return self._items[key]
+
+    def put(self, tenant: str, session_id: str | None, etag: str, result: AssistResult) -> None:
+        key = (tenant, session_id or "", etag)
+        self._items[key] = result
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_entries:
+            self._items.popitem(last=False)
@@ -0,0 +1,214 @@
+from __future__ import annotations
+
+import asyncio
+from bisect import bisect_right
+from dataclasses import dataclass, replace
+from typing import Any
+
+from .agents.base import AgentResult, Finding, PanelContext, Span
+from .agents.contradictions import ContradictionHunterAgent
+from .agents.gap_analysis import Coverage, GapAnalysisAgent, _heuristic_gap_summary, candidate_terms, gap_result, jd_profile_for
+from .agents.memo import get_memo
+from .agents.transcript_evidence import TranscriptEvidenceAgent
+from .agents.transcript_turns import TranscriptIndex, transcript_index
+from .limits import cap_inputs, cap_text, get_input_limits
+from .llm.usage import new_ledger
+from .models import EvaluationResult
+from .orchestrator import run_panel
+
+
+@dataclass(frozen=True)
+class InterviewRound:
+    label: str
+    interviewer: str
+    transcript: str
+
+    @property
+    def heading(self) -> str:
+        return f"## {self.label} ({self.interviewer})" if self.interviewer else f"## {self.label}"
+
+
+def combine_transcripts(rounds: list[InterviewRound]) -> tuple[str, list[int]]:
+    """The dossier's transcript (each round under its heading) and where each round's text starts in it."""
+    parts: list[str] = []
+    offsets: list[int] = []
+    pos = 0
+    for r in rounds:
+        head = r.heading + "\n"
+        offsets.append(pos + len(head))
+        part = head + r.transcript.rstrip("\n") + "\n\n"
+        parts.append(part)
+        pos += len(part)
+    return "".join(parts), offsets
+
+
+def _cap_rounds(rounds: list[InterviewRound], limit: int) -> tuple[list[InterviewRound], list[dict[str, Any]]]:
+    """Rounds cut so the combined transcript stays within the transcript cap (split evenly)."""
+    if limit <= 0:
+        return rounds, []
+    share = limit // len(rounds)
+    out: list[InterviewRound] = []
+    report: list[dict[str, Any]] = []
+    for r in rounds:
+        # Heading line plus the blank line after the round.
+        round_limit = max(1, share - len(r.heading) - 3)
+        text = cap_text(r.transcript, round_limit)
+        if text is not r.transcript:
+            report.append({"round": r.label, "chars": len(r.transcript), "kept": len(text), "limit": round_limit})
+            r = replace(r, transcript=text)
+        out.append(r)
+    return out, report
+
+
+class _Shifter:
+    """Moves a round's spans into the combined transcript.
+
+    Turn indexes come from the combined transcript's own parse rather than per-round counts: the
+    round headings and speakers carried over from earlier rounds change where its turns split.
+    """
+
+    def __init__(self, index: TranscriptIndex) -> None:
+        self.turns = index.turns
+        self.starts = [t.start for t in index.turns]
+
+    def __call__(self, span: Span | None, offset: int) -> Span | None:
+        if span is None:
+            return None
+        start = span.start + offset
+        turn = None
+        if span.turn is not None and self.turns:
+            turn = self.turns[max(0, bisect_right(self.starts, start) - 1)].index
+        return replace(span, start=start, end=span.end + offset, turn=turn)
+
+
+async def _analyze_round(ctx: PanelContext, r: InterviewRound) -> tuple[dict[str, AgentResult], bool]:
+    # Each round is analyzed on its own transcript, so the memo serves every round seen before.
+    round_ctx = replace(ctx, transcript=r.transcript, stage="analysis")
+    memo = get_memo()
+    agents = (TranscriptEvidenceAgent(), GapAnalysisAgent(), ContradictionHunterAgent())
+    runs = await asyncio.gather(*[memo.run(a, round_ctx) for a in agents])
+    return {a.name: res for a, (res, _) in zip(agents, runs)}, all(hit for _, hit in runs)
+
+
+def _merge_evidence(
+    rounds: list[InterviewRound], per_round: list[dict[str, AgentResult]], offsets: list[int], shift: _Shifter
+) -> AgentResult:
+    chunks: list[str] = []
+    spans: list[Span | None] = []
+    summaries: list[str] = []
+    for r, results, offset in zip(rounds, per_round, offsets):
+        art = results["transcript-evidence"].artifacts
+        chunks += art.get("chunks", [])
+        spans += [shift(s, offset) for s in art.get("chunk_spans", [])]
+        summaries.append(f"{r.heading}\n{art.get('summary', '')}")
+    summary = "\n\n".join(summaries)
+    return AgentResult(
+        findings=[
+            Finding(
+                category="transcript_summary",
+                summary=f"Transcripts of {len(rounds)} rounds condensed into evidence-oriented summaries.",
+                severity="low",
+                evidence=summary,
+            )
+        ],
+        artifacts={
+            "chunks": chunks,
+            "chunk_spans": spans,
+            "turns_count": len(shift.turns),
+            "candidate_turns_count": sum(1 for t in shift.turns if t.role == "candidate"),
+            "summary": summary,
+        },
+    )
+
+
+def _merge_gaps(ctx: PanelContext, rounds: list[InterviewRound], per_round: list[dict[str, AgentResult]]) -> AgentResult:
+    # Coverage is over everything the candidate said in any round, so a requirement whose terms
+    # came up across two rounds is covered; term sets are cached per transcript.
+    profile = ctx.jd_profile or jd_profile_for(ctx.job_description)
+    terms = frozenset().union(*[candidate_terms(ctx.resume, r.transcript) for r in rounds])
+    coverage: Coverage = profile.coverage(terms)
+    if getattr(ctx.llm("gap-analysis"), "name", "") == "heuristic":
+        narrative = _heuristic_gap_summary(coverage.covered, coverage.gaps)
+    else:
+        narrative = "\n\n".join(
+            f"{r.heading}\n{results['gap-analysis'].findings[0].evidence or ''}" for r, results in zip(rounds, per_round)
+        )
+    return gap_result(profile, coverage, narrative)
+
+
+def _merge_contradictions(
+    rounds: list[InterviewRound], per_round: list[dict[str, AgentResult]], offsets: list[int], shift: _Shifter
+) -> AgentResult:
+    findings: list[Finding] = []
+    skill_chunks: dict[str, list[int]] = {}
+    skills: list[str] = []
+    chunk_base = 0
+    for r, results, offset in zip(rounds, per_round, offsets):
+        res = results["contradiction-hunter"]
+        for f in res.findings:
+            explanation = f"{r.label}: {f.explanation}" if f.explanation else None
+            findings.append(replace(f, evidence_span=shift(f.evidence_span, offset), explanation=explanation))
+        # Per-round chunk indexes, re-based onto the merged "chunks" of _merge_evidence.
+        for skill, idxs in res.artifacts.get("skill_chunks", {}).items():
+            skill_chunks.setdefault(skill, []).extend(i + chunk_base for i in idxs)
+        skills = res.artifacts.get("skills_detected", skills)
+        chunk_base += len(results["transcript-evidence"].artifacts.get("chunks", []))
+    return AgentResult(findings=findings, artifacts={"skills_detected": skills, "skill_chunks": skill_chunks})
+
+
+def _round_signals(
+    rounds: list[InterviewRound], per_round: list[dict[str, AgentResult]], offsets: list[int], cached: list[bool]
+) -> list[dict[str, Any]]:
+    out: list[dict[str, Any]] = []
+    seen: set[str] = set()
+    for r, results, offset, was_cached in zip(rounds, per_round, offsets, cached):
+        gap_art = results["gap-analysis"].artifacts
+        covered = list(gap_art.get("covered", []))
+        out.append(
+            {
+                "round": r.label,
+                "interviewer": r.interviewer,
+                "offset": offset,
+                "length": len(r.transcript.rstrip("\n")),
+                "coverage_score": gap_art.get("coverage_score", 0.0),
+                "covered_count": len(covered),
+                "newly_covered": [c for c in covered if c not in seen],
+                "contradiction_count": len(results["contradiction-hunter"].findings),
+                "candidate_turns": results["transcript-evidence"].artifacts.get("candidate_turns_count", 0),
+                "cached": was_cached,
+            }
+        )
+        seen.update(covered)
+    return out
+
+
+async def run_dossier(*, ctx: PanelContext, rounds: list[InterviewRound]) -> EvaluationResult:
+    """Evaluate a candidate across several interview rounds.
+
+    Transcript evidence, gap analysis and contradictions run per round (and are reused from the
+    agent memo for rounds already analyzed), are merged, and seed one panel over all rounds.
+    Spans point into the combined transcript; ``artifacts.rounds`` gives each round's offset.
+    """
+    limits = get_input_limits()
+    rounds, rounds_truncated = _cap_rounds(rounds, limits.transcript)
+    combined, offsets = combine_transcripts(rounds)
+    ctx, truncated = cap_inputs(replace(ctx, transcript=combined), limits)
+    if rounds_truncated:
+        truncated["rounds"] = rounds_truncated
+    if ctx.usage is None:
+        ctx = replace(ctx, usage=new_ledger(config=ctx.config or {}, tenant=ctx.tenant))
+    analyzed = await asyncio.gather(*[_analyze_round(ctx, r) for r in rounds])
+    per_round = [results for results, _ in analyzed]
+
+    # The panel parses the combined transcript anyway; this puts it in the shared cache first.
+    shift = _Shifter(transcript_index(ctx.transcript))
+    seed = {
+        "transcript-evidence": _merge_evidence(rounds, per_round, offsets, shift),
+        "gap-analysis": _merge_gaps(ctx, rounds, per_round),
+        "contradiction-hunter": _merge_contradictions(rounds, per_round, offsets, shift),
+    }
+    result = await run_panel(ctx=ctx, seed=seed)
+    if truncated:
+        result.artifacts["truncated"] = {**result.artifacts.get("truncated", {}), **truncated}
+    result.artifacts["rounds"] = _round_signals(rounds, per_round, offsets, [was_cached for _, was_cached in analyzed])
+    return result
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import sqlite3
+import time
+import uuid
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+from .models import EvaluationResult
+from .storage import connect, data_dir
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS evaluations (
+    rowid INTEGER PRIMARY KEY,
+    id TEXT NOT NULL UNIQUE,
+    tenant TEXT NOT NULL,
+    label TEXT NOT NULL DEFAULT '',
+    verdict TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    discrepancy_count INTEGER NOT NULL,
+    high_count INTEGER NOT NULL,
+    coverage_ratio REAL NOT NULL,
+    job_description TEXT NOT NULL,
+    resume TEXT NOT NULL,
+    transcript TEXT NOT NULL,
+    config TEXT NOT NULL,
+    result TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS evaluations_recent ON evaluations(tenant, created_at);
+CREATE INDEX IF NOT EXISTS evaluations_verdict ON evaluations(tenant, verdict, created_at);
+CREATE TABLE IF NOT EXISTS evaluation_categories (
+    eval_rowid INTEGER NOT NULL,
+    category TEXT NOT NULL,
+    PRIMARY KEY (category, eval_rowid)
+) WITHOUT ROWID;
+CREATE VIRTUAL TABLE IF NOT EXISTS evaluations_fts USING fts5(
+    label, job_description, resume, transcript, reasoning, gaps, discrepancies,
+    content='', tokenize='unicode61'
+);
+"""
+
+_TERM = re.compile(r"\w[\w+#.-]*", re.UNICODE)
+
+
+def _fts_query(text: str) -> str | None:
+    # Each word becomes a quoted prefix term, ANDed: user input never reaches FTS5 syntax.
+    terms = [t.replace('"', "") for t in _TERM.findall(text)]
+    return " ".join(f'"{t}"*' for t in terms if t) or None
+
+
+def should_store(config: dict[str, Any]) -> bool:
+    """Evaluations are kept unless the request says ``config.store: false`` or PANELAI_STORE_EVALUATIONS=0."""
+    if (os.getenv("PANELAI_STORE_EVALUATIONS") or "1").strip().lower() in {"0", "false", "no"}:
+        return False
+    return bool(config.get("store", True))
+
+
+class EvaluationStore:
+    """Panel results plus their inputs, searchable by verdict, discrepancy category, gap and text.
+
+    Structured filters use ordinary indexes; free text and gaps go through an FTS5 index, so
+    lookups stay in milliseconds at tens of thousands of evaluations. Blocking; async callers use
+    ``asyncio.to_thread``.
+    """
+
+    def __init__(self, path: Path | str | None = None) -> None:
+        self.path = Path(path or os.getenv("PANELAI_EVAL_DB") or data_dir() / "evaluations.sqlite3")
+        with closing(connect(self.path)) as conn:
+            conn.executescript(_SCHEMA)
+
+    def save(
+        self,
+        result: EvaluationResult,
+        *,
+        tenant: str,
+        job_description: str,
+        resume: str,
+        transcript: str,
+        config: dict[str, Any],
+        label: str = "",
+    ) -> str:
+        eval_id = uuid.uuid4().hex
+        signals = result.artifacts.get("signals", {})
+        gaps = result.artifacts.get("gaps", signals.get("top_gaps", []))
+        gap_text = "\n".join(str(g) for g in gaps) if isinstance(gaps, list) else ""
+        disc_text = "\n".join(f"{d.category}: {d.claim}" for d in result.discrepancies)
+        with closing(connect(self.path)) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                cur = conn.execute(
+                    "INSERT INTO evaluations (id, tenant, label, verdict, created_at, discrepancy_count, high_count, "
+                    "coverage_ratio, job_description, resume, transcript, config, result) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        eval_id,
+                        tenant,
+                        label,
+                        result.verdict,
+                        time.time(),
+                        len(result.discrepancies),
+                        sum(1 for d in result.discrepancies if d.severity == "high"),
+                        float(signals.get("coverage_ratio", 0.0)),
+                        job_description,
+                        resume,
+                        transcript,
+                        json.dumps(config, default=str),
+                        result.model_dump_json(),
+                    ),
+                )
+                rowid = cur.lastrowid
+                conn.execute(
+                    "INSERT INTO evaluations_fts (rowid, label, job_description, resume, transcript, reasoning, gaps, "
+                    "discrepancies) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    (rowid, label, job_description, resume, transcript, result.overall_reasoning, gap_text, disc_text),
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO evaluation_categories (eval_rowid, category) VALUES (?, ?)",
+                    [(rowid, c) for c in {d.category for d in result.discrepancies}],
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return eval_id
+
+    def get(self, tenant: str, eval_id: str) -> sqlite3.Row | None:
+        with closing(connect(self.path)) as conn:
+            return conn.execute("SELECT * FROM evaluations WHERE id = ? AND tenant = ?", (eval_id, tenant)).fetchone()
+
+    def search(
+        self,
+        *,
+        tenant: str,
+        q: str | None = None,
+        verdict: str | None = None,
+        gap: str | None = None,
+        category: str | None = None,
+        limit: int = 20,
+        offset: int = 0,
+    ) -> list[sqlite3.Row]:
+        """Newest first; all given filters must match."""
+        where = ["e.tenant = ?"]
+        args: list[Any] = [tenant]
+        if verdict:
+            where.append("e.verdict = ?")
+            args.append(verdict)
+        if category:
+            where.append("e.rowid IN (SELECT eval_rowid FROM evaluation_categories WHERE category = ?)")
+            args.append(category)
+        text, gap_terms = _fts_query(q or ""), _fts_query(gap or "")
+        match = ([f"({text})"] if text else []) + ([f"gaps : ({gap_terms})"] if gap_terms else [])
+        if match:
+            where.append("e.rowid IN (SELECT rowid FROM evaluations_fts WHERE evaluations_fts MATCH ?)")
+            args.append(" AND ".join(match))
+        sql = (
+            "SELECT e.id, e.label, e.verdict, e.created_at, e.discrepancy_count, e.high_count, e.coverage_ratio "
+            "FROM evaluations e "
+            f"WHERE {' AND '.join(where)} ORDER BY e.created_at DESC LIMIT ? OFFSET ?"
+        )
+        with closing(connect(self.path)) as conn:
+            return conn.execute(sql, (*args, limit, offset)).fetchall()
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import Any, Iterable, Literal
+
+from .agents.base import Span
+from .models import Discrepancy, EvidenceSpan, FollowUp
+
+
+EvidenceMode = Literal["text", "span", "both"]
+
+
+def evidence_mode(config: dict[str, Any]) -> EvidenceMode:
+    """``config.evidence_mode``: ``both`` (default), ``span`` (offsets only) or ``text`` (snippets only)."""
+    mode = str((config or {}).get("evidence_mode") or "both").strip().lower()
+    return mode if mode in ("text", "span", "both") else "both"  # type: ignore[return-value]
+
+
+def to_evidence_span(span: Span | None) -> EvidenceSpan | None:
+    return EvidenceSpan(**asdict(span)) if span is not None else None
+
+
+def chunk_span(spans: Any, index: int) -> EvidenceSpan | None:
+    if index < 0 or not isinstance(spans, list) or index >= len(spans):
+        return None
+    span = spans[index]
+    return to_evidence_span(span) if isinstance(span, Span) else None
+
+
+def apply_evidence_mode(items: Iterable[Discrepancy | FollowUp], mode: EvidenceMode) -> None:
+    """Drop whichever evidence representation the client did not ask for (in place)."""
+    for item in items:
+        if mode == "span" and item.evidence_span is not None:
+            item.evidence = ""
+        elif mode == "text":
+            item.evidence_span = None
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import closing
+from pathlib import Path
+
+from .agents.gap_analysis import JDProfile, compile_jd_profile
+from .storage import connect, data_dir
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jd_profiles (
+    id TEXT PRIMARY KEY,
+    tenant TEXT NOT NULL,
+    title TEXT NOT NULL DEFAULT '',
+    job_description TEXT NOT NULL,
+    requirements TEXT NOT NULL,
+    created_at REAL NOT NULL
+);
+"""
+
+
+def profile_id(tenant: str, job_description: str) -> str:
+    # Content-addressed per tenant: registering the same JD twice yields the same id.
+    normalized = re.sub(r"\s+", " ", job_description).strip()
+    return hashlib.sha256(f"{tenant}\x00{normalized}".encode("utf-8", "replace")).hexdigest()[:16]
+
+
+class JDProfileStore:
+    """Registered job descriptions, persisted in SQLite with compiled profiles cached in memory.
+
+    Requirements are stored as extracted at registration time, so a profile keeps matching the
+    same way for every candidate evaluated against it. Blocking; async callers use ``to_thread``.
+    """
+
+    def __init__(self, path: Path | str | None = None, *, cache_size: int = 256) -> None:
+        self.path = Path(path or os.getenv("PANELAI_JD_PROFILE_DB") or data_dir() / "jd_profiles.sqlite3")
+        self.cache_size = cache_size
+        self._cache: OrderedDict[tuple[str, str], tuple[JDProfile, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        with closing(connect(self.path)) as conn:
+            conn.executescript(_SCHEMA)
+
+    def _remember(self, tenant: str, profile: JDProfile, created_at: float) -> None:
+        key = (tenant, profile.profile_id or "")
+        with self._lock:
+            self._cache[key] = (profile, created_at)
+            self._cache.move_to_end(key)
+            while len(self._cache) > self.cache_size:
+                self._cache.popitem(last=False)
+
+    def register(self, *, tenant: str, job_description: str, title: str = "") -> tuple[JDProfile, float, bool]:
+        """Compile and store a JD; returns (profile, created_at, created)."""
+        pid = profile_id(tenant, job_description)
+        existing = self.get(tenant, pid)
+        if existing is not None:
+            return existing[0], existing[1], False
+        profile = compile_jd_profile(job_description, profile_id=pid, title=title)
+        created_at = time.time()
+        with closing(connect(self.path)) as conn:
+            conn.execute(
+                "INSERT OR IGNORE INTO jd_profiles (id, tenant, title, job_description, requirements, created_at) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                (pid, tenant, title, job_description, json.dumps(profile.requirements), created_at),
+            )
+        self._remember(tenant, profile, created_at)
+        return profile, created_at, True
+
+    def get(self, tenant: str, pid: str) -> tuple[JDProfile, float] | None:
+        with self._lock:
+            hit = self._cache.get((tenant, pid))
+            if hit is not None:
+                self._cache.move_to_end((tenant, pid))
+                return hit
+        with closing(connect(self.path)) as conn:
+            row = conn.execute("SELECT * FROM jd_profiles WHERE id = ? AND tenant = ?", (pid, tenant)).fetchone()
+        if row is None:
+            return None
+        profile = compile_jd_profile(
+            row["job_description"], requirements=json.loads(row["requirements"]), profile_id=pid, title=row["title"]
+        )
+        self._remember(tenant, profile, row["created_at"])
+        return profile, row["created_at"]
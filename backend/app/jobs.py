@@ -0,0 +1,293 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sqlite3
+import time
+import uuid
+from contextlib import closing
+from pathlib import Path
+from typing import Any
+
+from .admission import AdmissionController
+from .agents.base import PanelContext
+from .evaluations import EvaluationStore, should_store
+from .jd_profiles import JDProfileStore
+from .llm.registry import ProviderRegistry
+from .models import EvaluateRequest, JobStatus
+from .orchestrator import run_panel
+from .storage import connect, data_dir
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id TEXT PRIMARY KEY,
+    idempotency_key TEXT UNIQUE,
+    tenant TEXT NOT NULL,
+    status TEXT NOT NULL,
+    request TEXT NOT NULL,
+    result TEXT,
+    error TEXT,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    created_at REAL NOT NULL,
+    started_at REAL,
+    finished_at REAL,
+    lease_until REAL
+);
+CREATE INDEX IF NOT EXISTS jobs_claim ON jobs(status, created_at);
+CREATE INDEX IF NOT EXISTS jobs_finished ON jobs(finished_at);
+"""
+
+
+def _env_float(name: str, default: float) -> float:
+    try:
+        return float(os.getenv(name, "") or default)
+    except ValueError:
+        return default
+
+
+class JobStore:
+    """Durable evaluation queue + result store in a single SQLite file.
+
+    All methods are blocking; async callers go through ``asyncio.to_thread``.
+    """
+
+    def __init__(self, path: Path | str | None = None, *, lease_s: float = 600.0, max_attempts: int = 3) -> None:
+        self.path = Path(path or os.getenv("PANELAI_JOB_DB") or data_dir() / "jobs.sqlite3")
+        self.lease_s = lease_s
+        self.max_attempts = max_attempts
+        with closing(connect(self.path)) as conn:
+            conn.executescript(_SCHEMA)
+
+    def submit(self, *, request: dict[str, Any], tenant: str, idempotency_key: str | None = None) -> tuple[JobStatus, bool]:
+        """Enqueue a job; a repeated idempotency key returns the existing job instead."""
+        key = f"{tenant}:{idempotency_key}" if idempotency_key else None
+        job_id = uuid.uuid4().hex
+        with closing(connect(self.path)) as conn:
+            cur = conn.execute(
+                "INSERT OR IGNORE INTO jobs (id, idempotency_key, tenant, status, request, created_at) "
+                "VALUES (?, ?, ?, 'queued', ?, ?)",
+                (job_id, key, tenant, json.dumps(request), time.time()),
+            )
+            created = cur.rowcount == 1
+            if created:
+                row = conn.execute("SELECT * FROM jobs WHERE id = ?", (job_id,)).fetchone()
+            else:
+                row = conn.execute("SELECT * FROM jobs WHERE idempotency_key = ?", (key,)).fetchone()
+        return job_status(row), created
+
+    def get(self, tenant: str, job_id: str) -> sqlite3.Row | None:
+        with closing(connect(self.path)) as conn:
+            return conn.execute("SELECT * FROM jobs WHERE id = ? AND tenant = ?", (job_id, tenant)).fetchone()
+
+    def claim(self) -> sqlite3.Row | None:
+        """Atomically lease the oldest runnable job (queued, or running with an expired lease)."""
+        now = time.time()
+        with closing(connect(self.path)) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                # Jobs whose worker died too many times are failed rather than retried forever.
+                conn.execute(
+                    "UPDATE jobs SET status = 'failed', error = 'worker lease expired too many times', finished_at = ? "
+                    "WHERE status = 'running' AND lease_until < ? AND attempts >= ?",
+                    (now, now, self.max_attempts),
+                )
+                row = conn.execute(
+                    "SELECT id FROM jobs WHERE status = 'queued' OR (status = 'running' AND lease_until < ?) "
+                    "ORDER BY created_at LIMIT 1",
+                    (now,),
+                ).fetchone()
+                if row is None:
+                    conn.execute("COMMIT")
+                    return None
+                conn.execute(
+                    "UPDATE jobs SET status = 'running', attempts = attempts + 1, started_at = ?, lease_until = ? "
+                    "WHERE id = ?",
+                    (now, now + self.lease_s, row["id"]),
+                )
+                claimed = conn.execute("SELECT * FROM jobs WHERE id = ?", (row["id"],)).fetchone()
+                conn.execute("COMMIT")
+                return claimed
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+
+    def renew(self, job_id: str, attempt: int) -> bool:
+        """Extend the lease of a running job; False once that attempt no longer holds it."""
+        with closing(connect(self.path)) as conn:
+            cur = conn.execute(
+                "UPDATE jobs SET lease_until = ? WHERE id = ? AND status = 'running' AND attempts = ?",
+                (time.time() + self.lease_s, job_id, attempt),
+            )
+            return cur.rowcount == 1
+
+    def finish(self, job_id: str, attempt: int, *, result: str | None = None, error: str | None = None) -> None:
+        # Only the attempt holding the lease may finish the job; a stale worker's outcome is dropped.
+        with closing(connect(self.path)) as conn:
+            conn.execute(
+                "UPDATE jobs SET status = ?, result = ?, error = ?, finished_at = ?, lease_until = NULL "
+                "WHERE id = ? AND status = 'running' AND attempts = ?",
+                ("failed" if error is not None else "succeeded", result, error, time.time(), job_id, attempt),
+            )
+
+    def release(self, job_id: str, attempt: int) -> None:
+        with closing(connect(self.path)) as conn:
+            conn.execute(
+                "UPDATE jobs SET status = 'queued', lease_until = NULL WHERE id = ? AND status = 'running' AND attempts = ?",
+                (job_id, attempt),
+            )
+
+    def purge(self, *, retention_s: float) -> int:
+        with closing(connect(self.path)) as conn:
+            cur = conn.execute("DELETE FROM jobs WHERE finished_at IS NOT NULL AND finished_at < ?", (time.time() - retention_s,))
+            return cur.rowcount
+
+
+def job_status(row: sqlite3.Row) -> JobStatus:
+    return JobStatus(
+        job_id=row["id"],
+        status=row["status"],
+        attempts=row["attempts"],
+        created_at=row["created_at"],
+        started_at=row["started_at"],
+        finished_at=row["finished_at"],
+        error=row["error"],
+    )
+
+
+class JobWorkerPool:
+    """N asyncio workers pulling jobs from a JobStore and running the full panel."""
+
+    def __init__(
+        self,
+        store: JobStore,
+        *,
+        workers: int,
+        providers: ProviderRegistry | None = None,
+        admission: AdmissionController | None = None,
+        profiles: JDProfileStore | None = None,
+        evaluations: EvaluationStore | None = None,
+    ) -> None:
+        self.store = store
+        self.workers = workers
+        self.providers = providers
+        self.admission = admission
+        self.profiles = profiles
+        self.evaluations = evaluations
+        self.poll_s = _env_float("PANELAI_JOB_POLL_S", 0.5)
+        self.retention_s = _env_float("PANELAI_JOB_RETENTION_S", 7 * 86400)
+        self._tasks: list[asyncio.Task[None]] = []
+
+    def start(self) -> None:
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self.workers)]
+        if self._tasks:
+            self._tasks.append(asyncio.create_task(self._janitor()))
+
+    async def stop(self) -> None:
+        for t in self._tasks:
+            t.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    async def _worker(self) -> None:
+        while True:
+            row = await asyncio.to_thread(self.store.claim)
+            if row is None:
+                await asyncio.sleep(self.poll_s)
+                continue
+            await self.run_one(row)
+
+    async def _heartbeat(self, job_id: str, attempt: int) -> None:
+        # The lease covers the wait for a batch slot too, which can outlast it under load; keep
+        # renewing so the job isn't handed to a second worker while this one still has it.
+        while True:
+            await asyncio.sleep(self.store.lease_s / 3)
+            if not await asyncio.to_thread(self.store.renew, job_id, attempt):
+                return
+
+    async def run_one(self, row: sqlite3.Row) -> None:
+        job_id, attempt = row["id"], row["attempts"]
+        heartbeat = asyncio.create_task(self._heartbeat(job_id, attempt))
+        try:
+            await self._run(row)
+        finally:
+            heartbeat.cancel()
+
+    async def _run(self, row: sqlite3.Row) -> None:
+        job_id, attempt = row["id"], row["attempts"]
+        try:
+            req = EvaluateRequest.model_validate_json(row["request"])
+            profile = None
+            if req.jd_profile_id:
+                profiles = self.profiles or JDProfileStore()
+                hit = await asyncio.to_thread(profiles.get, row["tenant"], req.jd_profile_id)
+                if hit is None:
+                    raise LookupError(f"Unknown jd_profile_id {req.jd_profile_id}")
+                profile = hit[0]
+            ctx = PanelContext(
+                job_description=profile.job_description if profile else req.job_description,
+                resume=req.resume,
+                transcript=req.transcript,
+                config=req.config or {},
+                providers=self.providers,
+                tenant=row["tenant"],
+                candidate=req.label,
+                jd_profile=profile,
+            )
+            if self.admission is None:
+                result = await run_panel(ctx=ctx)
+            else:
+                # Jobs queue behind live/interactive traffic instead of being rejected.
+                async with self.admission.slot("batch", ctx.tenant, bounded=False):
+                    result = await run_panel(ctx=ctx)
+            if self.evaluations is not None and should_store(ctx.config):
+                result.artifacts["evaluation_id"] = await asyncio.to_thread(
+                    self.evaluations.save,
+                    result,
+                    tenant=ctx.tenant,
+                    job_description=ctx.job_description,
+                    resume=ctx.resume,
+                    transcript=ctx.transcript,
+                    config=ctx.config,
+                    label=req.label,
+                )
+        except asyncio.CancelledError:
+            # Shutting down mid-job: hand it back to the queue for the next worker. Off the loop
+            # like every other store call, and shielded so a second cancel can't skip it.
+            await asyncio.shield(asyncio.to_thread(self.store.release, job_id, attempt))
+            raise
+        except Exception as exc:
+            await asyncio.to_thread(self.store.finish, job_id, attempt, error=repr(exc))
+            return
+        await asyncio.to_thread(self.store.finish, job_id, attempt, result=result.model_dump_json())
+
+    async def _janitor(self) -> None:
+        while True:
+            await asyncio.to_thread(self.store.purge, retention_s=self.retention_s)
+            await asyncio.sleep(min(3600.0, max(60.0, self.retention_s / 10)))
+
+
+async def _serve(workers: int) -> None:
+    from .llm.registry import init_registry
+
+    providers = init_registry()
+    pool = JobWorkerPool(
+        JobStore(), workers=workers, providers=providers, profiles=JDProfileStore(), evaluations=EvaluationStore()
+    )
+    pool.start()
+    try:
+        await asyncio.Event().wait()
+    finally:
+        await pool.stop()
+        await providers.aclose()
+
+
+if __name__ == "__main__":
+    # Standalone worker process: python -m app.jobs [workers]
+    import sys
+
+    from dotenv import load_dotenv
+
+    load_dotenv(Path(__file__).resolve().parents[2] / ".env", override=True)
+    asyncio.run(_serve(int(sys.argv[1]) if len(sys.argv) > 1 else 2))
@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, replace
+from typing import Any
+
+from .agents.base import PanelContext
+
+FIELDS = ("job_description", "resume", "transcript")
+
+
+@dataclass(frozen=True)
+class InputLimits:
+    """Per-field character caps applied before any agent sees the inputs (0 disables a cap).
+
+    With the caps in place every text path is linear in its (capped) input; see "Input limits"
+    in the README for the per-stage bounds.
+    """
+
+    job_description: int = 50_000
+    resume: int = 100_000
+    transcript: int = 500_000
+
+    @classmethod
+    def from_env(cls) -> "InputLimits":
+        return cls(
+            job_description=int(os.getenv("PANELAI_MAX_JD_CHARS") or cls.job_description),
+            resume=int(os.getenv("PANELAI_MAX_RESUME_CHARS") or cls.resume),
+            transcript=int(os.getenv("PANELAI_MAX_TRANSCRIPT_CHARS") or cls.transcript),
+        )
+
+
+_LIMITS: InputLimits | None = None
+
+
+def get_input_limits() -> InputLimits:
+    global _LIMITS
+    if _LIMITS is None:
+        _LIMITS = InputLimits.from_env()
+    return _LIMITS
+
+
+def cap_text(text: str, limit: int) -> str:
+    """``text`` cut to at most ``limit`` chars, at the last line break when one is reasonably close.
+
+    The cut only depends on the first ``limit + 1`` chars, so a live transcript that keeps growing
+    past the cap keeps producing the same capped text (and memo hits).
+    """
+    if limit <= 0 or len(text) <= limit:
+        return text
+    cut = text.rfind("\n", 0, limit + 1)
+    return text[: cut if cut >= limit // 2 else limit].rstrip()
+
+
+def cap_inputs(ctx: PanelContext, limits: InputLimits | None = None) -> tuple[PanelContext, dict[str, Any]]:
+    """``ctx`` with every input within its cap, and a report of what was cut (empty when nothing was).
+
+    The report maps each truncated field to its original and kept length; it goes into the
+    result's ``artifacts["truncated"]``.
+    """
+    limits = limits or get_input_limits()
+    changes: dict[str, str] = {}
+    report: dict[str, Any] = {}
+    for name in FIELDS:
+        text: str = getattr(ctx, name)
+        limit: int = getattr(limits, name)
+        capped = cap_text(text, limit)
+        if capped is not text:
+            changes[name] = capped
+            report[name] = {"chars": len(text), "kept": len(capped), "limit": limit}
+    return (replace(ctx, **changes) if changes else ctx), report
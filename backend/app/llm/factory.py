@@ -1,16 +1,37 @@
 from __future__ import annotations
 
+import importlib
 import os
 
-from .heuristic import HeuristicProvider
-from .openai_provider import OpenAIProvider
 from .provider import LLMProvider
 
+# kind -> (module, class). Provider modules are imported on first use, so a deployment that never
+# routes to OpenAI doesn't pay for importing its HTTP client stack.
+_PROVIDERS: dict[str, tuple[str, str]] = {
+    "heuristic": (".heuristic", "HeuristicProvider"),
+    "openai": (".openai_provider", "OpenAIProvider"),
+}
+
+
+def build_provider(spec: str) -> LLMProvider:
+    """Build a provider from a spec like ``heuristic``, ``openai`` or ``openai:gpt-4o``."""
+    kind, _, model = spec.strip().partition(":")
+    kind = kind.strip().lower()
+    if kind not in _PROVIDERS:
+        raise ValueError(f"Unknown PANELAI_LLM_PROVIDER: {kind}")
+    module, cls_name = _PROVIDERS[kind]
+    cls = getattr(importlib.import_module(module, __package__), cls_name)
+    if kind == "heuristic":
+        return cls()
+    return cls(model=model.strip() or None)
+
 
 def get_provider() -> LLMProvider:
-    provider = (os.getenv("PANELAI_LLM_PROVIDER") or "heuristic").strip().lower()
-    if provider == "heuristic":
-        return HeuristicProvider()
-    if provider == "openai":
-        return OpenAIProvider()
-    raise ValueError(f"Unknown PANELAI_LLM_PROVIDER: {provider}")
+    """Return the app-wide default provider (see ``registry.get_registry``)."""
+    from .registry import get_registry
+
+    return get_registry().default
+
+
+def default_provider_spec() -> str:
+    return (os.getenv("PANELAI_LLM_PROVIDER") or "heuristic").strip().lower()
@@ -3,7 +3,7 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass
 
-from .provider import LLMProvider, LLMResponse
+from .provider import LLMProvider, LLMResponse, estimate_tokens
 
 
 @dataclass
@@ -11,6 +11,14 @@ class HeuristicProvider:
     name: str = "heuristic"
 
     async def complete(self, *, system: str, user: str) -> LLMResponse:
+        text = self._summarize(system=system, user=user)
+        return LLMResponse(
+            text=text,
+            prompt_tokens=estimate_tokens(system) + estimate_tokens(user),
+            completion_tokens=estimate_tokens(text),
+        )
+
+    def _summarize(self, *, system: str, user: str) -> str:
         # Deterministic fallback for no-key runs.
         # Important: do NOT echo the full prompt back (it pollutes the UI).
         compact: list[str] = []
@@ -22,9 +30,9 @@ class HeuristicProvider:
                 compact.append(f"{key}={m.group(1)}")
 
         if compact:
-            return LLMResponse(text="Heuristic summary: " + ", ".join(compact) + ".")
+            return "Heuristic summary: " + ", ".join(compact) + "."
 
         # Otherwise return a short statement of what the agent attempted.
         sys = re.sub(r"\s+", " ", system).strip()
         sys = sys[:160] + ("…" if len(sys) > 160 else "")
-        return LLMResponse(text=f"Heuristic summary: {sys}")
+        return f"Heuristic summary: {sys}"
@@ -1,26 +1,50 @@
 from __future__ import annotations
 
+import json
 import os
 
 import httpx
 
-from .provider import LLMProvider, LLMResponse
+from .provider import DeltaCallback, LLMProvider, LLMResponse, estimate_tokens
 
 
 class OpenAIProvider:
     name = "openai"
 
-    def __init__(self) -> None:
-        self._api_key = os.getenv("OPENAI_API_KEY", "").strip()
-        self._model = os.getenv("OPENAI_MODEL", "") or "gpt-4o-mini"
-        self._base_url = os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
+    def __init__(self, *, model: str | None = None, api_key: str | None = None, base_url: str | None = None) -> None:
+        self._api_key = (api_key if api_key is not None else os.getenv("OPENAI_API_KEY", "")).strip()
+        self._model = model or os.getenv("OPENAI_MODEL", "") or "gpt-4o-mini"
+        self._base_url = base_url or os.getenv("OPENAI_BASE_URL", "https://api.openai.com/v1")
+        self._client: httpx.AsyncClient | None = None
 
         if not self._api_key:
             raise RuntimeError("OPENAI_API_KEY is not set")
 
-    async def complete(self, *, system: str, user: str) -> LLMResponse:
-        headers = {"Authorization": f"Bearer {self._api_key}"}
-        payload = {
+    @property
+    def model(self) -> str:
+        return self._model
+
+    def _get_client(self) -> httpx.AsyncClient:
+        # One pooled client per provider instance; the registry keeps providers alive for the app lifetime.
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(
+                base_url=self._base_url,
+                headers={"Authorization": f"Bearer {self._api_key}"},
+                timeout=60.0,
+            )
+        return self._client
+
+    async def warm_up(self) -> None:
+        """Open a pooled connection (DNS + TLS) now so the first completion doesn't pay for it."""
+        await self._get_client().get("/models", timeout=5.0)
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    def _payload(self, *, system: str, user: str) -> dict:
+        return {
             "model": self._model,
             "messages": [
                 {"role": "system", "content": system},
@@ -29,10 +53,45 @@ class OpenAIProvider:
             "temperature": 0.2,
         }
 
-        async with httpx.AsyncClient(timeout=60.0) as client:
-            resp = await client.post(f"{self._base_url}/chat/completions", headers=headers, json=payload)
-            resp.raise_for_status()
-            data = resp.json()
+    async def complete(self, *, system: str, user: str) -> LLMResponse:
+        payload = self._payload(system=system, user=user)
+
+        resp = await self._get_client().post("/chat/completions", json=payload)
+        resp.raise_for_status()
+        data = resp.json()
 
         content = data["choices"][0]["message"]["content"]
-        return LLMResponse(text=content)
+        usage = data.get("usage") or {}
+        return LLMResponse(
+            text=content,
+            prompt_tokens=int(usage.get("prompt_tokens") or estimate_tokens(system) + estimate_tokens(user)),
+            completion_tokens=int(usage.get("completion_tokens") or estimate_tokens(content or "")),
+        )
+
+    async def stream(self, *, system: str, user: str, on_delta: DeltaCallback) -> LLMResponse:
+        payload = {**self._payload(system=system, user=user), "stream": True, "stream_options": {"include_usage": True}}
+
+        parts: list[str] = []
+        usage: dict = {}
+        async with self._get_client().stream("POST", "/chat/completions", json=payload) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    break
+                event = json.loads(data)
+                usage = event.get("usage") or usage
+                for choice in event.get("choices") or []:
+                    delta = (choice.get("delta") or {}).get("content")
+                    if delta:
+                        parts.append(delta)
+                        await on_delta(delta)
+
+        content = "".join(parts)
+        return LLMResponse(
+            text=content,
+            prompt_tokens=int(usage.get("prompt_tokens") or estimate_tokens(system) + estimate_tokens(user)),
+            completion_tokens=int(usage.get("completion_tokens") or estimate_tokens(content)),
+        )
@@ -1,12 +1,26 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Protocol
+from typing import Awaitable, Callable, Protocol
+
+# Receives incremental completion text while a streaming call is in flight.
+DeltaCallback = Callable[[str], Awaitable[None]]
+
+
+def estimate_tokens(text: str) -> int:
+    # ~4 characters per token for English prose; good enough for budgeting.
+    return (len(text) + 3) // 4
 
 
 @dataclass(frozen=True)
 class LLMResponse:
     text: str
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
 
 
 class LLMProvider(Protocol):
@@ -14,3 +28,8 @@ class LLMProvider(Protocol):
 
     async def complete(self, *, system: str, user: str) -> LLMResponse:
         ...
+
+
+class StreamingLLMProvider(LLMProvider, Protocol):
+    async def stream(self, *, system: str, user: str, on_delta: DeltaCallback) -> LLMResponse:
+        ...
@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import os
+from dataclasses import dataclass, field
+
+from .factory import build_provider, default_provider_spec
+from .provider import LLMProvider
+
+
+def _parse_routes(raw: str) -> dict[str, str]:
+    # "resume-claims=openai:gpt-4o-mini, hiring-manager=openai:gpt-4o"
+    routes: dict[str, str] = {}
+    for part in raw.split(","):
+        role, sep, spec = part.partition("=")
+        if sep and role.strip() and spec.strip():
+            routes[role.strip().lower()] = spec.strip()
+    return routes
+
+
+@dataclass
+class ProviderRegistry:
+    """Long-lived LLM providers, keyed by agent role.
+
+    Providers are built once (at app startup) and shared across requests; roles without
+    an explicit route fall back to ``default``.
+    """
+
+    default: LLMProvider
+    routes: dict[str, LLMProvider] = field(default_factory=dict)
+
+    def for_role(self, role: str) -> LLMProvider:
+        return self.routes.get(role.lower(), self.default)
+
+    @classmethod
+    def from_env(cls) -> "ProviderRegistry":
+        specs: dict[str, LLMProvider] = {}
+
+        def _shared(spec: str) -> LLMProvider:
+            key = spec.strip().lower()
+            if key not in specs:
+                specs[key] = build_provider(spec)
+            return specs[key]
+
+        default = _shared(default_provider_spec())
+        routes = {role: _shared(spec) for role, spec in _parse_routes(os.getenv("PANELAI_LLM_ROUTES", "")).items()}
+        return cls(default=default, routes=routes)
+
+    def distinct(self) -> list[LLMProvider]:
+        """Each provider once, however many roles route to it."""
+        seen: set[int] = set()
+        out: list[LLMProvider] = []
+        for provider in (self.default, *self.routes.values()):
+            if id(provider) not in seen:
+                seen.add(id(provider))
+                out.append(provider)
+        return out
+
+    async def warm_up(self) -> None:
+        """Let providers open connection pools ahead of the first request (``warm_up`` is optional)."""
+        for provider in self.distinct():
+            warm = getattr(provider, "warm_up", None)
+            if warm is not None:
+                await warm()
+
+    async def aclose(self) -> None:
+        for provider in self.distinct():
+            close = getattr(provider, "aclose", None)
+            if close is not None:
+                await close()
+
+
+_REGISTRY: ProviderRegistry | None = None
+
+
+def init_registry(registry: ProviderRegistry | None = None) -> ProviderRegistry:
+    global _REGISTRY
+    _REGISTRY = registry or ProviderRegistry.from_env()
+    return _REGISTRY
+
+
+def get_registry() -> ProviderRegistry:
+    # Lazily initialized for scripts/tests that never run the app startup hook.
+    if _REGISTRY is None:
+        return init_registry()
+    return _REGISTRY
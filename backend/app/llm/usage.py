@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from typing import Any
+
+from .provider import DeltaCallback, LLMProvider, LLMResponse
+
+
+def _env_int(name: str, default: int = 0) -> int:
+    try:
+        return int(os.getenv(name, "") or default)
+    except ValueError:
+        return default
+
+
+def _parse_prices(raw: str) -> dict[str, tuple[float, float]]:
+    # "gpt-4o-mini=0.15:0.6,gpt-4o=2.5:10" -> USD per 1M prompt/completion tokens
+    prices: dict[str, tuple[float, float]] = {}
+    for part in raw.split(","):
+        model, sep, rates = part.partition("=")
+        prompt, _, completion = rates.partition(":")
+        try:
+            if sep and model.strip():
+                prices[model.strip()] = (float(prompt or 0), float(completion or 0))
+        except ValueError:
+            continue
+    return prices
+
+
+@dataclass
+class _Tally:
+    calls: int = 0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    cost_usd: float = 0.0
+
+    def add(self, resp: LLMResponse, cost: float) -> None:
+        self.calls += 1
+        self.prompt_tokens += resp.prompt_tokens
+        self.completion_tokens += resp.completion_tokens
+        self.cost_usd += cost
+
+    @property
+    def total_tokens(self) -> int:
+        return self.prompt_tokens + self.completion_tokens
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_tokens": self.total_tokens,
+            "cost_usd": round(self.cost_usd, 6),
+        }
+
+
+@dataclass
+class UsageLedger:
+    """Per-request token accounting, aggregated per agent and per stage.
+
+    ``budget`` is a soft cap in total tokens: calls already in flight are always recorded,
+    and the orchestrator checks ``exhausted`` before starting optional work (cross-exam).
+    """
+
+    budget: int | None = None
+    prices: dict[str, tuple[float, float]] = field(default_factory=dict)
+    total: _Tally = field(default_factory=_Tally)
+    by_agent: dict[str, _Tally] = field(default_factory=dict)
+    by_stage: dict[str, _Tally] = field(default_factory=dict)
+
+    def record(self, *, agent: str, stage: str, model: str, resp: LLMResponse) -> None:
+        prompt_rate, completion_rate = self.prices.get(model, (0.0, 0.0))
+        cost = (resp.prompt_tokens * prompt_rate + resp.completion_tokens * completion_rate) / 1_000_000
+        self.total.add(resp, cost)
+        self.by_agent.setdefault(agent, _Tally()).add(resp, cost)
+        self.by_stage.setdefault(stage or "unstaged", _Tally()).add(resp, cost)
+
+    @property
+    def remaining(self) -> int | None:
+        if self.budget is None:
+            return None
+        return max(0, self.budget - self.total.total_tokens)
+
+    @property
+    def exhausted(self) -> bool:
+        return self.budget is not None and self.total.total_tokens >= self.budget
+
+    def summary(self) -> dict[str, Any]:
+        return {
+            **self.total.as_dict(),
+            "budget": self.budget,
+            "exhausted": self.exhausted,
+            "by_agent": {k: v.as_dict() for k, v in sorted(self.by_agent.items())},
+            "by_stage": {k: v.as_dict() for k, v in self.by_stage.items()},
+        }
+
+
+@dataclass
+class MeteredProvider:
+    """Wraps a provider so every completion is recorded in a ledger."""
+
+    inner: LLMProvider
+    ledger: UsageLedger
+    agent: str
+    stage: str = ""
+
+    @property
+    def name(self) -> str:
+        return self.inner.name
+
+    def _record(self, resp: LLMResponse) -> None:
+        model = str(getattr(self.inner, "model", "") or self.inner.name)
+        self.ledger.record(agent=self.agent, stage=self.stage, model=model, resp=resp)
+
+    async def complete(self, *, system: str, user: str) -> LLMResponse:
+        resp = await self.inner.complete(system=system, user=user)
+        self._record(resp)
+        return resp
+
+    async def stream(self, *, system: str, user: str, on_delta: DeltaCallback) -> LLMResponse:
+        inner_stream = getattr(self.inner, "stream", None)
+        if inner_stream is None:
+            # Non-streaming providers deliver the whole completion as a single delta.
+            resp = await self.inner.complete(system=system, user=user)
+            await on_delta(resp.text)
+        else:
+            resp = await inner_stream(system=system, user=user, on_delta=on_delta)
+        self._record(resp)
+        return resp
+
+
+class TenantBudgets:
+    """Rolling-window token budgets per tenant (in-memory, per process)."""
+
+    def __init__(self, *, budget: int | None, window_s: float) -> None:
+        self.budget = budget
+        self.window_s = window_s
+        self._spent: dict[str, deque[tuple[float, int]]] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_env(cls) -> "TenantBudgets":
+        budget = _env_int("PANELAI_TENANT_TOKEN_BUDGET")
+        return cls(budget=budget or None, window_s=float(_env_int("PANELAI_TENANT_BUDGET_WINDOW_S", 86400)))
+
+    def _used(self, tenant: str, now: float) -> int:
+        entries = self._spent.get(tenant)
+        if not entries:
+            return 0
+        while entries and entries[0][0] < now - self.window_s:
+            entries.popleft()
+        return sum(tokens for _, tokens in entries)
+
+    def remaining(self, tenant: str) -> int | None:
+        if self.budget is None:
+            return None
+        with self._lock:
+            return max(0, self.budget - self._used(tenant, time.monotonic()))
+
+    def charge(self, tenant: str, tokens: int) -> None:
+        if tokens <= 0:
+            return
+        with self._lock:
+            self._spent.setdefault(tenant, deque()).append((time.monotonic(), tokens))
+
+
+_TENANT_BUDGETS: TenantBudgets | None = None
+
+
+def get_tenant_budgets() -> TenantBudgets:
+    global _TENANT_BUDGETS
+    if _TENANT_BUDGETS is None:
+        _TENANT_BUDGETS = TenantBudgets.from_env()
+    return _TENANT_BUDGETS
+
+
+def new_ledger(*, config: dict[str, Any], tenant: str) -> UsageLedger:
+    """Ledger for one request: the tighter of the request budget and the tenant's remainder."""
+    limits: list[int] = []
+    try:
+        requested = int(config.get("token_budget") or 0)
+    except (TypeError, ValueError):
+        requested = 0
+    requested = requested or _env_int("PANELAI_TOKEN_BUDGET")
+    if requested > 0:
+        limits.append(requested)
+    tenant_remaining = get_tenant_budgets().remaining(tenant)
+    if tenant_remaining is not None:
+        limits.append(tenant_remaining)
+    return UsageLedger(
+        budget=min(limits) if limits else None,
+        prices=_parse_prices(os.getenv("PANELAI_LLM_PRICES", "")),
+    )
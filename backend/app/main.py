@@ -1,21 +1,65 @@
 from __future__ import annotations
 
+import asyncio
 import os
+from contextlib import asynccontextmanager
+from dataclasses import replace
 from pathlib import Path
+from typing import Any, AsyncIterator, Awaitable
 
 import json
 import os
 import traceback
+from collections import Counter
 
-from dotenv import load_dotenv
-from fastapi import FastAPI, File, Form, HTTPException, Request, UploadFile
+from fastapi import FastAPI, File, Form, Header, HTTPException, Request, Response, UploadFile
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse
 
-from .agents.base import PanelContext
-from .models import AssistRequest, AssistResult, EvaluateRequest, EvaluationResult
+from .admission import AdmissionController, Overloaded
+from .agents.base import AgentResult, PanelContext
+from .agents.gap_analysis import JDProfile, jd_profile_for
+from .agents.transcript_turns import TranscriptBuilder
+from .evaluations import EvaluationStore, should_store
+from .jd_profiles import JDProfileStore
+from .jobs import JobStore, JobWorkerPool, job_status
+from .limits import cap_text, get_input_limits
+from .dossier import InterviewRound, combine_transcripts, run_dossier
+from .delta import AssistSnapshots, assist_etag, diff_assist
+from .models import (
+    AgentMessage,
+    AssistDelta,
+    AssistDeltaRequest,
+    AssistEvaluateRequest,
+    AssistRequest,
+    AssistResult,
+    DossierRequest,
+    EvaluateRequest,
+    EvaluationResult,
+    EvaluationSearchResult,
+    EvaluationSummary,
+    JDProfileOut,
+    JDProfileRequest,
+    JobStatus,
+    RankedCandidate,
+    RankRequest,
+    RankResult,
+    Sample,
+    SampleList,
+    SampleSummary,
+    StoredEvaluation,
+)
 from .assist import run_assist
+from .capture import CaptureMiddleware
+from .llm.registry import init_registry
 from .orchestrator import run_panel
+from .ranking import rank_candidates, shutdown_pool
+from .responses import CompressionMiddleware, model_response
+from .samples import SampleCatalog
+from .uploads import RequestSizeLimitMiddleware, UploadBudget, UploadLimits, read_upload_text
+from .sessions import AssistSessions, SessionAnalysis, inputs_key
+from .traces import get_trace_store
+from .warmup import Readiness, warm_up, warmup_enabled
 
 
 APP_ROOT = Path(__file__).resolve().parents[1]
@@ -23,25 +67,84 @@ WORKSPACE_ROOT = APP_ROOT.parents[0]
 DATA_ROOT = WORKSPACE_ROOT / "data"
 
 # Load .env from workspace root for local development.
-# Safe in production: if no .env exists, this is a no-op.
+# Safe in production: if no .env exists, dotenv isn't even imported.
 # Use override=True so local .env reliably wins over any pre-set OS/terminal env vars.
-load_dotenv(WORKSPACE_ROOT / ".env", override=True)
+if (WORKSPACE_ROOT / ".env").exists():
+    from dotenv import load_dotenv
+
+    load_dotenv(WORKSPACE_ROOT / ".env", override=True)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    # Build LLM providers once; agents get them via PanelContext.providers.
+    app.state.providers = init_registry()
+    app.state.admission = AdmissionController.from_env()
+    app.state.sessions = AssistSessions.from_env()
+    app.state.assist_snapshots = AssistSnapshots()
+    app.state.samples = SampleCatalog.from_env(Path(os.getenv("PANELAI_SAMPLES_DIR") or DATA_ROOT))
+    app.state.jd_profiles = JDProfileStore()
+    app.state.evaluations = EvaluationStore()
+    app.state.jobs = JobStore()
+    # PANELAI_JOB_WORKERS=0 leaves job execution to separate `python -m app.jobs` processes.
+    workers = JobWorkerPool(
+        app.state.jobs,
+        workers=int(os.getenv("PANELAI_JOB_WORKERS", "2") or 0),
+        providers=app.state.providers,
+        admission=app.state.admission,
+        profiles=app.state.jd_profiles,
+        evaluations=app.state.evaluations,
+    )
+    workers.start()
+    # Warm-up runs in the background: /health answers at once, /ready turns 200 when it is done.
+    app.state.readiness = Readiness(ready=not warmup_enabled())
+    warming = None if app.state.readiness.ready else asyncio.create_task(warm_up(app.state, app.state.readiness))
+    try:
+        yield
+    finally:
+        if warming is not None:
+            warming.cancel()
+        await workers.stop()
+        await app.state.providers.aclose()
+        shutdown_pool()
+
 
-app = FastAPI(title="PanelAI", version="0.1.0")
+app = FastAPI(title="PanelAI", version="0.1.0", lifespan=lifespan)
+
+
+def _debug() -> bool:
+    """Whether error responses may include exception details (``PANELAI_DEBUG``)."""
+    return (os.getenv("PANELAI_DEBUG") or "1").strip().lower() in {"1", "true", "yes"}
 
 
 @app.exception_handler(Exception)
 async def unhandled_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-    debug = (os.getenv("PANELAI_DEBUG") or "1").strip().lower() in {"1", "true", "yes"}
     payload: dict[str, object] = {
         "detail": "Internal Server Error",
         "path": str(request.url.path),
     }
-    if debug:
+    if _debug():
         payload["error"] = repr(exc)
         payload["trace"] = traceback.format_exc(limit=30)
     return JSONResponse(status_code=500, content=payload)
 
+
+@app.exception_handler(Overloaded)
+async def overloaded_handler(request: Request, exc: Overloaded) -> JSONResponse:
+    return JSONResponse(
+        status_code=503,
+        content={"detail": f"Server busy ({exc.lane}); retry later", "path": str(request.url.path)},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
+
+UPLOAD_LIMITS = UploadLimits.from_env()
+
+app.add_middleware(
+    RequestSizeLimitMiddleware,
+    paths=("/evaluate-files",),
+    max_bytes=UPLOAD_LIMITS.max_request_bytes,
+    max_part_bytes=UPLOAD_LIMITS.max_file_bytes,
+)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=[os.getenv("PANELAI_CORS_ORIGIN", "http://localhost:5173")],
@@ -49,6 +152,77 @@ app.add_middleware(
     allow_methods=["*"] ,
     allow_headers=["*"],
 )
+app.add_middleware(CompressionMiddleware, **CompressionMiddleware.options_from_env())
+# Outermost, so captured latency includes compression and every other middleware.
+app.add_middleware(CaptureMiddleware, **CaptureMiddleware.options_from_env())
+
+
+def _etag_matches(if_none_match: str | None, etag: str) -> bool:
+    if not if_none_match:
+        return False
+    tags = {t.strip().removeprefix("W/").strip('"') for t in if_none_match.split(",")}
+    return "*" in tags or etag in tags
+
+
+def _tenant(request: Request) -> str:
+    return (request.headers.get("x-tenant-id") or "default").strip() or "default"
+
+
+async def _cancel_on_disconnect(request: Request, work: Awaitable[Any]) -> Any:
+    """Await ``work`` but cancel it as soon as the client disconnects."""
+    task = asyncio.ensure_future(work)
+
+    async def _watch() -> None:
+        while not await request.is_disconnected():
+            await asyncio.sleep(0.25)
+
+    watcher = asyncio.create_task(_watch())
+    try:
+        await asyncio.wait({task, watcher}, return_when=asyncio.FIRST_COMPLETED)
+    finally:
+        watcher.cancel()
+        if not task.done():
+            task.cancel()
+    if task.cancelled():
+        # Nobody is listening any more; 499 mirrors nginx's "client closed request".
+        return Response(status_code=499)
+    return task.result()
+
+
+async def _jd_profile(req: EvaluateRequest | AssistRequest | DossierRequest | RankRequest, request: Request) -> JDProfile | None:
+    """Resolve ``jd_profile_id`` for the calling tenant (404 if unknown)."""
+    if not req.jd_profile_id:
+        return None
+    hit = await asyncio.to_thread(request.app.state.jd_profiles.get, _tenant(request), req.jd_profile_id)
+    if hit is None:
+        raise HTTPException(status_code=404, detail="Unknown jd_profile_id")
+    return hit[0]
+
+
+async def _store_evaluation(request: Request, ctx: PanelContext, result: EvaluationResult, label: str = "") -> None:
+    """Persist a panel result with its inputs; its id is reported as ``artifacts.evaluation_id``."""
+    if not should_store(ctx.config):
+        return
+    result.artifacts["evaluation_id"] = await asyncio.to_thread(
+        request.app.state.evaluations.save,
+        result,
+        tenant=ctx.tenant,
+        job_description=ctx.job_description,
+        resume=ctx.resume,
+        transcript=ctx.transcript,
+        config=ctx.config,
+        label=label,
+    )
+
+
+def _profile_out(profile: JDProfile, created_at: float) -> JDProfileOut:
+    return JDProfileOut(
+        id=profile.profile_id or "",
+        title=profile.title,
+        requirements=profile.requirements,
+        keywords=profile.keywords,
+        created_at=created_at,
+    )
 
 
 @app.get("/health")
@@ -56,60 +230,266 @@ def health() -> dict[str, str]:
     return {"status": "ok"}
 
 
-@app.get("/samples")
-def samples() -> list[dict[str, str]]:
-    if not DATA_ROOT.exists():
-        return []
+@app.get("/ready")
+def ready(request: Request) -> JSONResponse:
+    """Readiness for load balancers: 503 until startup warm-up has finished."""
+    readiness: Readiness = request.app.state.readiness
+    return JSONResponse(status_code=200 if readiness.ready else 503, content=readiness.as_dict())
+
 
-    out: list[dict[str, str]] = []
-    for d in sorted(DATA_ROOT.iterdir()):
-        if not d.is_dir():
-            continue
-        jd = d / "job_description.md"
-        resume = d / "resume.md"
-        transcript = d / "transcript.md"
-        if jd.exists() and resume.exists() and transcript.exists():
-            out.append({"id": d.name, "job_description": jd.read_text(encoding="utf-8"), "resume": resume.read_text(encoding="utf-8"), "transcript": transcript.read_text(encoding="utf-8")})
-    return out
+@app.get("/samples", response_model=SampleList)
+async def samples(
+    request: Request,
+    q: str = "",
+    limit: int = 50,
+    offset: int = 0,
+    if_none_match: str | None = Header(default=None),
+) -> Response:
+    """Page of the sample catalog (metadata only, sorted by id); fetch content with ``/samples/{id}``."""
+    limit = max(1, min(limit, 500))
+    offset = max(0, offset)
+    entries, total, etag = await asyncio.to_thread(request.app.state.samples.list, q=q, offset=offset, limit=limit)
+    headers = {"ETag": f'"{etag}"', "Cache-Control": "no-cache"}
+    if _etag_matches(if_none_match, etag):
+        return Response(status_code=304, headers=headers)
+    page = SampleList(
+        items=[SampleSummary(id=e.id, title=e.title, candidate=e.candidate, bytes=e.bytes, updated_at=e.updated_at) for e in entries],
+        total=total,
+        next_offset=offset + limit if offset + limit < total else None,
+    )
+    return model_response(page, headers=headers)
+
+
+@app.get("/samples/{sample_id}", response_model=Sample)
+async def get_sample(sample_id: str, request: Request, if_none_match: str | None = Header(default=None)) -> Response:
+    catalog: SampleCatalog = request.app.state.samples
+    entry = await asyncio.to_thread(catalog.entry, sample_id)
+    if entry is None:
+        raise HTTPException(status_code=404, detail="Unknown sample")
+    headers = {"ETag": f'"{entry.etag}"', "Cache-Control": "no-cache"}
+    if _etag_matches(if_none_match, entry.etag):
+        return Response(status_code=304, headers=headers)
+    content = await asyncio.to_thread(catalog.content, entry)
+    return model_response(Sample(**content), headers=headers)
 
 
 @app.post("/evaluate", response_model=EvaluationResult)
-async def evaluate(req: EvaluateRequest) -> EvaluationResult:
-    if not req.job_description.strip() or not req.resume.strip() or not req.transcript.strip():
+async def evaluate(req: EvaluateRequest, request: Request) -> Response:
+    profile = await _jd_profile(req, request)
+    jd = profile.job_description if profile else req.job_description
+    if not jd.strip() or not req.resume.strip() or not req.transcript.strip():
         raise HTTPException(status_code=400, detail="job_description, resume, and transcript are required")
 
     ctx = PanelContext(
-        job_description=req.job_description,
+        job_description=jd,
         resume=req.resume,
         transcript=req.transcript,
         config=req.config or {},
+        providers=request.app.state.providers,
+        tenant=_tenant(request),
+        candidate=req.label,
+        jd_profile=profile,
     )
 
-    return await run_panel(ctx=ctx)
+    async with request.app.state.admission.slot("interactive", ctx.tenant):
+        result = await run_panel(ctx=ctx)
+    await _store_evaluation(request, ctx, result, req.label)
+    return model_response(result)
 
 
-@app.post("/assist", response_model=AssistResult)
-async def assist(req: AssistRequest) -> AssistResult:
-    if not req.job_description.strip() or not req.resume.strip():
+def _sse(event: str, data: Any) -> str:
+    return f"event: {event}\ndata: {json.dumps(data, default=str)}\n\n"
+
+
+@app.post("/evaluate/stream")
+async def evaluate_stream(req: EvaluateRequest, request: Request) -> StreamingResponse:
+    """Run the panel and stream progress as server-sent events.
+
+    Events: ``finding`` (per analysis agent), ``signals``, ``vote`` (per panel agent),
+    ``token`` (hiring-manager summary deltas, LLM providers only), ``cross_exam``,
+    ``verdict`` (the full EvaluationResult) and finally ``done`` or ``error``.
+    """
+    profile = await _jd_profile(req, request)
+    jd = profile.job_description if profile else req.job_description
+    if not jd.strip() or not req.resume.strip() or not req.transcript.strip():
+        raise HTTPException(status_code=400, detail="job_description, resume, and transcript are required")
+
+    admission: AdmissionController = request.app.state.admission
+    admission.check("interactive")
+    queue: asyncio.Queue[tuple[str, Any] | None] = asyncio.Queue()
+
+    async def _on_event(event: str, data: dict[str, Any]) -> None:
+        await queue.put((event, data))
+
+    ctx = PanelContext(
+        job_description=jd,
+        resume=req.resume,
+        transcript=req.transcript,
+        config=req.config or {},
+        providers=request.app.state.providers,
+        tenant=_tenant(request),
+        candidate=req.label,
+        jd_profile=profile,
+        on_event=_on_event,
+    )
+
+    async def _run() -> None:
+        try:
+            async with admission.slot("interactive", ctx.tenant):
+                result = await run_panel(ctx=ctx)
+            await _store_evaluation(request, ctx, result, req.label)
+            if "evaluation_id" in result.artifacts:
+                await queue.put(("stored", {"evaluation_id": result.artifacts["evaluation_id"]}))
+            await queue.put(("done", {}))
+        except Overloaded as exc:
+            await queue.put(("error", {"detail": "Server busy; retry later", "retry_after": exc.retry_after}))
+        except Exception as exc:
+            error: dict[str, Any] = {"detail": "Internal Server Error"}
+            if _debug():
+                error["error"] = repr(exc)
+            await queue.put(("error", error))
+        finally:
+            await queue.put(None)
+
+    async def _events() -> AsyncIterator[str]:
+        task = asyncio.create_task(_run())
+        try:
+            while (item := await queue.get()) is not None:
+                yield _sse(*item)
+        finally:
+            # Client went away (or we finished): never leave the panel running unobserved.
+            task.cancel()
+
+    return StreamingResponse(_events(), media_type="text/event-stream", headers={"Cache-Control": "no-cache"})
+
+
+async def _assist(req: AssistRequest, request: Request) -> AssistResult | Response:
+    profile = await _jd_profile(req, request)
+    jd = profile.job_description if profile else req.job_description
+    if not jd.strip() or not req.resume.strip():
         raise HTTPException(status_code=400, detail="job_description and resume are required")
 
     ctx = PanelContext(
-        job_description=req.job_description,
+        job_description=jd,
         resume=req.resume,
         transcript=req.transcript or "",
         config=req.config or {},
+        providers=request.app.state.providers,
+        tenant=_tenant(request),
+        jd_profile=profile,
     )
 
-    return await run_assist(ctx=ctx)
+    sessions: AssistSessions = request.app.state.sessions
+    session_key = f"{ctx.tenant}:{req.session_id}"
+
+    async def _compute() -> AssistResult:
+        analysis: dict[str, AgentResult] = {}
+        async with request.app.state.admission.slot("live", ctx.tenant):
+            result = await run_assist(ctx=ctx, analysis=analysis)
+        if req.session_id:
+            sessions.record(session_key, SessionAnalysis(version=req.transcript_version, ctx=ctx, results=analysis))
+        return result
+
+    if not req.session_id:
+        return await _cancel_on_disconnect(request, _compute())
+
+    key = inputs_key(ctx.tenant, req.jd_profile_id or jd, req.resume, ctx.transcript, ctx.config)
+    return await _cancel_on_disconnect(
+        request,
+        sessions.run(session_key, version=req.transcript_version, key=key, compute=_compute),
+    )
+
+
+@app.post("/assist", response_model=AssistResult)
+async def assist(req: AssistRequest, request: Request) -> Response:
+    result = await _assist(req, request)
+    return result if isinstance(result, Response) else model_response(result)
+
+
+@app.post("/assist/delta", response_model=AssistDelta)
+async def assist_delta(req: AssistDeltaRequest, request: Request, response: Response) -> AssistDelta:
+    """Like ``/assist`` but returns only what changed since the client's ``since`` ETag."""
+    result = await _assist(req, request)
+    if isinstance(result, Response):
+        return result
+
+    snapshots: AssistSnapshots = request.app.state.assist_snapshots
+    etag = assist_etag(result)
+    since = req.since or (request.headers.get("if-none-match") or "").strip('" ') or None
+    tenant = _tenant(request)
+    delta = diff_assist(result, etag=etag, base=snapshots.get(tenant, req.session_id, since), base_etag=since)
+    snapshots.put(tenant, req.session_id, etag, result)
+    response.headers["ETag"] = f'"{etag}"'
+    return delta
+
+
+@app.post("/evaluate-dossier", response_model=EvaluationResult)
+async def evaluate_dossier(req: DossierRequest, request: Request) -> Response:
+    """Evaluate a candidate across interview rounds; rounds analyzed before are not re-analyzed."""
+    profile = await _jd_profile(req, request)
+    jd = profile.job_description if profile else req.job_description
+    if not jd.strip() or not req.resume.strip() or not any(r.transcript.strip() for r in req.rounds):
+        raise HTTPException(status_code=400, detail="job_description, resume, and at least one transcript are required")
+
+    rounds = [
+        InterviewRound(label=r.round.strip() or f"Round {i + 1}", interviewer=r.interviewer.strip(), transcript=r.transcript)
+        for i, r in enumerate(req.rounds)
+        if r.transcript.strip()
+    ]
+    ctx = PanelContext(
+        job_description=jd,
+        resume=req.resume,
+        transcript=combine_transcripts(rounds)[0],
+        config=req.config or {},
+        providers=request.app.state.providers,
+        tenant=_tenant(request),
+        candidate=req.label,
+        jd_profile=profile,
+    )
+    async with request.app.state.admission.slot("interactive", ctx.tenant):
+        result = await run_dossier(ctx=ctx, rounds=rounds)
+    await _store_evaluation(request, ctx, result, req.label)
+    return model_response(result)
+
+
+@app.post("/assist/sessions/{session_id}/evaluate", response_model=EvaluationResult)
+async def evaluate_assist_session(session_id: str, req: AssistEvaluateRequest, request: Request) -> Response:
+    """Finalize a live-assist session into a full evaluation.
+
+    The analysis agents' results from the session's latest assist run are reused as-is; only the
+    remaining analysis, the panel, consensus and cross-exam run.
+    """
+    sessions: AssistSessions = request.app.state.sessions
+    analysis = await _cancel_on_disconnect(request, sessions.latest_analysis(f"{_tenant(request)}:{session_id}"))
+    if analysis is None:
+        raise HTTPException(status_code=404, detail="No completed assist run for this session")
+    if req.transcript_version is not None and analysis.version != req.transcript_version:
+        raise HTTPException(
+            status_code=409,
+            detail=f"Session analysis covers transcript version {analysis.version}, not {req.transcript_version}",
+        )
+    if not analysis.ctx.transcript.strip():
+        raise HTTPException(status_code=400, detail="The session's transcript is empty")
+
+    ctx = replace(
+        analysis.ctx, config={**analysis.ctx.config, **req.config}, usage=None, stage="", candidate=req.label
+    )
+    async with request.app.state.admission.slot("interactive", ctx.tenant):
+        result = await run_panel(ctx=ctx, seed=analysis.results)
+    await _store_evaluation(request, ctx, result, req.label)
+    return model_response(result)
 
 
 @app.post("/evaluate-files", response_model=EvaluationResult)
 async def evaluate_files(
-    job_description: UploadFile = File(...),
+    request: Request,
     resume: UploadFile = File(...),
     transcript: UploadFile = File(...),
+    job_description: UploadFile | None = File(default=None),
+    jd_profile_id: str | None = Form(default=None),
+    label: str = Form(default=""),
     config_json: str = Form(default="{}"),
-) -> EvaluationResult:
+) -> Response:
     try:
         config = json.loads(config_json or "{}")
         if not isinstance(config, dict):
@@ -117,9 +497,23 @@ async def evaluate_files(
     except Exception as e:
         raise HTTPException(status_code=400, detail=f"Invalid config_json: {e}")
 
-    jd_text = (await job_description.read()).decode("utf-8", errors="replace").strip()
-    resume_text = (await resume.read()).decode("utf-8", errors="replace").strip()
-    transcript_text = (await transcript.read()).decode("utf-8", errors="replace").strip()
+    budget = UploadBudget(UPLOAD_LIMITS)
+    profile = None
+    if jd_profile_id:
+        hit = await asyncio.to_thread(request.app.state.jd_profiles.get, _tenant(request), jd_profile_id)
+        if hit is None:
+            raise HTTPException(status_code=404, detail="Unknown jd_profile_id")
+        profile = hit[0]
+        jd_text = profile.job_description
+    elif job_description is not None:
+        jd_text = await read_upload_text(job_description, budget)
+    else:
+        jd_text = ""
+    resume_text = await read_upload_text(resume, budget)
+    # Turns are parsed as the transcript arrives; the agents then find the parse already cached.
+    builder = TranscriptBuilder()
+    await read_upload_text(transcript, budget, on_text=builder.feed)
+    transcript_text = builder.finish()
 
     if not jd_text or not resume_text or not transcript_text:
         raise HTTPException(status_code=400, detail="Uploaded files must not be empty")
@@ -129,6 +523,195 @@ async def evaluate_files(
         resume=resume_text,
         transcript=transcript_text,
         config=config,
+        providers=request.app.state.providers,
+        tenant=_tenant(request),
+        candidate=label,
+        jd_profile=profile,
     )
 
-    return await run_panel(ctx=ctx)
+    async with request.app.state.admission.slot("batch", ctx.tenant):
+        result = await run_panel(ctx=ctx)
+    await _store_evaluation(request, ctx, result, label)
+    return model_response(result)
+
+
+@app.post("/rank", response_model=RankResult)
+async def rank(req: RankRequest, request: Request) -> Response:
+    """Shortlist candidates for one JD by requirement coverage and claim evidence.
+
+    No judges or cross-exam: the JD is compiled once and each candidate is matched against it.
+    With ``top_k`` the full panel then runs on the best ``top_k`` candidates only.
+    """
+    profile = await _jd_profile(req, request)
+    if profile is None:
+        if not req.job_description.strip():
+            raise HTTPException(status_code=400, detail="job_description or jd_profile_id is required")
+        profile = jd_profile_for(req.job_description)
+    dupes = sorted(cid for cid, n in Counter(c.id for c in req.candidates).items() if n > 1)
+    if dupes:
+        raise HTTPException(status_code=400, detail=f"Duplicate candidate ids: {', '.join(dupes[:20])}")
+    tenant = _tenant(request)
+    admission: AdmissionController = request.app.state.admission
+
+    async with admission.slot("batch", tenant):
+        ranked = await asyncio.to_thread(rank_candidates, profile, req.candidates)
+
+    if req.top_k:
+        by_id = {c.id: c for c in req.candidates}
+        # Every panel takes its own batch slot, so a large top_k is served round-robin with other
+        # tenants' batch work. At most the lane limit of them wait at once: they never fill the
+        # lane's queue, which is sized for requests.
+        gate = asyncio.Semaphore(admission.stats()["batch"]["limit"])
+
+        async def _evaluate(entry: RankedCandidate) -> None:
+            c = by_id[entry.id]
+            if not c.transcript.strip():
+                return
+            ctx = PanelContext(
+                job_description=profile.job_description,
+                resume=c.resume,
+                transcript=c.transcript,
+                config=req.config or {},
+                providers=request.app.state.providers,
+                tenant=tenant,
+                candidate=c.id,
+                jd_profile=profile,
+            )
+            async with gate, admission.slot("batch", tenant, bounded=False):
+                entry.evaluation = await run_panel(ctx=ctx)
+            await _store_evaluation(request, ctx, entry.evaluation, c.id)
+
+        tasks = [asyncio.create_task(_evaluate(entry)) for entry in ranked[: req.top_k]]
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            # A failed panel fails the request; don't leave the others running.
+            for task in tasks:
+                task.cancel()
+
+    return model_response(RankResult(jd_profile_id=profile.profile_id, requirements=profile.requirements, ranked=ranked))
+
+
+@app.get("/evaluations", response_model=EvaluationSearchResult)
+async def search_evaluations(
+    request: Request,
+    q: str | None = None,
+    verdict: str | None = None,
+    gap: str | None = None,
+    category: str | None = None,
+    limit: int = 20,
+    offset: int = 0,
+) -> EvaluationSearchResult:
+    """Search stored evaluations (newest first): free text ``q`` over inputs, reasoning and
+    discrepancies; ``gap`` over unmet requirements; exact ``verdict`` and discrepancy ``category``."""
+    limit = max(1, min(limit, 200))
+    rows = await asyncio.to_thread(
+        request.app.state.evaluations.search,
+        tenant=_tenant(request),
+        q=q,
+        verdict=verdict,
+        gap=gap,
+        category=category,
+        limit=limit + 1,
+        offset=max(0, offset),
+    )
+    items = [EvaluationSummary(**{k: row[k] for k in row.keys()}) for row in rows[:limit]]
+    return EvaluationSearchResult(items=items, next_offset=offset + limit if len(rows) > limit else None)
+
+
+@app.get("/evaluations/{eval_id}", response_model=StoredEvaluation)
+async def get_evaluation(eval_id: str, request: Request) -> Response:
+    row = await asyncio.to_thread(request.app.state.evaluations.get, _tenant(request), eval_id)
+    if row is None:
+        raise HTTPException(status_code=404, detail="Unknown evaluation")
+    stored = StoredEvaluation(
+        id=row["id"],
+        label=row["label"],
+        created_at=row["created_at"],
+        job_description=row["job_description"],
+        resume=row["resume"],
+        transcript=row["transcript"],
+        config=json.loads(row["config"]),
+        result=EvaluationResult.model_validate_json(row["result"]),
+    )
+    return model_response(stored)
+
+
+@app.get("/traces/{trace_id}", response_model=list[AgentMessage])
+async def get_trace(trace_id: str, request: Request) -> Response:
+    """Full agent trace of a panel run whose response carried ``artifacts.trace_id``."""
+    trace = await asyncio.to_thread(get_trace_store().get, _tenant(request), trace_id)
+    if trace is None:
+        raise HTTPException(status_code=404, detail="Unknown trace")
+    return Response(content=trace, media_type="application/json")
+
+
+@app.post("/jd-profiles", response_model=JDProfileOut, status_code=201)
+async def register_jd_profile(req: JDProfileRequest, request: Request, response: Response) -> JDProfileOut:
+    """Compile a job description once; pass the returned id as ``jd_profile_id`` afterwards."""
+    if not req.job_description.strip():
+        raise HTTPException(status_code=400, detail="job_description is required")
+    profile, created_at, created = await asyncio.to_thread(
+        request.app.state.jd_profiles.register,
+        tenant=_tenant(request),
+        job_description=cap_text(req.job_description, get_input_limits().job_description),
+        title=req.title,
+    )
+    if not created:
+        response.status_code = 200
+    response.headers["Location"] = f"/jd-profiles/{profile.profile_id}"
+    return _profile_out(profile, created_at)
+
+
+@app.get("/jd-profiles/{profile_id}", response_model=JDProfileOut)
+async def get_jd_profile(profile_id: str, request: Request) -> JDProfileOut:
+    hit = await asyncio.to_thread(request.app.state.jd_profiles.get, _tenant(request), profile_id)
+    if hit is None:
+        raise HTTPException(status_code=404, detail="Unknown JD profile")
+    return _profile_out(*hit)
+
+
+@app.post("/jobs", response_model=JobStatus, status_code=202)
+async def submit_job(
+    req: EvaluateRequest,
+    request: Request,
+    response: Response,
+    idempotency_key: str | None = Header(default=None),
+) -> JobStatus:
+    """Queue a full panel evaluation; poll ``/jobs/{id}`` and fetch ``/jobs/{id}/result``."""
+    profile = await _jd_profile(req, request)
+    jd = profile.job_description if profile else req.job_description
+    if not jd.strip() or not req.resume.strip() or not req.transcript.strip():
+        raise HTTPException(status_code=400, detail="job_description, resume, and transcript are required")
+
+    status, created = await asyncio.to_thread(
+        request.app.state.jobs.submit,
+        request=req.model_dump(),
+        tenant=_tenant(request),
+        idempotency_key=idempotency_key,
+    )
+    if not created:
+        response.status_code = 200
+    response.headers["Location"] = f"/jobs/{status.job_id}"
+    return status
+
+
+@app.get("/jobs/{job_id}", response_model=JobStatus)
+async def get_job(job_id: str, request: Request) -> JobStatus:
+    row = await asyncio.to_thread(request.app.state.jobs.get, _tenant(request), job_id)
+    if row is None:
+        raise HTTPException(status_code=404, detail="Unknown job")
+    return job_status(row)
+
+
+@app.get("/jobs/{job_id}/result", response_model=EvaluationResult)
+async def get_job_result(job_id: str, request: Request) -> Response:
+    row = await asyncio.to_thread(request.app.state.jobs.get, _tenant(request), job_id)
+    if row is None:
+        raise HTTPException(status_code=404, detail="Unknown job")
+    if row["status"] == "failed":
+        raise HTTPException(status_code=500, detail=f"Job failed: {row['error']}")
+    if row["status"] != "succeeded":
+        raise HTTPException(status_code=409, detail=f"Job is {row['status']}")
+    # Stored as EvaluationResult JSON already; no need to round-trip through the model.
+    return Response(content=row["result"], media_type="application/json")
@@ -6,25 +6,81 @@ from pydantic import BaseModel, Field
 
 
 class EvaluateRequest(BaseModel):
-    job_description: str = Field(..., description="Job description text")
+    job_description: str = Field(default="", description="Job description text (or use jd_profile_id)")
     resume: str = Field(..., description="Candidate resume text")
     transcript: str = Field(..., description="Interview transcript text")
     config: dict[str, Any] = Field(default_factory=dict)
+    jd_profile_id: str | None = Field(default=None, description="Registered JD profile to evaluate against")
+    label: str = Field(default="", description="Free-form label stored with the evaluation (e.g. candidate name)")
 
 
 class AssistRequest(BaseModel):
-    job_description: str = Field(..., description="Job description text")
+    job_description: str = Field(default="", description="Job description text (or use jd_profile_id)")
     resume: str = Field(..., description="Candidate resume text")
     transcript: str = Field(default="", description="Interview transcript text (can be empty for live sessions)")
     config: dict[str, Any] = Field(default_factory=dict)
+    jd_profile_id: str | None = Field(default=None, description="Registered JD profile to evaluate against")
+    session_id: str | None = Field(default=None, description="Live session id; enables latest-wins coalescing")
+    transcript_version: int | None = Field(default=None, description="Monotonic transcript version within the session")
+
+
+class DossierRound(BaseModel):
+    round: str = Field(default="", description="Round name, e.g. 'System design'; defaults to 'Round N'")
+    interviewer: str = ""
+    transcript: str = Field(..., description="This round's transcript")
+
+
+class DossierRequest(BaseModel):
+    job_description: str = Field(default="", description="Job description text (or use jd_profile_id)")
+    resume: str = Field(..., description="Candidate resume text")
+    rounds: list[DossierRound] = Field(..., min_length=1, max_length=20, description="Interview rounds, in order")
+    config: dict[str, Any] = Field(default_factory=dict)
+    jd_profile_id: str | None = Field(default=None, description="Registered JD profile to evaluate against")
+    label: str = Field(default="", description="Free-form label stored with the evaluation (e.g. candidate name)")
+
+
+class AssistEvaluateRequest(BaseModel):
+    config: dict[str, Any] = Field(default_factory=dict, description="Merged over the session's assist config")
+    transcript_version: int | None = Field(
+        default=None, description="Transcript version the client expects the evaluation to cover"
+    )
+    label: str = ""
+
+
+class JDProfileRequest(BaseModel):
+    job_description: str = Field(..., description="Job description text")
+    title: str = ""
+
+
+class JDProfileOut(BaseModel):
+    id: str
+    title: str = ""
+    requirements: list[str]
+    keywords: list[str]
+    created_at: float
+
+
+class AssistDeltaRequest(AssistRequest):
+    since: str | None = Field(default=None, description="ETag of the last assist result the client holds")
+
+
+class EvidenceSpan(BaseModel):
+    """Where evidence lives in an input document: [start, end) character offsets."""
+
+    doc: Literal["transcript", "resume", "job_description"] = "transcript"
+    start: int = Field(..., ge=0)
+    end: int = Field(..., ge=0)
+    turn: int | None = Field(default=None, description="Speaker turn index, when known")
 
 
 class Discrepancy(BaseModel):
+    id: str = Field(default="", description="Stable id (category + claim); unchanged across assist ticks")
     severity: Literal["low", "medium", "high"]
     category: str
     claim: str
     evidence: str
     explanation: str
+    evidence_span: EvidenceSpan | None = None
 
 
 class DimensionScore(BaseModel):
@@ -53,10 +109,12 @@ class EvaluationResult(BaseModel):
 
 
 class FollowUp(BaseModel):
+    id: str = Field(default="", description="Stable id (question text)")
     question: str
     reason: str = ""
     evidence: str = ""
     evidence_score: float = Field(default=0.0, ge=0.0, le=1.0)
+    evidence_span: EvidenceSpan | None = None
 
 
 class AssistResult(BaseModel):
@@ -64,3 +122,113 @@ class AssistResult(BaseModel):
     followups: list[FollowUp]
     risks: list[str] = Field(default_factory=list)
     artifacts: dict[str, Any] = Field(default_factory=dict)
+
+
+class AssistDelta(BaseModel):
+    """Assist result relative to the client's ``since`` ETag.
+
+    ``full`` means the base was unknown and every item is in ``*_added``. ``*_order`` lists
+    the current ids in display order; ``risks`` is null when unchanged.
+    """
+
+    etag: str
+    base_etag: str | None = None
+    full: bool = False
+    discrepancies_added: list[Discrepancy] = Field(default_factory=list)
+    discrepancies_changed: list[Discrepancy] = Field(default_factory=list)
+    discrepancies_removed: list[str] = Field(default_factory=list)
+    discrepancy_order: list[str] = Field(default_factory=list)
+    followups_added: list[FollowUp] = Field(default_factory=list)
+    followups_changed: list[FollowUp] = Field(default_factory=list)
+    followups_removed: list[str] = Field(default_factory=list)
+    followup_order: list[str] = Field(default_factory=list)
+    risks: list[str] | None = None
+    artifacts: dict[str, Any] = Field(default_factory=dict)
+
+
+class RankCandidate(BaseModel):
+    id: str
+    resume: str
+    transcript: str = ""
+
+
+class RankRequest(BaseModel):
+    job_description: str = Field(default="", description="Job description text (or use jd_profile_id)")
+    jd_profile_id: str | None = None
+    candidates: list[RankCandidate] = Field(..., min_length=1, max_length=10000)
+    top_k: int = Field(default=0, ge=0, le=20, description="Run the full panel on this many top candidates")
+    config: dict[str, Any] = Field(default_factory=dict, description="Panel config for the top-k evaluations")
+
+
+class RankedCandidate(BaseModel):
+    id: str
+    rank: int
+    score: float = Field(..., description="0.7 * coverage_ratio + 0.3 * evidence_ratio")
+    coverage_ratio: float
+    evidence_ratio: float = Field(..., description="Share of resume claims supported by the transcript")
+    covered: list[str] = Field(default_factory=list)
+    gaps: list[str] = Field(default_factory=list)
+    evaluation: EvaluationResult | None = None
+
+
+class RankResult(BaseModel):
+    jd_profile_id: str | None = None
+    requirements: list[str]
+    ranked: list[RankedCandidate]
+
+
+class SampleSummary(BaseModel):
+    id: str
+    title: str = Field(default="", description="Job description heading")
+    candidate: str = Field(default="", description="Resume heading")
+    bytes: int
+    updated_at: float
+
+
+class SampleList(BaseModel):
+    items: list[SampleSummary]
+    total: int
+    next_offset: int | None = None
+
+
+class Sample(BaseModel):
+    id: str
+    job_description: str
+    resume: str
+    transcript: str
+
+
+class EvaluationSummary(BaseModel):
+    id: str
+    label: str = ""
+    verdict: str
+    created_at: float
+    discrepancy_count: int
+    high_count: int
+    coverage_ratio: float
+
+
+class EvaluationSearchResult(BaseModel):
+    items: list[EvaluationSummary]
+    next_offset: int | None = None
+
+
+class StoredEvaluation(BaseModel):
+    id: str
+    label: str = ""
+    created_at: float
+    job_description: str
+    resume: str
+    transcript: str
+    config: dict[str, Any] = Field(default_factory=dict)
+    result: EvaluationResult
+
+
+class JobStatus(BaseModel):
+    job_id: str
+    status: Literal["queued", "running", "succeeded", "failed"]
+    attempts: int = 0
+    created_at: float
+    started_at: float | None = None
+    finished_at: float | None = None
+    error: str | None = None
@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import random
+import re
+import sqlite3
+import struct
+import time
+from contextlib import closing
+from dataclasses import dataclass
+from pathlib import Path
+
+from .storage import connect, data_dir
+
+
+# 64 permutations in 16 bands of 4 rows: pairs with Jaccard ~0.5 collide in some band about
+# half the time, pairs at 0.8+ almost always; candidates are then verified on the signature.
+NUM_PERM = 64
+BANDS = 16
+ROWS = NUM_PERM // BANDS
+_PRIME = (1 << 61) - 1
+_rng = random.Random(0x9A7E1A1)
+_PERMS = [(_rng.randrange(1, _PRIME), _rng.randrange(0, _PRIME)) for _ in range(NUM_PERM)]
+
+_WORD = re.compile(r"[a-z0-9][a-z0-9+#.-]*")
+_MIN_WORDS = 8
+# Hot buckets (boilerplate everyone writes) are capped so a query stays bounded; the newest
+# entries of a bucket are the ones read, so results are the same on every run.
+_MAX_BUCKET_HITS = 64
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS docs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    tenant TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    kind TEXT NOT NULL,
+    text TEXT NOT NULL,
+    sig BLOB NOT NULL,
+    created_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS bands (
+    tenant TEXT NOT NULL,
+    band INTEGER NOT NULL,
+    bucket INTEGER NOT NULL,
+    doc_id INTEGER NOT NULL
+);
+DROP INDEX IF EXISTS bands_lookup;
+CREATE INDEX IF NOT EXISTS bands_bucket_docs ON bands(tenant, band, bucket, doc_id);
+CREATE INDEX IF NOT EXISTS bands_doc ON bands(doc_id);
+CREATE UNIQUE INDEX IF NOT EXISTS docs_unique ON docs(tenant, owner, kind, text);
+"""
+
+
+def _shingles(text: str) -> set[int]:
+    words = _WORD.findall(text.lower())
+    if len(words) < _MIN_WORDS:
+        return set()
+    k = 3 if len(words) < 20 else 5
+    return {
+        int.from_bytes(hashlib.blake2b(" ".join(words[i : i + k]).encode(), digest_size=8).digest(), "little")
+        for i in range(len(words) - k + 1)
+    }
+
+
+def minhash(text: str) -> tuple[int, ...] | None:
+    shingles = _shingles(text)
+    if not shingles:
+        return None
+    return tuple(min((a * s + b) % _PRIME for s in shingles) for a, b in _PERMS)
+
+
+def _bucket(band: int, sig: tuple[int, ...]) -> int:
+    rows = struct.pack(f"<{ROWS}Q", *sig[band * ROWS : (band + 1) * ROWS])
+    return int.from_bytes(hashlib.blake2b(rows, digest_size=8).digest(), "little", signed=True)
+
+
+def similarity(a: tuple[int, ...], b: tuple[int, ...]) -> float:
+    return sum(1 for x, y in zip(a, b) if x == y) / NUM_PERM
+
+
+@dataclass(frozen=True)
+class NearDuplicate:
+    text: str
+    kind: str  # "claim" or "answer"
+    # The other candidate's entry is referenced by id only; its text never leaves the index.
+    match_id: int
+    match_kind: str
+    similarity: float
+
+
+class NearDuplicateIndex:
+    """Persistent MinHash/LSH index of resume claims and candidate answers across evaluations.
+
+    Lookups touch only the LSH buckets a document falls into, so cost does not grow with the
+    number of indexed documents. Storage lives in SQLite, capped at ``max_docs`` (oldest evicted).
+    Blocking; async callers use ``asyncio.to_thread``.
+    """
+
+    def __init__(self, path: Path | str | None = None, *, threshold: float = 0.6, max_docs: int = 500_000) -> None:
+        self.path = Path(path or os.getenv("PANELAI_NEAR_DUP_DB") or data_dir() / "near_dup.sqlite3")
+        self.threshold = threshold
+        self.max_docs = max_docs
+        with closing(connect(self.path)) as conn:
+            conn.executescript(_SCHEMA)
+
+    @classmethod
+    def from_env(cls) -> "NearDuplicateIndex":
+        return cls(
+            threshold=float(os.getenv("PANELAI_NEAR_DUP_THRESHOLD", "0.6") or 0.6),
+            max_docs=int(os.getenv("PANELAI_NEAR_DUP_MAX_DOCS", "500000") or 500_000),
+        )
+
+    def check_and_add(self, *, tenant: str, owner: str, docs: list[tuple[str, str]]) -> list[NearDuplicate]:
+        """Find near-duplicates of ``docs`` ((kind, text) pairs) from other owners, then index them."""
+        signed = [(kind, text, sig) for kind, text in docs if (sig := minhash(text)) is not None]
+        if not signed:
+            return []
+        out: list[NearDuplicate] = []
+        with closing(connect(self.path)) as conn:
+            for kind, text, sig in signed:
+                buckets = [(band, _bucket(band, sig)) for band in range(BANDS)]
+                ids: set[int] = set()
+                for band, bucket in buckets:
+                    rows = conn.execute(
+                        "SELECT doc_id FROM bands WHERE tenant = ? AND band = ? AND bucket = ? ORDER BY doc_id DESC LIMIT ?",
+                        (tenant, band, bucket, _MAX_BUCKET_HITS),
+                    ).fetchall()
+                    ids.update(r[0] for r in rows)
+                best: NearDuplicate | None = None
+                if ids:
+                    marks = ",".join("?" * len(ids))
+                    for row in conn.execute(
+                        f"SELECT id, kind, sig FROM docs WHERE id IN ({marks}) AND owner != ? ORDER BY id DESC", (*ids, owner)
+                    ):
+                        sim = similarity(sig, struct.unpack(f"<{NUM_PERM}Q", row["sig"]))
+                        if sim >= self.threshold and (best is None or sim > best.similarity):
+                            best = NearDuplicate(text, kind, row["id"], row["kind"], round(sim, 3))
+                if best is not None:
+                    out.append(best)
+
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                for kind, text, sig in signed:
+                    cur = conn.execute(
+                        "INSERT OR IGNORE INTO docs (tenant, owner, kind, text, sig, created_at) VALUES (?, ?, ?, ?, ?, ?)",
+                        (tenant, owner, kind, text, struct.pack(f"<{NUM_PERM}Q", *sig), time.time()),
+                    )
+                    if cur.rowcount == 1:
+                        conn.executemany(
+                            "INSERT INTO bands (tenant, band, bucket, doc_id) VALUES (?, ?, ?, ?)",
+                            [(tenant, band, _bucket(band, sig), cur.lastrowid) for band in range(BANDS)],
+                        )
+                self._evict(conn)
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return out
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        # Ids only grow and eviction is oldest-first, so the live range is [max - max_docs, max].
+        (newest,) = conn.execute("SELECT MAX(id) FROM docs").fetchone()
+        cutoff = (newest or 0) - self.max_docs
+        if cutoff > 0 and conn.execute("SELECT 1 FROM docs WHERE id <= ? LIMIT 1", (cutoff,)).fetchone():
+            conn.execute("DELETE FROM bands WHERE doc_id <= ?", (cutoff,))
+            conn.execute("DELETE FROM docs WHERE id <= ?", (cutoff,))
+
+
+_INDEX: NearDuplicateIndex | None = None
+
+
+def get_index() -> NearDuplicateIndex:
+    global _INDEX
+    if _INDEX is None:
+        _INDEX = NearDuplicateIndex.from_env()
+    return _INDEX
+
+
+def enabled(config: dict) -> bool:
+    """Opt-in per request (``config.near_duplicates``) or for every evaluation (``PANELAI_NEAR_DUP=1``)."""
+    value = config.get("near_duplicates")
+    if value is None:
+        return (os.getenv("PANELAI_NEAR_DUP") or "").strip().lower() in {"1", "true", "yes"}
+    return bool(value)
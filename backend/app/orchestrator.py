@@ -1,16 +1,23 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass, replace
 from typing import Any, Literal
 
 from .agents.base import AgentResult, PanelContext
 from .agents.contradictions import ContradictionHunterAgent
 from .agents.gap_analysis import GapAnalysisAgent
 from .agents.judges import CodingJudgeAgent, HiringManagerAgent, SystemsDesignJudgeAgent
+from .agents.memo import get_memo
+from .agents.near_duplicates import NearDuplicateAgent
 from .agents.resume_claims import ResumeClaimsAgent
-from .agents.transcript_evidence import TranscriptEvidenceAgent, _best_evidence
-from .models import AgentMessage, DimensionScore, Discrepancy, EvaluationResult
+from .agents.transcript_evidence import TranscriptEvidenceAgent, _best_evidence_index, _tokenize
+from .delta import assign_ids, discrepancy_key
+from .evidence import apply_evidence_mode, chunk_span, evidence_mode, to_evidence_span
+from .limits import cap_inputs
+from .llm.usage import get_tenant_budgets, new_ledger
+from .traces import get_trace_store, trace_level, trace_view
+from .models import AgentMessage, DimensionScore, Discrepancy, EvaluationResult, EvidenceSpan
 
 
 Verdict = Literal["hire", "no-hire", "lean-hire", "lean-no-hire"]
@@ -55,14 +62,24 @@ def _weighted_consensus(votes: list[tuple[Verdict, float, str, int]]) -> tuple[V
     return "lean-no-hire", " | ".join(reasons)
 
 
-async def run_panel(*, ctx: PanelContext) -> EvaluationResult:
+async def run_panel(*, ctx: PanelContext, seed: dict[str, AgentResult] | None = None) -> EvaluationResult:
+    """Run the full panel. Analysis agents named in ``seed`` are not run; their given results are used.
+
+    ``seed`` is how a live-assist session is finalized: the results assist already computed for the
+    same inputs carry over, and only the remaining analysis, panel, consensus and cross-exam run.
+    """
     config = PanelConfig(cross_exam_rounds=int(ctx.config.get("cross_exam_rounds", 1)))
+    ctx, truncated = cap_inputs(ctx)
+    if ctx.usage is None:
+        ctx = replace(ctx, usage=new_ledger(config=ctx.config or {}, tenant=ctx.tenant))
+    usage = ctx.usage
 
     analysis_agents = [
         ResumeClaimsAgent(),
         TranscriptEvidenceAgent(),
         GapAnalysisAgent(),
         ContradictionHunterAgent(),
+        NearDuplicateAgent(),
     ]
 
     panel_agents = [
@@ -75,25 +92,50 @@ async def run_panel(*, ctx: PanelContext) -> EvaluationResult:
     results: dict[str, AgentResult] = {}
 
     async def _run_agent(*, agent, run_ctx: PanelContext, stage: str) -> None:
+        seeded = (seed or {}).get(agent.name) if stage == "analysis" else None
         trace.append(AgentMessage(agent=agent.name, stage=stage, content="Running"))
-        res = await agent.run(run_ctx)
+        if seeded is not None:
+            res, cached = seeded, False
+        else:
+            res, cached = await get_memo().run(agent, replace(run_ctx, stage=stage))
         results[agent.name] = res
-        trace.append(
-            AgentMessage(agent=agent.name, stage=stage, content="Completed", meta={"artifacts_keys": list(res.artifacts.keys())})
-        )
+        meta: dict[str, Any] = {"artifacts_keys": list(res.artifacts.keys())}
+        if cached:
+            meta["memo"] = "hit"
+        if seeded is not None:
+            meta["seeded"] = True
+        trace.append(AgentMessage(agent=agent.name, stage=stage, content="Completed", meta=meta))
+        # Event payloads are only built when a streaming consumer is attached.
+        if run_ctx.on_event is None:
+            return
+        if stage == "analysis":
+            await run_ctx.emit("finding", {"agent": agent.name, "findings": [asdict(f) for f in res.findings]})
+        elif stage == "panel":
+            await run_ctx.emit(
+                "vote",
+                {
+                    "agent": agent.name,
+                    "vote": asdict(res.vote) if res.vote is not None else None,
+                    "scores": [asdict(s) for s in res.scores],
+                },
+            )
 
     # Phase 1: analysis (parallelizable)
     await asyncio.gather(*[_run_agent(agent=a, run_ctx=ctx, stage="analysis") for a in analysis_agents])
 
     claims = results["resume-claims"].artifacts.get("claims", [])
     chunks = results["transcript-evidence"].artifacts.get("chunks", [])
+    chunk_spans = results["transcript-evidence"].artifacts.get("chunk_spans", [])
+    ev_mode = evidence_mode(ctx.config)
 
-    weak_claims: list[tuple[str, str, float]] = []
+    weak_claims: list[tuple[str, str, float, EvidenceSpan | None]] = []
     if isinstance(claims, list) and isinstance(chunks, list):
+        chunk_texts = [str(x) for x in chunks]
+        chunk_tokens = [_tokenize(ch) for ch in chunk_texts]
         for c in claims[:20]:
-            ev, score = _best_evidence(str(c), [str(x) for x in chunks])
+            idx, score = _best_evidence_index(str(c), chunk_texts, chunk_tokens)
             if score < 0.22:
-                weak_claims.append((str(c), ev, score))
+                weak_claims.append((str(c), chunk_texts[idx] if idx >= 0 else "", score, chunk_span(chunk_spans, idx)))
 
     # Build discrepancy list: start from contradiction findings + claim evidence mismatches
     discrepancies: list[Discrepancy] = []
@@ -107,10 +149,23 @@ async def run_panel(*, ctx: PanelContext) -> EvaluationResult:
                 claim=f.claim or "(unspecified)",
                 evidence=f.evidence or "",
                 explanation=f.explanation or f.summary,
+                evidence_span=to_evidence_span(f.evidence_span),
+            )
+        )
+
+    for f in results["near-duplicates"].findings:
+        discrepancies.append(
+            Discrepancy(
+                severity=f.severity,
+                category=f.category,
+                claim=f.claim or f.summary,
+                evidence=f.evidence or "",
+                explanation=f.explanation or f.summary,
+                evidence_span=to_evidence_span(f.evidence_span),
             )
         )
 
-    for c, ev, score in weak_claims[:10]:
+    for c, ev, score, span in weak_claims[:10]:
         discrepancies.append(
             Discrepancy(
                 severity="medium" if score > 0.12 else "high",
@@ -121,6 +176,7 @@ async def run_panel(*, ctx: PanelContext) -> EvaluationResult:
                     "Resume claim has weak supporting evidence in the interview transcript. "
                     "This may be acceptable if the interview did not cover it, but it increases risk."
                 ),
+                evidence_span=span,
             )
         )
 
@@ -137,6 +193,8 @@ async def run_panel(*, ctx: PanelContext) -> EvaluationResult:
     except Exception:
         coverage_ratio = 0.0
 
+    assign_ids(discrepancies, discrepancy_key)
+
     contradiction_count = len(results["contradiction-hunter"].findings)
     high_discrepancy_count = sum(1 for d in discrepancies if d.severity == "high")
 
@@ -145,19 +203,18 @@ async def run_panel(*, ctx: PanelContext) -> EvaluationResult:
         "gaps_count": len(gaps) if isinstance(gaps, list) else 0,
         "covered_count": len(covered) if isinstance(covered, list) else 0,
         "coverage_ratio": coverage_ratio,
+        "coverage_score": gap_art.get("coverage_score", 0.0) if isinstance(gap_art, dict) else 0.0,
         "top_gaps": gaps[:6] if isinstance(gaps, list) else [],
         "contradiction_count": contradiction_count,
+        "near_duplicate_count": len(results["near-duplicates"].findings),
         "weak_claims_count": len(weak_claims),
         "high_discrepancy_count": high_discrepancy_count,
         "discrepancy_count": len(discrepancies),
     }
 
-    panel_ctx = PanelContext(
-        job_description=ctx.job_description,
-        resume=ctx.resume,
-        transcript=ctx.transcript,
-        config={**(ctx.config or {}), "panelai_signals": derived_signals},
-    )
+    await ctx.emit("signals", derived_signals)
+
+    panel_ctx = replace(ctx, config={**(ctx.config or {}), "panelai_signals": derived_signals})
 
     # Phase 2: panel votes (parallelizable)
     await asyncio.gather(*[_run_agent(agent=a, run_ctx=panel_ctx, stage="panel") for a in panel_agents])
@@ -166,22 +223,40 @@ async def run_panel(*, ctx: PanelContext) -> EvaluationResult:
     if config.cross_exam_rounds > 0 and discrepancies:
         top = sorted(discrepancies, key=lambda d: {"high": 0, "medium": 1, "low": 2}[d.severity])[:5]
         for round_idx in range(config.cross_exam_rounds):
+            stage = f"cross-exam-{round_idx+1}"
+            exam_ctx = replace(panel_ctx, stage=stage)
             for d in top:
+                if usage.exhausted:
+                    break
                 challenge = (
                     f"Discrepancy ({d.severity}) in {d.category}: claim='{d.claim}'. "
                     f"Evidence: {d.evidence[:240]}"
                 )
                 for agent in (SystemsDesignJudgeAgent(), CodingJudgeAgent(), HiringManagerAgent()):
-                    trace.append(AgentMessage(agent=agent.name, stage=f"cross-exam-{round_idx+1}", content=challenge))
-                    response = await agent.respond_to_challenge(panel_ctx, challenge)
+                    trace.append(AgentMessage(agent=agent.name, stage=stage, content=challenge))
+                    response = await agent.respond_to_challenge(exam_ctx, challenge)
                     trace.append(
                         AgentMessage(
                             agent=agent.name,
-                            stage=f"cross-exam-{round_idx+1}",
+                            stage=stage,
                             content=response,
                             meta={"target_discrepancy": d.category},
                         )
                     )
+                    await ctx.emit(
+                        "cross_exam",
+                        {"agent": agent.name, "stage": stage, "challenge": challenge, "response": response},
+                    )
+            if usage.exhausted:
+                trace.append(
+                    AgentMessage(
+                        agent="orchestrator",
+                        stage=stage,
+                        content="Token budget exhausted; remaining cross-exam skipped.",
+                        meta=usage.summary(),
+                    )
+                )
+                break
 
     # Consolidate scores
     scores: list[DimensionScore] = []
@@ -231,9 +306,24 @@ async def run_panel(*, ctx: PanelContext) -> EvaluationResult:
 
     artifacts: dict[str, Any] = {
         "votes": [{"verdict": v, "confidence": c, "reason": r, "weight": w} for (v, c, r, w) in votes],
-        "weak_claims": [{"claim": c, "score": s, "evidence": ev} for (c, ev, s) in weak_claims],
+        "weak_claims": [
+            {
+                "claim": c,
+                "score": s,
+                "evidence": "" if ev_mode == "span" and span is not None else ev,
+                "evidence_span": span.model_dump() if span is not None and ev_mode != "text" else None,
+            }
+            for (c, ev, s, span) in weak_claims
+        ],
         "signals": derived_signals,
+        "gaps": gaps if isinstance(gaps, list) else [],
+        "usage": usage.summary(),
     }
+    if truncated:
+        artifacts["truncated"] = truncated
+    if seed:
+        artifacts["seeded_agents"] = sorted(name for name in seed if name in {a.name for a in analysis_agents})
+    get_tenant_budgets().charge(ctx.tenant, usage.total.total_tokens)
 
     # Ensure minimal output lists
     if not strengths:
@@ -244,7 +334,14 @@ async def run_panel(*, ctx: PanelContext) -> EvaluationResult:
             "Walk through a system you designed: tradeoffs, scaling, and failure modes.",
         ]
 
-    return EvaluationResult(
+    apply_evidence_mode(discrepancies, ev_mode)
+
+    level = trace_level(ctx.config)
+    if level != "full" and ctx.config.get("store_trace", True):
+        # Keep the full trace server-side; the response carries a summary (or nothing) and the id.
+        artifacts["trace_id"] = await asyncio.to_thread(get_trace_store().save, tenant=ctx.tenant, trace=trace)
+
+    result = EvaluationResult(
         verdict=verdict,
         overall_reasoning=overall_reasoning,
         scores=scores,
@@ -252,6 +349,9 @@ async def run_panel(*, ctx: PanelContext) -> EvaluationResult:
         strengths=strengths[:8],
         risks=risks[:8],
         next_interview_questions=questions[:10],
-        trace=trace,
+        trace=trace_view(trace, level),
         artifacts=artifacts,
     )
+    if ctx.on_event is not None:
+        await ctx.emit("verdict", result.model_dump())
+    return result
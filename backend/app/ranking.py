@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import os
+from concurrent.futures import Executor
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .agents.gap_analysis import JDProfile, candidate_terms
+from .agents.resume_claims import _extract_resume_claims
+from .agents.transcript_evidence import _best_evidence_index, _chunk_transcript, _tokenize
+from .limits import cap_text, get_input_limits
+from .models import RankCandidate, RankedCandidate
+
+if TYPE_CHECKING:
+    from concurrent.futures import ProcessPoolExecutor
+
+
+# Weak-claim threshold used by the panel (see orchestrator); claims scoring below it are unsupported.
+_EVIDENCE_THRESHOLD = 0.22
+_COVERAGE_WEIGHT = 0.7
+# Below this many candidates a process pool costs more (startup, pickling) than it saves.
+_PARALLEL_MIN = 64
+
+
+@dataclass(frozen=True)
+class _Scored:
+    id: str
+    score: float
+    coverage_ratio: float
+    evidence_ratio: float
+    covered: list[str]
+    gaps: list[str]
+
+
+def _score_one(profile: JDProfile, candidate_id: str, resume: str, transcript: str) -> _Scored:
+    limits = get_input_limits()
+    resume, transcript = cap_text(resume, limits.resume), cap_text(transcript, limits.transcript)
+    cov = profile.coverage(candidate_terms(resume, transcript))
+    covered, gaps, coverage = cov.covered, cov.gaps, cov.ratio
+
+    claims = _extract_resume_claims(resume)[:20]
+    chunks = _chunk_transcript(transcript)
+    chunk_tokens = [_tokenize(ch) for ch in chunks]
+    supported = sum(1 for c in claims if _best_evidence_index(c, chunks, chunk_tokens)[1] >= _EVIDENCE_THRESHOLD)
+    evidence = supported / len(claims) if claims else 0.0
+
+    score = _COVERAGE_WEIGHT * coverage + (1 - _COVERAGE_WEIGHT) * evidence
+    return _Scored(candidate_id, round(score, 4), round(coverage, 4), round(evidence, 4), covered, gaps)
+
+
+def _score_batch(profile: JDProfile, batch: list[tuple[str, str, str]]) -> list[_Scored]:
+    return [_score_one(profile, cid, resume, transcript) for cid, resume, transcript in batch]
+
+
+_POOL: ProcessPoolExecutor | None = None
+
+
+def _workers() -> int:
+    return int(os.getenv("PANELAI_RANK_WORKERS", "") or min(8, os.cpu_count() or 1))
+
+
+def _pool() -> Executor | None:
+    global _POOL
+    if _workers() <= 1:
+        return None
+    if _POOL is None:
+        # Imported here: the multiprocessing machinery is only needed once a large batch is ranked.
+        from concurrent.futures import ProcessPoolExecutor
+
+        _POOL = ProcessPoolExecutor(max_workers=_workers())
+    return _POOL
+
+
+def shutdown_pool() -> None:
+    global _POOL
+    if _POOL is not None:
+        _POOL.shutdown(cancel_futures=True)
+        _POOL = None
+
+
+def rank_candidates(profile: JDProfile, candidates: list[RankCandidate]) -> list[RankedCandidate]:
+    """Score every candidate against one compiled JD (coverage + claim evidence), best first.
+
+    Blocking and CPU-bound: large batches are split across a shared process pool
+    (``PANELAI_RANK_WORKERS``), small ones are scored inline.
+    """
+    items = [(c.id, c.resume, c.transcript) for c in candidates]
+    pool = _pool() if len(items) >= _PARALLEL_MIN else None
+    if pool is None:
+        scored = _score_batch(profile, items)
+    else:
+        size = max(16, len(items) // (4 * _workers()) + 1)
+        batches = [items[i : i + size] for i in range(0, len(items), size)]
+        scored = [s for part in pool.map(_score_batch, [profile] * len(batches), batches) for s in part]
+
+    # Stable on ties: input order decides.
+    scored.sort(key=lambda s: -s.score)
+    return [
+        RankedCandidate(
+            id=s.id,
+            rank=i + 1,
+            score=s.score,
+            coverage_ratio=s.coverage_ratio,
+            evidence_ratio=s.evidence_ratio,
+            covered=s.covered,
+            gaps=s.gaps,
+        )
+        for i, s in enumerate(scored)
+    ]
@@ -0,0 +1,134 @@
+from __future__ import annotations
+
+import asyncio
+import gzip
+import os
+from typing import Any
+
+from pydantic import BaseModel
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.responses import Response
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+try:  # optional: enables "br" content encoding
+    import brotli
+except ImportError:  # pragma: no cover - depends on the environment
+    brotli = None  # type: ignore[assignment]
+
+
+def dump_json(model: BaseModel) -> bytes:
+    """Compact UTF-8 JSON for a model we built ourselves (no re-validation, no ``jsonable_encoder``)."""
+    return model.model_dump_json().encode("utf-8")
+
+
+def model_response(model: BaseModel, *, status_code: int = 200, headers: dict[str, str] | None = None) -> Response:
+    """Serialize a trusted response model directly.
+
+    Routes keep ``response_model=`` for the schema, but returning a ``Response`` skips FastAPI's
+    validate-then-encode pass, which dominates serialization time for results with large traces.
+    """
+    return Response(content=dump_json(model), status_code=status_code, headers=headers, media_type="application/json")
+
+
+def _accepted(accept_encoding: str) -> dict[str, float]:
+    out: dict[str, float] = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        for p in params.split(";"):
+            key, _, value = p.strip().partition("=")
+            if key == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        if name:
+            out[name.strip().lower()] = q
+    return out
+
+
+def negotiate_encoding(accept_encoding: str) -> str | None:
+    """``br`` (when available) or ``gzip``, whichever the client accepts; ``None`` for identity."""
+    accepted = _accepted(accept_encoding)
+    wildcard = accepted.get("*", 0.0)
+    candidates = (["br"] if brotli is not None else []) + ["gzip"]
+    best = max(candidates, key=lambda enc: accepted.get(enc, wildcard), default=None)
+    return best if best is not None and accepted.get(best, wildcard) > 0 else None
+
+
+def compress(body: bytes, encoding: str, *, gzip_level: int = 6, brotli_quality: int = 5) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=brotli_quality)
+    return gzip.compress(body, compresslevel=gzip_level, mtime=0)
+
+
+# Bodies this large take milliseconds to compress; do it off the event loop.
+_OFFLOAD_BYTES = 256 * 1024
+
+
+class CompressionMiddleware:
+    """Negotiated gzip/brotli for complete responses of at least ``minimum_size`` bytes.
+
+    Streamed responses (SSE, anything sent in several body messages) pass through untouched so
+    events are never held back for buffering.
+    """
+
+    def __init__(self, app: ASGIApp, *, minimum_size: int = 1024, gzip_level: int = 6, brotli_quality: int = 5) -> None:
+        self.app = app
+        self.minimum_size = minimum_size
+        self.gzip_level = gzip_level
+        self.brotli_quality = brotli_quality
+
+    @classmethod
+    def options_from_env(cls) -> dict[str, Any]:
+        return {
+            "minimum_size": int(os.getenv("PANELAI_COMPRESS_MIN_BYTES") or 1024),
+            "gzip_level": int(os.getenv("PANELAI_GZIP_LEVEL") or 6),
+            "brotli_quality": int(os.getenv("PANELAI_BROTLI_QUALITY") or 5),
+        }
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or self.minimum_size <= 0:
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding", ""))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start: Message | None = None
+        passthrough = False
+
+        async def _send(message: Message) -> None:
+            nonlocal start, passthrough
+            if message["type"] == "http.response.start":
+                start = message  # held until we know whether the body gets compressed
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+            assert start is not None
+            body: bytes = message.get("body", b"")
+            headers = MutableHeaders(raw=start["headers"])
+            if (
+                message.get("more_body", False)
+                or len(body) < self.minimum_size
+                or "content-encoding" in headers
+                or headers.get("content-type", "").startswith("text/event-stream")
+            ):
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+            level = {"gzip_level": self.gzip_level, "brotli_quality": self.brotli_quality}
+            if len(body) >= _OFFLOAD_BYTES:
+                body = await asyncio.to_thread(compress, body, encoding, **level)
+            else:
+                body = compress(body, encoding, **level)
+            headers["Content-Encoding"] = encoding
+            headers["Content-Length"] = str(len(body))
+            headers.add_vary_header("Accept-Encoding")
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, _send)
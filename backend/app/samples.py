@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from pathlib import Path
+
+SAMPLE_FILES = ("job_description.md", "resume.md", "transcript.md")
+
+# (mtime_ns, size) of each sample file; any edit changes it.
+Stamp = tuple[tuple[int, int], ...]
+
+
+@dataclass(frozen=True)
+class SampleEntry:
+    id: str
+    title: str
+    candidate: str
+    bytes: int
+    updated_at: float
+    stamp: Stamp
+
+    @property
+    def etag(self) -> str:
+        return hashlib.sha1(f"{self.id}:{self.stamp}".encode()).hexdigest()[:20]
+
+
+def _stamp(d: Path) -> Stamp | None:
+    try:
+        stats = [(d / name).stat() for name in SAMPLE_FILES]
+    except OSError:
+        return None
+    return tuple((st.st_mtime_ns, st.st_size) for st in stats)
+
+
+def _heading(path: Path) -> str:
+    """First non-empty line without markdown heading marks or a leading "Job Description —"-style label."""
+    try:
+        with path.open(encoding="utf-8", errors="replace") as f:
+            for line in f:
+                text = line.strip().lstrip("#").strip()
+                if text:
+                    label, sep, rest = text.partition(" — ")
+                    return rest.strip() if sep and label.lower() in ("job description", "candidate", "resume") else text[:120]
+    except OSError:
+        pass
+    return ""
+
+
+class SampleCatalog:
+    """In-memory index of the sample corpus under ``root`` (one directory per sample).
+
+    Listings are metadata only. The directory is rescanned when its mtime changes (samples added
+    or removed) or at most every ``rescan_s`` seconds (files edited in place); a rescan only
+    re-reads headings of samples whose files changed. Content is read per sample on demand and
+    cached until the sample's files change.
+    """
+
+    def __init__(self, root: Path, *, rescan_s: float = 30.0, content_cache: int = 128) -> None:
+        self.root = root
+        self.rescan_s = rescan_s
+        self.content_cache = content_cache
+        self._lock = threading.Lock()
+        self._entries: list[SampleEntry] = []
+        self._by_id: dict[str, SampleEntry] = {}
+        self._root_mtime: int | None = None
+        self._scanned_at = 0.0
+        self._version = ""
+        self._content: OrderedDict[str, tuple[Stamp, dict[str, str]]] = OrderedDict()
+
+    @classmethod
+    def from_env(cls, root: Path) -> "SampleCatalog":
+        return cls(
+            root,
+            rescan_s=float(os.getenv("PANELAI_SAMPLES_RESCAN_S") or 30),
+            content_cache=int(os.getenv("PANELAI_SAMPLES_CACHE") or 128),
+        )
+
+    def _refresh(self) -> None:
+        try:
+            root_mtime = self.root.stat().st_mtime_ns
+        except OSError:
+            root_mtime = None
+        now = time.monotonic()
+        if root_mtime == self._root_mtime and now - self._scanned_at < self.rescan_s:
+            return
+        entries: list[SampleEntry] = []
+        if root_mtime is not None:
+            for d in sorted(self.root.iterdir()):
+                if not d.is_dir():
+                    continue
+                stamp = _stamp(d)
+                if stamp is None:
+                    continue
+                old = self._by_id.get(d.name)
+                if old is not None and old.stamp == stamp:
+                    entries.append(old)
+                    continue
+                entries.append(
+                    SampleEntry(
+                        id=d.name,
+                        title=_heading(d / "job_description.md"),
+                        candidate=_heading(d / "resume.md"),
+                        bytes=sum(size for _, size in stamp),
+                        updated_at=max(mtime for mtime, _ in stamp) / 1e9,
+                        stamp=stamp,
+                    )
+                )
+        self._entries = entries
+        self._by_id = {e.id: e for e in entries}
+        self._root_mtime = root_mtime
+        self._scanned_at = now
+        self._version = hashlib.sha1("\n".join(f"{e.id}:{e.stamp}" for e in entries).encode()).hexdigest()[:20]
+
+    def list(self, *, q: str = "", offset: int = 0, limit: int = 50) -> tuple[list[SampleEntry], int, str]:
+        """One page of entries (sorted by id), the total matching, and an ETag for this page."""
+        with self._lock:
+            self._refresh()
+            entries, version = self._entries, self._version
+        needle = q.strip().lower()
+        if needle:
+            entries = [e for e in entries if needle in e.id.lower() or needle in e.title.lower() or needle in e.candidate.lower()]
+        etag = hashlib.sha1(f"{version}:{needle}:{offset}:{limit}".encode()).hexdigest()[:20]
+        return entries[offset : offset + limit], len(entries), etag
+
+    def entry(self, sample_id: str) -> SampleEntry | None:
+        """The current entry for ``sample_id``, re-stamped so in-place edits show up immediately."""
+        with self._lock:
+            self._refresh()
+            entry = self._by_id.get(sample_id)
+        if entry is None:
+            return None
+        stamp = _stamp(self.root / sample_id)
+        if stamp is None:
+            return None
+        if stamp != entry.stamp:
+            with self._lock:
+                self._scanned_at = 0.0  # metadata is stale; rescan on next access
+                self._refresh()
+                entry = self._by_id.get(sample_id)
+        return entry
+
+    def content(self, entry: SampleEntry) -> dict[str, str]:
+        with self._lock:
+            hit = self._content.get(entry.id)
+            if hit is not None and hit[0] == entry.stamp:
+                self._content.move_to_end(entry.id)
+                return hit[1]
+        d = self.root / entry.id
+        data = {"id": entry.id, **{name.removesuffix(".md"): (d / name).read_text(encoding="utf-8") for name in SAMPLE_FILES}}
+        with self._lock:
+            self._content[entry.id] = (entry.stamp, data)
+            self._content.move_to_end(entry.id)
+            while len(self._content) > self.content_cache:
+                self._content.popitem(last=False)
+        return data
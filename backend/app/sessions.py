@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, field, replace
+from typing import Any, Awaitable, Callable
+
+from .agents.base import AgentResult, PanelContext
+from .models import AssistResult
+
+
+def inputs_key(*parts: Any) -> str:
+    h = hashlib.sha256()
+    for part in parts:
+        data = part if isinstance(part, str) else json.dumps(part, sort_keys=True, default=str)
+        h.update(data.encode("utf-8", "replace"))
+        h.update(b"\x00")
+    return h.hexdigest()
+
+
+@dataclass
+class _Flight:
+    version: int
+    key: str
+    task: asyncio.Task[AssistResult]
+    waiters: int = 0
+
+    @property
+    def reusable(self) -> bool:
+        # A finished flight can only be shared if it produced a result.
+        return not self.task.done() or (not self.task.cancelled() and self.task.exception() is None)
+
+
+@dataclass(frozen=True)
+class SessionAnalysis:
+    """The analysis-phase results of a session's latest completed assist run, and what they were computed from."""
+
+    version: int | None
+    ctx: PanelContext
+    results: dict[str, AgentResult]
+
+
+@dataclass
+class AssistSession:
+    session_id: str
+    last_seen: float = field(default_factory=time.monotonic)
+    flight: _Flight | None = None
+    analysis: SessionAnalysis | None = None
+
+
+class AssistSessions:
+    """Per-session single-flight for live assist: the newest transcript version wins.
+
+    - A request with the same inputs as the in-flight (or last) run joins it.
+    - A request older than the in-flight version joins the newer run instead of computing.
+    - A newer request cancels the in-flight run; its waiters follow the new run.
+    - When every waiter of a run has gone away (client disconnects), the run is cancelled.
+    """
+
+    def __init__(self, *, max_sessions: int = 1000, ttl_s: float = 3600.0) -> None:
+        self.max_sessions = max_sessions
+        self.ttl_s = ttl_s
+        self._sessions: OrderedDict[str, AssistSession] = OrderedDict()
+
+    @classmethod
+    def from_env(cls) -> "AssistSessions":
+        return cls(
+            max_sessions=int(os.getenv("PANELAI_ASSIST_SESSIONS", "1000") or 1000),
+            ttl_s=float(os.getenv("PANELAI_ASSIST_SESSION_TTL_S", "3600") or 3600),
+        )
+
+    def get(self, session_id: str) -> AssistSession:
+        now = time.monotonic()
+        session = self._sessions.pop(session_id, None) or AssistSession(session_id=session_id)
+        session.last_seen = now
+        self._sessions[session_id] = session
+        # Evict idle sessions (oldest first), never ones with a run in progress.
+        while self._sessions:
+            oldest = next(iter(self._sessions.values()))
+            busy = oldest.flight is not None and not oldest.flight.task.done()
+            expired = now - oldest.last_seen > self.ttl_s
+            if oldest is session or busy or not (expired or len(self._sessions) > self.max_sessions):
+                break
+            self._sessions.popitem(last=False)
+        return session
+
+    def record(self, session_id: str, analysis: SessionAnalysis) -> None:
+        """Keep ``analysis`` as the session's latest, unless a newer transcript version is already recorded."""
+        session = self.get(session_id)
+        current = session.analysis
+        if current is not None and None not in (current.version, analysis.version) and current.version > analysis.version:
+            return
+        session.analysis = analysis
+
+    async def latest_analysis(self, session_id: str) -> SessionAnalysis | None:
+        """The session's latest analysis, after any run still in flight has settled.
+
+        Waiting never cancels the run: finalizing must not cost the live client its update.
+        """
+        session = self._sessions.get(session_id)
+        if session is None:
+            return None
+        session.last_seen = time.monotonic()
+        while session.flight is not None and not session.flight.task.done():
+            await asyncio.wait({session.flight.task})
+        return session.analysis
+
+    async def run(
+        self,
+        session_id: str,
+        *,
+        version: int | None,
+        key: str,
+        compute: Callable[[], Awaitable[AssistResult]],
+    ) -> AssistResult:
+        session = self.get(session_id)
+        flight = session.flight
+        stale = flight is not None and version is not None and version < flight.version
+        if flight is None or not flight.reusable or (flight.key != key and not stale):
+            if flight is not None and not flight.task.done():
+                flight.task.cancel()
+            next_version = version if version is not None else (flight.version + 1 if flight else 0)
+            flight = _Flight(version=next_version, key=key, task=asyncio.create_task(compute()))
+            session.flight = flight
+        elif version is not None and version > flight.version:
+            # Same inputs under a newer version: the run answers for that version too.
+            flight.version = version
+
+        while True:
+            flight.waiters += 1
+            try:
+                await asyncio.wait({flight.task})
+            except asyncio.CancelledError:
+                flight.waiters -= 1
+                if flight.waiters == 0 and not flight.task.done():
+                    flight.task.cancel()
+                raise
+            flight.waiters -= 1
+            if flight.task.cancelled() and session.flight is not None and session.flight is not flight:
+                # Superseded by a newer transcript: answer with the newest analysis instead.
+                flight = session.flight
+                continue
+            result = flight.task.result()
+            analysis = session.analysis
+            if session.flight is flight and analysis is not None and analysis.version is not None:
+                if analysis.version < flight.version:
+                    session.analysis = replace(analysis, version=flight.version)
+            return result
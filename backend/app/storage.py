@@ -0,0 +1,24 @@
+from __future__ import annotations
+
+import os
+import sqlite3
+from pathlib import Path
+
+
+WORKSPACE_ROOT = Path(__file__).resolve().parents[2]
+
+
+def data_dir() -> Path:
+    """Directory for PanelAI's local state (job queue, stores, indexes)."""
+    root = Path(os.getenv("PANELAI_DATA_DIR") or WORKSPACE_ROOT / ".panelai")
+    root.mkdir(parents=True, exist_ok=True)
+    return root
+
+
+def connect(path: Path | str) -> sqlite3.Connection:
+    # Short-lived connections, WAL so readers never block the writer across workers/processes.
+    conn = sqlite3.connect(str(path), timeout=30.0, isolation_level=None)
+    conn.row_factory = sqlite3.Row
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.execute("PRAGMA synchronous=NORMAL")
+    return conn
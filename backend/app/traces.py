@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+import uuid
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Literal
+
+from .models import AgentMessage
+from .storage import connect, data_dir
+
+
+TraceLevel = Literal["none", "summary", "full"]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS traces (
+    id TEXT PRIMARY KEY,
+    tenant TEXT NOT NULL,
+    created_at REAL NOT NULL,
+    trace TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS traces_created ON traces(created_at);
+"""
+
+_SUMMARY_CHARS = 200
+
+
+def trace_level(config: dict[str, Any]) -> TraceLevel:
+    """``config.trace`` (none/summary/full), else PANELAI_TRACE, else ``summary``."""
+    value = str(config.get("trace") or os.getenv("PANELAI_TRACE") or "summary").strip().lower()
+    return value if value in ("none", "summary", "full") else "summary"  # type: ignore[return-value]
+
+
+def summarize_trace(trace: list[AgentMessage]) -> list[AgentMessage]:
+    """One line per agent run plus truncated cross-exam answers and orchestrator notes."""
+    out: list[AgentMessage] = []
+    for m in trace:
+        if m.content == "Running":
+            continue
+        if m.stage.startswith("cross-exam") and m.agent != "orchestrator":
+            if "target_discrepancy" not in m.meta:
+                continue  # the challenge text; its answer carries the target
+            content = m.content if len(m.content) <= _SUMMARY_CHARS else m.content[: _SUMMARY_CHARS - 1] + "…"
+            out.append(AgentMessage(agent=m.agent, stage=m.stage, content=content, meta=m.meta))
+            continue
+        out.append(m)
+    return out
+
+
+def trace_view(trace: list[AgentMessage], level: TraceLevel) -> list[AgentMessage]:
+    if level == "full":
+        return trace
+    if level == "none":
+        return []
+    return summarize_trace(trace)
+
+
+class TraceStore:
+    """Full panel traces kept server-side so responses can carry a summary (or nothing) plus an id.
+
+    Blocking; async callers use ``asyncio.to_thread``. Traces older than ``retention_s`` are purged,
+    and beyond ``max_rows`` (0 = no cap) the oldest are evicted on every save.
+    """
+
+    def __init__(
+        self, path: Path | str | None = None, *, retention_s: float = 7 * 86400, max_rows: int = 50_000
+    ) -> None:
+        self.path = Path(path or os.getenv("PANELAI_TRACE_DB") or data_dir() / "traces.sqlite3")
+        self.retention_s = retention_s
+        self.max_rows = max_rows
+        self._last_purge = 0.0
+        with closing(connect(self.path)) as conn:
+            conn.executescript(_SCHEMA)
+
+    @classmethod
+    def from_env(cls) -> "TraceStore":
+        return cls(
+            retention_s=float(os.getenv("PANELAI_TRACE_RETENTION_S", "") or 7 * 86400),
+            max_rows=int(os.getenv("PANELAI_TRACE_MAX_ROWS", "") or 50_000),
+        )
+
+    def save(self, *, tenant: str, trace: list[AgentMessage]) -> str:
+        trace_id = uuid.uuid4().hex
+        now = time.time()
+        payload = json.dumps([m.model_dump() for m in trace])
+        with closing(connect(self.path)) as conn:
+            conn.execute(
+                "INSERT INTO traces (id, tenant, created_at, trace) VALUES (?, ?, ?, ?)", (trace_id, tenant, now, payload)
+            )
+            if self.max_rows > 0:
+                # Rowids only grow and eviction is oldest-first, so the live range is [max - max_rows, max].
+                conn.execute("DELETE FROM traces WHERE rowid <= (SELECT MAX(rowid) FROM traces) - ?", (self.max_rows,))
+            if now - self._last_purge > 3600:
+                self._last_purge = now
+                conn.execute("DELETE FROM traces WHERE created_at < ?", (now - self.retention_s,))
+        return trace_id
+
+    def get(self, tenant: str, trace_id: str) -> str | None:
+        """The stored trace as a JSON array, or None."""
+        with closing(connect(self.path)) as conn:
+            row = conn.execute("SELECT trace FROM traces WHERE id = ? AND tenant = ?", (trace_id, tenant)).fetchone()
+        return row["trace"] if row else None
+
+
+_TRACES: TraceStore | None = None
+
+
+def get_trace_store() -> TraceStore:
+    global _TRACES
+    if _TRACES is None:
+        _TRACES = TraceStore.from_env()
+    return _TRACES
@@ -0,0 +1,192 @@
+from __future__ import annotations
+
+import codecs
+import json
+import os
+from dataclasses import dataclass, field
+from typing import Callable
+
+from fastapi import HTTPException, UploadFile
+from starlette.datastructures import Headers
+from starlette.formparsers import multipart, parse_options_header
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+CHUNK_BYTES = 64 * 1024
+
+
+@dataclass(frozen=True)
+class UploadLimits:
+    max_file_bytes: int = 2 * 1024 * 1024
+    max_request_bytes: int = 6 * 1024 * 1024
+
+    @classmethod
+    def from_env(cls) -> "UploadLimits":
+        return cls(
+            max_file_bytes=int(os.getenv("PANELAI_UPLOAD_MAX_FILE_BYTES") or cls.max_file_bytes),
+            max_request_bytes=int(os.getenv("PANELAI_UPLOAD_MAX_REQUEST_BYTES") or cls.max_request_bytes),
+        )
+
+
+@dataclass
+class UploadBudget:
+    """Bytes still allowed across all files of one request."""
+
+    limits: UploadLimits
+    used: int = field(default=0)
+
+    def take(self, name: str, n: int, file_total: int) -> None:
+        self.used += n
+        if file_total > self.limits.max_file_bytes:
+            raise _too_large(f"{name} exceeds {self.limits.max_file_bytes} bytes")
+        if self.used > self.limits.max_request_bytes:
+            raise _too_large(f"Uploads exceed {self.limits.max_request_bytes} bytes in total")
+
+
+def _too_large(detail: str) -> HTTPException:
+    return HTTPException(status_code=413, detail=detail)
+
+
+async def read_upload_text(
+    upload: UploadFile,
+    budget: UploadBudget,
+    *,
+    on_text: Callable[[str], None] | None = None,
+) -> str:
+    """Read an upload in chunks, decoding UTF-8 incrementally, within the request's byte budget.
+
+    With ``on_text`` each decoded piece is handed over as it arrives and nothing is accumulated
+    here (the callback owns the text; the return value is ""). Otherwise the stripped text is returned.
+    """
+    name = upload.filename or "upload"
+    # By now the part is spooled; RequestSizeLimitMiddleware already stopped oversized ones mid-body.
+    if upload.size is not None and upload.size > budget.limits.max_file_bytes:
+        raise _too_large(f"{name} exceeds {budget.limits.max_file_bytes} bytes")
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pieces: list[str] = []
+    emit = on_text or pieces.append
+    total = 0
+    while chunk := await upload.read(CHUNK_BYTES):
+        total += len(chunk)
+        budget.take(name, len(chunk), total)
+        if text := decoder.decode(chunk):
+            emit(text)
+    if tail := decoder.decode(b"", final=True):
+        emit(tail)
+    return "".join(pieces).strip()
+
+
+class _PartSizes:
+    """Sizes of a multipart body's parts, measured as the body streams in.
+
+    Runs the same parser Starlette uses on each received chunk, ahead of the form parser, so an
+    oversized part is rejected before the rest of it is received or spooled.
+    """
+
+    def __init__(self, boundary: bytes, max_bytes: int) -> None:
+        self.max_bytes = max_bytes
+        self.name = "upload"
+        self.size = 0
+        self._header = b""
+        self._value = b""
+        self._parser = multipart.MultipartParser(
+            boundary,
+            {
+                "on_part_begin": self._begin,
+                "on_header_field": self._header_field,
+                "on_header_value": self._header_value,
+                "on_header_end": self._header_end,
+                "on_part_data": self._data,
+            },
+        )
+
+    def _begin(self) -> None:
+        self.name, self.size = "upload", 0
+
+    def _header_field(self, data: bytes, start: int, end: int) -> None:
+        self._header += data[start:end]
+
+    def _header_value(self, data: bytes, start: int, end: int) -> None:
+        self._value += data[start:end]
+
+    def _header_end(self) -> None:
+        if self._header.lower() == b"content-disposition":
+            _, options = parse_options_header(self._value)
+            name = options.get(b"filename") or options.get(b"name")
+            if name:
+                self.name = name.decode("utf-8", "replace")
+        self._header = self._value = b""
+
+    def _data(self, data: bytes, start: int, end: int) -> None:
+        self.size += end - start
+        if self.size > self.max_bytes:
+            raise _too_large(f"{self.name} exceeds {self.max_bytes} bytes")
+
+    def write(self, chunk: bytes) -> None:
+        self._parser.write(chunk)
+
+
+def _part_sizes(headers: Headers, max_bytes: int) -> _PartSizes | None:
+    content_type, params = parse_options_header(headers.get("content-type", ""))
+    if max_bytes <= 0 or multipart is None or content_type != b"multipart/form-data" or b"boundary" not in params:
+        return None
+    return _PartSizes(params[b"boundary"], max_bytes)
+
+
+class RequestSizeLimitMiddleware:
+    """413 for request bodies over ``max_bytes`` on ``paths``, before they are parsed or spooled.
+
+    A declared ``Content-Length`` is rejected up front; otherwise (chunked uploads) the body is
+    counted as it is received and parsing stops at the limit. With ``max_part_bytes``, each part
+    of a multipart body is measured the same way, so one oversized file stops the read too.
+    """
+
+    def __init__(self, app: ASGIApp, *, paths: tuple[str, ...], max_bytes: int, max_part_bytes: int = 0) -> None:
+        self.app = app
+        self.paths = paths
+        self.max_bytes = max_bytes
+        self.max_part_bytes = max_part_bytes
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http" or scope["path"] not in self.paths or self.max_bytes <= 0:
+            await self.app(scope, receive, send)
+            return
+        headers = Headers(scope=scope)
+        declared = headers.get("content-length")
+        if declared is not None and declared.isdigit() and int(declared) > self.max_bytes:
+            await _reject(send, f"Request body exceeds {self.max_bytes} bytes")
+            return
+
+        received = 0
+        parts = _part_sizes(headers, self.max_part_bytes)
+
+        async def _receive() -> Message:
+            nonlocal received, parts
+            message = await receive()
+            if message["type"] == "http.request":
+                body = message.get("body", b"")
+                received += len(body)
+                if received > self.max_bytes:
+                    # Raised inside body parsing; FastAPI re-raises HTTPExceptions from there as-is.
+                    raise _too_large(f"Request body exceeds {self.max_bytes} bytes")
+                if parts is not None and body:
+                    try:
+                        parts.write(body)
+                    except HTTPException:
+                        raise
+                    except Exception:
+                        parts = None  # malformed body: the form parser reports it
+            return message
+
+        await self.app(scope, _receive, send)
+
+
+async def _reject(send: Send, detail: str) -> None:
+    body = json.dumps({"detail": detail}).encode()
+    await send(
+        {
+            "type": "http.response.start",
+            "status": 413,
+            "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        }
+    )
+    await send({"type": "http.response.body", "body": body})
@@ -0,0 +1,109 @@
+from __future__ import annotations
+
+import asyncio
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from .agents.base import PanelContext
+from .agents.memo import get_memo
+from .assist import run_assist
+from .llm.factory import build_provider
+from .llm.registry import ProviderRegistry
+from .orchestrator import run_panel
+from .responses import dump_json
+from .traces import get_trace_store
+
+# Used when there are no samples to warm the pipeline with.
+_FALLBACK_SAMPLE = {
+    "job_description": "# Backend Engineer\n- Must have Python and PostgreSQL experience\n- Designed distributed systems\n",
+    "resume": "# Candidate\n- Built payment services in Python\n- Scaled PostgreSQL clusters\n",
+    "transcript": "Interviewer: How did you scale it?\nCandidate: I'm not sure, I haven't used sharding.\n",
+}
+
+# Never stored, memoized or charged to a real tenant.
+_WARMUP_CONFIG = {"memo": False, "store": False, "store_trace": False, "near_duplicates": False}
+
+
+@dataclass
+class Readiness:
+    """Warm-up progress behind ``/ready``; ``/health`` stays a plain liveness check."""
+
+    ready: bool = False
+    duration_ms: float | None = None
+    steps: dict[str, float] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+
+    def as_dict(self) -> dict[str, Any]:
+        return {
+            "status": "ready" if self.ready else "warming",
+            "warmup_ms": self.duration_ms,
+            "steps_ms": self.steps,
+            "errors": self.errors,
+        }
+
+
+def warmup_enabled() -> bool:
+    return (os.getenv("PANELAI_WARMUP") or "1").strip().lower() not in {"0", "false", "no"}
+
+
+async def _step(readiness: Readiness, name: str, fn: Callable[[], Awaitable[Any]]) -> None:
+    # A failed step is reported but doesn't keep the instance out of rotation: it only costs
+    # the first request what warm-up would have saved.
+    t0 = time.perf_counter()
+    try:
+        await fn()
+    except asyncio.CancelledError:
+        raise
+    except Exception as exc:
+        readiness.errors[name] = repr(exc)
+    readiness.steps[name] = round((time.perf_counter() - t0) * 1000, 1)
+
+
+async def warm_up(state: Any, readiness: Readiness) -> None:
+    """Pay first-request costs at startup, then mark the instance ready.
+
+    - samples: build the sample catalog index
+    - stores: open the trace store and the agent memo
+    - providers: open provider connection pools (``PANELAI_WARMUP_CONNECT=0`` skips)
+    - pipeline: one heuristic panel + assist run, which compiles the per-input matchers and regexes
+      and the response serializers
+    """
+    t0 = time.perf_counter()
+    sample: dict[str, str] = dict(_FALLBACK_SAMPLE)
+
+    async def _samples() -> None:
+        entries, _, _ = await asyncio.to_thread(state.samples.list, limit=1)
+        if entries:
+            sample.update(await asyncio.to_thread(state.samples.content, entries[0]))
+
+    async def _stores() -> None:
+        await asyncio.to_thread(get_trace_store)
+        get_memo()
+
+    async def _providers() -> None:
+        if (os.getenv("PANELAI_WARMUP_CONNECT") or "1").strip().lower() not in {"0", "false", "no"}:
+            await state.providers.warm_up()
+
+    async def _pipeline() -> None:
+        ctx = PanelContext(
+            job_description=sample["job_description"],
+            resume=sample["resume"],
+            transcript=sample["transcript"],
+            config=dict(_WARMUP_CONFIG),
+            # Always heuristic: warm-up must not spend tokens.
+            providers=ProviderRegistry(default=build_provider("heuristic")),
+            tenant="__warmup__",
+        )
+        result = await run_panel(ctx=ctx)
+        assist = await run_assist(ctx=ctx)
+        dump_json(result)
+        dump_json(assist)
+
+    await _step(readiness, "samples", _samples)
+    await _step(readiness, "stores", _stores)
+    await _step(readiness, "providers", _providers)
+    await _step(readiness, "pipeline", _pipeline)
+    readiness.duration_ms = round((time.perf_counter() - t0) * 1000, 1)
+    readiness.ready = True
@@ -0,0 +1,338 @@
+"""Replay a capture log (``PANELAI_CAPTURE``) against the app and report latency and throughput.
+
+Run from ``backend/``:
+
+    python -m bench.replay capture.jsonl [--target inproc|http://host:port] [--speed 1]
+                                         [--scale 1] [--max-inflight 0] [--no-store] [--json out.json]
+
+Requests are sent open-loop on the captured schedule: ``--speed 10`` plays an hour of traffic in
+six minutes, ``--speed 0`` sends as fast as ``--max-inflight`` allows. ``--scale K`` plays every
+request K times as K distinct candidates (separate sessions and inputs), multiplying the offered
+load while keeping the traffic shape.
+
+Logs captured in ``hash`` or ``redact`` mode carry no text; inputs are synthesized from the sample
+corpus at the recorded sizes. Identical hashes map to identical text and a live session's
+transcript grows as one prefix, so memo hits and incremental parsing behave as they did in
+production (``redact`` logs only keep the session prefix property).
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import os
+import sys
+import time
+import zlib
+from collections import defaultdict
+from contextlib import AsyncExitStack
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any
+
+import httpx
+
+BACKEND = Path(__file__).resolve().parents[1]
+DATA_ROOT = BACKEND.parent / "data"
+FIELDS = ("job_description", "resume", "transcript")
+
+
+def load_log(path: Path) -> list[dict[str, Any]]:
+    records = []
+    with path.open(encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                records.append(json.loads(line))
+            except ValueError:
+                continue  # a line cut short by a crash or rotation
+    records.sort(key=lambda r: r.get("ts", 0.0))
+    return records
+
+
+class Synthesizer:
+    """Stand-in text of a given size, stable per key, built from the sample corpus."""
+
+    def __init__(self, root: Path) -> None:
+        corpus: dict[str, list[str]] = {f: [] for f in FIELDS}
+        for d in sorted(p for p in root.iterdir() if p.is_dir()) if root.is_dir() else []:
+            for f in FIELDS:
+                path = d / f"{f}.md"
+                if path.exists():
+                    corpus[f].append(path.read_text(encoding="utf-8"))
+        self.corpus = {f: texts or ["Interviewer: Tell me about your work.\nCandidate: I built services.\n"] for f, texts in corpus.items()}
+        self._bases: dict[tuple[str, str], str] = {}
+
+    def _base(self, field_name: str, key: str, size: int) -> str:
+        base = self._bases.get((field_name, key), "")
+        if len(base) < size:
+            texts = self.corpus[field_name]
+            start = zlib.crc32(key.encode()) % len(texts)
+            parts = [base]
+            n = len(base)
+            i = start
+            while n < size:
+                parts.append(texts[i % len(texts)])
+                n += len(texts[i % len(texts)])
+                i += 1
+            base = "".join(parts)
+            self._bases[(field_name, key)] = base
+        return base
+
+    def text(self, field_name: str, key: str, size: int) -> str:
+        if size <= 0:
+            return ""
+        return self._base(field_name, key, size)[:size]
+
+
+@dataclass
+class Outcome:
+    endpoint: str
+    status: int
+    latency_ms: float
+    ttfb_ms: float
+    lag_ms: float  # how late the request left compared to its schedule
+    captured_status: int
+
+
+@dataclass
+class Replayer:
+    client: httpx.AsyncClient
+    synth: Synthesizer
+    no_store: bool = False
+    profiles: dict[tuple[str, int], str] = field(default_factory=dict)
+    etags: dict[tuple[str, int], str] = field(default_factory=dict)
+
+    def body(self, record: dict[str, Any], copy: int) -> dict[str, Any]:
+        sizes = record.get("sizes") or {}
+        texts = record.get("texts")
+        hashes = record.get("hashes") or {}
+        session = record.get("session_id")
+        body: dict[str, Any] = {}
+        for f in FIELDS:
+            if texts is not None:
+                value = texts.get(f, "")
+            elif f == "transcript" and session:
+                # One growing transcript per session, so successive ticks are prefixes of each other.
+                value = self.synth.text(f, f"session:{session}:{copy}", sizes.get(f, 0))
+            else:
+                key = hashes.get(f) or f"size:{sizes.get(f, 0)}"
+                value = self.synth.text(f, f"{key}:{copy}", sizes.get(f, 0))
+            if copy and value:
+                value = f"Replay copy {copy}\n{value}"
+            body[f] = value
+        config = dict(record.get("config") or {})
+        if self.no_store:
+            config.update(store=False, store_trace=False)
+        body["config"] = config
+        if session:
+            body["session_id"] = f"replay-{session}-{copy}"
+            body["transcript_version"] = record.get("transcript_version")
+        return body
+
+    async def _profile(self, profile_id: str, copy: int, tenant: str) -> str:
+        key = (profile_id, copy)
+        if key not in self.profiles:
+            jd = self.synth.text("job_description", f"profile:{profile_id}:{copy}", 2000)
+            r = await self.client.post("/jd-profiles", json={"job_description": jd}, headers=_headers(tenant))
+            r.raise_for_status()
+            self.profiles[key] = r.json()["id"]
+        return self.profiles[key]
+
+    async def send(self, record: dict[str, Any], copy: int, lag_ms: float) -> Outcome:
+        endpoint = record["endpoint"]
+        tenant = str(record.get("tenant") or "default")
+        body = self.body(record, copy)
+        if record.get("jd_profile_id"):
+            body["jd_profile_id"] = await self._profile(str(record["jd_profile_id"]), copy, tenant)
+        session_key = (str(record.get("session_id")), copy)
+        if endpoint == "/assist/delta" and record.get("since"):
+            body["since"] = self.etags.get(session_key)
+        t0 = time.perf_counter()
+        ttfb = None
+        try:
+            async with self.client.stream("POST", endpoint, json=body, headers=_headers(tenant)) as r:
+                ttfb = time.perf_counter() - t0
+                content = await r.aread()
+                status = r.status_code
+        except httpx.HTTPError:
+            status = 0
+            content = b""
+        latency = time.perf_counter() - t0
+        if endpoint == "/assist/delta" and status == 200:
+            try:
+                self.etags[session_key] = json.loads(content)["etag"]
+            except (ValueError, KeyError):
+                pass
+        ttfb_ms = (ttfb if ttfb is not None else latency) * 1000
+        return Outcome(endpoint, status, latency * 1000, ttfb_ms, lag_ms, int(record.get("status") or 0))
+
+
+def _headers(tenant: str) -> dict[str, str]:
+    # With the target's PANELAI_REPLAY_TOKEN, the replay header keeps a capturing target from
+    # recording the replay itself.
+    headers = {"x-tenant-id": tenant}
+    if token := (os.getenv("PANELAI_REPLAY_TOKEN") or "").strip():
+        headers["x-panelai-replay"] = token
+    return headers
+
+
+async def replay(
+    records: list[dict[str, Any]],
+    replayer: Replayer,
+    *,
+    speed: float,
+    scale: int,
+    max_inflight: int,
+) -> tuple[list[Outcome], float]:
+    gate = asyncio.Semaphore(max_inflight) if max_inflight > 0 else None
+    ts0 = records[0].get("ts", 0.0) if records else 0.0
+    start = time.perf_counter()
+    # Requests of one live session stay in order (as they were on the wire); sessions and
+    # everything else run concurrently.
+    session_locks: dict[tuple[str, int], asyncio.Lock] = defaultdict(asyncio.Lock)
+
+    async def _one(record: dict[str, Any], copy: int, due: float) -> Outcome:
+        session = record.get("session_id")
+        lock = session_locks[(str(session), copy)] if session else None
+        async with AsyncExitStack() as stack:
+            if gate is not None:
+                await stack.enter_async_context(gate)
+            if lock is not None:
+                await stack.enter_async_context(lock)
+            lag = max(0.0, time.perf_counter() - start - due) * 1000
+            return await replayer.send(record, copy, lag)
+
+    tasks = []
+    for record in records:
+        due = (record.get("ts", ts0) - ts0) / speed if speed > 0 else 0.0
+        delay = due - (time.perf_counter() - start)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        for copy in range(scale):
+            tasks.append(asyncio.create_task(_one(record, copy, due)))
+    outcomes = list(await asyncio.gather(*tasks))
+    return outcomes, time.perf_counter() - start
+
+
+def _pct(values: list[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def summarize(records: list[dict[str, Any]], outcomes: list[Outcome], wall_s: float, *, speed: float) -> dict[str, Any]:
+    span = (records[-1].get("ts", 0.0) - records[0].get("ts", 0.0)) if records else 0.0
+    by_endpoint: dict[str, list[Outcome]] = defaultdict(list)
+    for o in outcomes:
+        by_endpoint[o.endpoint].append(o)
+    captured: dict[str, list[float]] = defaultdict(list)
+    for r in records:
+        captured[r["endpoint"]].append(float(r.get("latency_ms") or 0.0))
+
+    def _stats(items: list[Outcome], recorded: list[float]) -> dict[str, Any]:
+        lat = [o.latency_ms for o in items]
+        statuses: dict[str, int] = defaultdict(int)
+        for o in items:
+            statuses[str(o.status)] += 1
+        return {
+            "requests": len(items),
+            "errors": sum(1 for o in items if not 200 <= o.status < 400),
+            # Status differs from production's answer (synthesized inputs, missing state, overload).
+            "mismatched": sum(1 for o in items if o.status != o.captured_status),
+            "statuses": dict(statuses),
+            "p50_ms": round(_pct(lat, 0.50), 1),
+            "p95_ms": round(_pct(lat, 0.95), 1),
+            "p99_ms": round(_pct(lat, 0.99), 1),
+            "max_ms": round(max(lat, default=0.0), 1),
+            "ttfb_p50_ms": round(_pct([o.ttfb_ms for o in items], 0.50), 1),
+            "captured_p50_ms": round(_pct(recorded, 0.50), 1),
+            "captured_p95_ms": round(_pct(recorded, 0.95), 1),
+        }
+
+    all_recorded = [lat for values in captured.values() for lat in values]
+    return {
+        "records": len(records),
+        "requests": len(outcomes),
+        "wall_s": round(wall_s, 2),
+        "captured_span_s": round(span, 2),
+        "throughput_rps": round(len(outcomes) / wall_s, 2) if wall_s > 0 else 0.0,
+        # Load the schedule asked for; throughput falling short of it means the target saturated.
+        "offered_rps": round(len(outcomes) * speed / span, 2) if span > 0 and speed > 0 else None,
+        "max_lag_ms": round(max((o.lag_ms for o in outcomes), default=0.0), 1),
+        "overall": _stats(outcomes, all_recorded),
+        "endpoints": {ep: _stats(items, captured.get(ep, [])) for ep, items in sorted(by_endpoint.items())},
+    }
+
+
+def _print(report: dict[str, Any]) -> None:
+    print(
+        f"{report['requests']} requests ({report['records']} captured) in {report['wall_s']}s: "
+        f"{report['throughput_rps']} req/s (offered {report['offered_rps']}); captured span {report['captured_span_s']}s; "
+        f"max schedule lag {report['max_lag_ms']} ms"
+    )
+    header = f"{'endpoint':<18} {'n':>6} {'err':>5} {'diff':>5} {'p50':>8} {'p95':>8} {'p99':>8} {'max':>8} {'ttfb50':>8} {'cap p50':>8} {'cap p95':>8}"
+    print(header)
+    rows = list(report["endpoints"].items()) + [("all", report["overall"])]
+    for name, s in rows:
+        print(
+            f"{name:<18} {s['requests']:>6} {s['errors']:>5} {s['mismatched']:>5} {s['p50_ms']:>8} {s['p95_ms']:>8} {s['p99_ms']:>8} "
+            f"{s['max_ms']:>8} {s['ttfb_p50_ms']:>8} {s['captured_p50_ms']:>8} {s['captured_p95_ms']:>8}"
+        )
+
+
+async def _run(args: argparse.Namespace) -> dict[str, Any]:
+    records = load_log(Path(args.log))
+    if args.endpoint:
+        records = [r for r in records if r.get("endpoint") in args.endpoint]
+    if args.limit:
+        records = records[: args.limit]
+    if not records:
+        raise SystemExit("no records to replay")
+    synth = Synthesizer(Path(args.samples))
+    timeout = httpx.Timeout(args.timeout)
+    limits = httpx.Limits(max_connections=args.max_inflight or None, max_keepalive_connections=args.max_inflight or None)
+    async with AsyncExitStack() as stack:
+        if args.target == "inproc":
+            # Never capture the replay into the log being replayed.
+            os.environ["PANELAI_CAPTURE"] = "off"
+            sys.path.insert(0, str(BACKEND))
+            from app.main import app
+
+            await stack.enter_async_context(app.router.lifespan_context(app))
+            transport = httpx.ASGITransport(app=app)
+            client = httpx.AsyncClient(transport=transport, base_url="http://replay", timeout=timeout)
+        else:
+            client = httpx.AsyncClient(base_url=args.target, timeout=timeout, limits=limits)
+        await stack.enter_async_context(client)
+        replayer = Replayer(client=client, synth=synth, no_store=args.no_store)
+        outcomes, wall = await replay(records, replayer, speed=args.speed, scale=args.scale, max_inflight=args.max_inflight)
+    return summarize(records, outcomes, wall, speed=args.speed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("log", help="capture log (JSONL)")
+    parser.add_argument("--target", default="inproc", help="'inproc' or a base URL, e.g. http://127.0.0.1:8000")
+    parser.add_argument("--speed", type=float, default=1.0, help="time compression; 0 sends as fast as possible")
+    parser.add_argument("--scale", type=int, default=1, help="play each request as this many distinct candidates")
+    parser.add_argument("--max-inflight", type=int, default=0, help="cap on concurrent requests (0: open loop)")
+    parser.add_argument("--endpoint", action="append", help="only replay this endpoint (repeatable)")
+    parser.add_argument("--limit", type=int, default=0, help="only the first N records")
+    parser.add_argument("--no-store", action="store_true", help="don't persist evaluations or traces on the target")
+    parser.add_argument("--samples", default=str(DATA_ROOT), help="corpus for synthesized inputs")
+    parser.add_argument("--timeout", type=float, default=120.0)
+    parser.add_argument("--json", help="also write the report here")
+    args = parser.parse_args()
+    report = asyncio.run(_run(args))
+    _print(report)
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2), encoding="utf-8")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Serialization cost per response size: FastAPI's default path vs ``app.responses``.
+
+Run from ``backend/``:
+
+    python -m bench.serialization [--repeat 30]
+
+A real panel result for the first bundled sample (``config.trace=full``) is scaled up by
+repeating its trace and discrepancies, standing in for LLM runs with long traces and evidence.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import gzip
+import json
+import time
+from pathlib import Path
+from typing import Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.agents.base import PanelContext
+from app.models import EvaluationResult
+from app.orchestrator import run_panel
+from app.responses import brotli, compress, dump_json
+
+DATA_ROOT = Path(__file__).resolve().parents[2] / "data"
+
+
+def _timed(fn: Callable[[], object], repeat: int) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+async def _base_result() -> EvaluationResult:
+    sample = sorted(d for d in DATA_ROOT.iterdir() if d.is_dir())[0]
+    jd, resume, transcript = (
+        (sample / name).read_text(encoding="utf-8") for name in ("job_description.md", "resume.md", "transcript.md")
+    )
+    ctx = PanelContext(
+        job_description=jd,
+        resume=resume,
+        transcript=transcript,
+        config={"trace": "full", "memo": False, "store_trace": False},
+    )
+    return await run_panel(ctx=ctx)
+
+
+def _scaled(result: EvaluationResult, factor: int) -> EvaluationResult:
+    return result.model_copy(update={"trace": result.trace * factor, "discrepancies": result.discrepancies * factor})
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=30)
+    parser.add_argument("--scales", default="1,4,16,64,256")
+    args = parser.parse_args()
+
+    field = create_model_field(name="Response", type_=EvaluationResult, mode="serialization")
+    loop = asyncio.new_event_loop()
+    base = loop.run_until_complete(_base_result())
+    results = [_scaled(base, int(s)) for s in args.scales.split(",")]
+
+    def default_path(result: EvaluationResult) -> bytes:
+        content = loop.run_until_complete(serialize_response(field=field, response_content=result, is_coroutine=True))
+        return JSONResponse(content).body
+
+    # "default" is FastAPI's validate + jsonable_encoder + json.dumps path; "direct" is
+    # pydantic's model_dump_json on the trusted result, which is what model_response sends.
+    print(f"brotli: {'yes' if brotli is not None else 'not installed'}")
+    header = "| JSON bytes | default ms | direct ms | speedup | gzip bytes | gzip ms |"
+    if brotli is not None:
+        header += " br bytes | br ms |"
+    print(header)
+    print("|" + "---|" * (header.count("|") - 1))
+    for result in results:
+        body = dump_json(result)
+        assert json.loads(body) == json.loads(default_path(result))
+        default_ms = _timed(lambda: default_path(result), args.repeat)
+        direct_ms = _timed(lambda: dump_json(result), args.repeat)
+        gz = gzip.compress(body, compresslevel=6)
+        row = (
+            f"| {len(body):,} | {default_ms:.2f} | {direct_ms:.2f} | {default_ms / direct_ms:.1f}x "
+            f"| {len(gz):,} | {_timed(lambda: compress(body, 'gzip'), args.repeat):.2f} |"
+        )
+        if brotli is not None:
+            br = compress(body, "br")
+            row += f" {len(br):,} | {_timed(lambda: compress(body, 'br'), args.repeat):.2f} |"
+        print(row)
+    loop.close()
+
+
+if __name__ == "__main__":
+    main()
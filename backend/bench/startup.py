@@ -0,0 +1,105 @@
+"""Cold-start cost: import time of ``app.main`` and time to first request, with and without warm-up.
+
+Run from ``backend/``:
+
+    python -m bench.startup [--runs 5]
+
+Each boot starts a fresh ``uvicorn`` process and measures time until ``/health`` answers, until
+``/ready`` answers 200, and the latency of the first two ``/evaluate`` calls.
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import socket
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+BACKEND = Path(__file__).resolve().parents[1]
+DATA_ROOT = BACKEND.parent / "data"
+
+
+def _import_ms() -> float:
+    code = "import time; t = time.perf_counter(); import app.main; print((time.perf_counter() - t) * 1000)"
+    out = subprocess.run([sys.executable, "-c", code], cwd=BACKEND, capture_output=True, text=True, check=True)
+    return float(out.stdout.strip().splitlines()[-1])
+
+
+def _free_port() -> int:
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def _wait(client: httpx.Client, path: str, deadline: float) -> float:
+    while time.perf_counter() < deadline:
+        try:
+            if client.get(path).status_code == 200:
+                return time.perf_counter()
+        except httpx.TransportError:
+            pass
+        time.sleep(0.005)
+    raise TimeoutError(path)
+
+
+def _boot(*, warmup: bool, body: dict[str, str]) -> dict[str, float]:
+    port = _free_port()
+    env = {**os.environ, "PANELAI_WARMUP": "1" if warmup else "0", "PANELAI_JOB_WORKERS": "0"}
+    t0 = time.perf_counter()
+    proc = subprocess.Popen(
+        [sys.executable, "-m", "uvicorn", "app.main:app", "--port", str(port), "--log-level", "warning"],
+        cwd=BACKEND,
+        env=env,
+    )
+    try:
+        with httpx.Client(base_url=f"http://127.0.0.1:{port}", timeout=30) as client:
+            health = _wait(client, "/health", t0 + 60)
+            ready = _wait(client, "/ready", t0 + 60)
+            latencies = []
+            for _ in range(2):
+                t = time.perf_counter()
+                client.post("/evaluate", json={**body, "config": {"store": False}}).raise_for_status()
+                latencies.append((time.perf_counter() - t) * 1000)
+        return {
+            "health": (health - t0) * 1000,
+            "ready": (ready - t0) * 1000,
+            "first": latencies[0],
+            "second": latencies[1],
+        }
+    finally:
+        proc.terminate()
+        proc.wait(timeout=10)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    sample = sorted(d for d in DATA_ROOT.iterdir() if d.is_dir())[0]
+    body = {
+        name.removesuffix(".md"): (sample / name).read_text(encoding="utf-8")
+        for name in ("job_description.md", "resume.md", "transcript.md")
+    }
+
+    imports = [_import_ms() for _ in range(args.runs)]
+    print(f"import app.main: median {statistics.median(imports):.0f} ms (min {min(imports):.0f}, max {max(imports):.0f})")
+    print("| warm-up | /health ms | /ready ms | 1st /evaluate ms | 2nd /evaluate ms |")
+    print("|---|---|---|---|---|")
+    for warmup in (False, True):
+        runs = [_boot(warmup=warmup, body=body) for _ in range(args.runs)]
+        med = {k: statistics.median(r[k] for r in runs) for k in runs[0]}
+        print(
+            f"| {'on' if warmup else 'off'} | {med['health']:.0f} | {med['ready']:.0f} "
+            f"| {med['first']:.1f} | {med['second']:.1f} |"
+        )
+
+
+if __name__ == "__main__":
+    main()
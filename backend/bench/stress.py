@@ -0,0 +1,171 @@
+"""Pathological-input stress run: every agent must stay within its time and memory budget.
+
+Run from ``backend/``:
+
+    python -m bench.stress [--budget-ms 2000] [--budget-mb 256] [--fuzz 20] [--size 2000000]
+
+Each case is a crafted worst case for one text path (a multi-megabyte single line, thousands of
+bullets or skills, hundreds of thousands of tiny turns, no whitespace at all, ...), plus seeded
+random fuzz over a hostile alphabet. Inputs go through ``cap_inputs`` like a request would, then
+each analysis agent, the full panel and live assist run on the heuristic provider. Wall time and
+peak traced allocation are checked against the budgets; the exit status is 1 if any run exceeds
+them.
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import string
+import sys
+import time
+import tracemalloc
+from dataclasses import replace
+from typing import Any, Awaitable, Callable
+
+from app.agents import contradictions, gap_analysis, transcript_turns
+from app.agents.base import PanelContext
+from app.agents.contradictions import ContradictionHunterAgent
+from app.agents.gap_analysis import GapAnalysisAgent
+from app.agents.resume_claims import ResumeClaimsAgent
+from app.agents.transcript_evidence import TranscriptEvidenceAgent
+from app.assist import run_assist
+from app.limits import InputLimits, cap_inputs
+from app.llm.factory import build_provider
+from app.llm.registry import ProviderRegistry
+from app.orchestrator import run_panel
+
+_CONFIG = {"memo": False, "store": False, "store_trace": False, "near_duplicates": False}
+_JD = "# Backend Engineer\n- Must have Python and PostgreSQL experience\n- Designed distributed systems\n"
+_RESUME = "# Candidate\n- Built payment services in Python\n- Scaled PostgreSQL clusters\n"
+_TRANSCRIPT = "Interviewer: How did you scale it?\nCandidate: I'm not sure, I haven't used sharding.\n"
+
+
+def _words(rng: random.Random, n: int) -> list[str]:
+    return ["".join(rng.choices(string.ascii_lowercase, k=rng.randint(3, 9))) for _ in range(n)]
+
+
+def cases(size: int, rng: random.Random) -> dict[str, dict[str, str]]:
+    words = _words(rng, 5000)
+    text = " ".join(rng.choices(words, k=size // 6))[:size]
+    skills = "\n".join(f"- Built {w.capitalize()} and {w.upper()}.js at scale" for w in words)
+    return {
+        "long-line": {"transcript": "Candidate: " + text},
+        "long-line-no-speaker": {"transcript": text, "resume": text},
+        "no-whitespace": {k: "a" * size for k in ("job_description", "resume", "transcript")},
+        "punctuation-run": {k: "Ab" + "+" * size for k in ("job_description", "resume", "transcript")},
+        "digits": {"resume": "1" * size, "job_description": "1 " * (size // 2)},
+        "resume-bullets": {"resume": "\n".join(f"- Built {w} service" for w in words * (size // 100_000 + 1))},
+        "jd-bullets": {"job_description": "\n".join(f"- Must know {w} {v}" for w, v in zip(words, reversed(words)))},
+        "many-skills": {"resume": skills, "transcript": "Candidate: " + text},
+        "tiny-turns": {"transcript": "A: ok\n" * (size // 6)},
+        "named-speakers": {"transcript": "".join(f"{w.capitalize()} Aa Bb Cc: why?\n" for w in rng.choices(words, k=size // 30))},
+        "speaker-lookalike": {"transcript": ("Aa " * (size // 3)) + "\n"},
+        "red-flags": {"transcript": "Candidate: I'm not sure, never used it.\n" * (size // 40)},
+        "blank-lines": {"transcript": "\n" * size, "resume": " \t\n" * (size // 3)},
+        "unicode": {"transcript": "Candidate: " + "".join(rng.choices("İıßẞﬁ́​日本語😀ǅ", k=size // 2))},
+    }
+
+
+def fuzz_cases(n: int, size: int, rng: random.Random) -> dict[str, dict[str, str]]:
+    alphabet = string.ascii_letters + string.digits + " \t\n:-*•+#.[]()?'" + "İß😀​"
+    out = {}
+    for i in range(n):
+        k = rng.randint(1, size)
+        out[f"fuzz-{i}"] = {
+            field: "".join(rng.choices(alphabet, k=rng.randint(0, k)))
+            for field in ("job_description", "resume", "transcript")
+        }
+    return out
+
+
+def _reset_caches() -> None:
+    # Per-input parse caches would let the second pass of a run (and later runs) skip the work.
+    transcript_turns._RECENT.clear()
+    transcript_turns._recent_chars = 0
+    gap_analysis._TRANSCRIPT_TERMS.clear()
+    gap_analysis._transcript_terms_chars = 0
+    gap_analysis._resume_terms.cache_clear()
+    gap_analysis.jd_profile_for.cache_clear()
+    contradictions.skill_matcher.cache_clear()
+
+
+async def _measure(fn: Callable[[], Awaitable[Any]]) -> tuple[float, float]:
+    """Wall time of a cold run, then peak traced allocation of another cold run.
+
+    Two runs because tracing allocations slows pure-Python code several times over.
+    """
+    _reset_caches()
+    t0 = time.perf_counter()
+    await fn()
+    elapsed = (time.perf_counter() - t0) * 1000
+    _reset_caches()
+    tracemalloc.start()
+    try:
+        await fn()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024)
+
+
+async def run_case(name: str, fields: dict[str, str], limits: InputLimits) -> list[tuple[str, str, float, float]]:
+    ctx = PanelContext(
+        job_description=fields.get("job_description", _JD),
+        resume=fields.get("resume", _RESUME),
+        transcript=fields.get("transcript", _TRANSCRIPT),
+        config=dict(_CONFIG),
+        providers=ProviderRegistry(default=build_provider("heuristic")),
+        tenant="__stress__",
+    )
+    capped: list[PanelContext] = []
+
+    async def _cap() -> None:
+        capped.append(cap_inputs(ctx, limits)[0])
+
+    rows = [(name, "cap_inputs", *await _measure(_cap))]
+    ctx = capped[0]
+    for agent in (ResumeClaimsAgent(), TranscriptEvidenceAgent(), GapAnalysisAgent(), ContradictionHunterAgent()):
+        rows.append((name, agent.name, *await _measure(lambda a=agent: a.run(replace(ctx, stage="analysis")))))
+    # The full pipelines go through the caps themselves, so they get the uncapped context.
+    raw = replace(ctx, **{k: v for k, v in fields.items()})
+    rows.append((name, "run_panel", *await _measure(lambda: run_panel(ctx=raw))))
+    rows.append((name, "run_assist", *await _measure(lambda: run_assist(ctx=raw))))
+    return rows
+
+
+async def _main(args: argparse.Namespace) -> int:
+    rng = random.Random(args.seed)
+    limits = InputLimits.from_env()
+    all_cases = {**cases(args.size, rng), **fuzz_cases(args.fuzz, args.fuzz_size, rng)}
+    failures = 0
+    print(f"{'case':<22} {'stage':<22} {'ms':>9} {'peak MB':>8}")
+    for name, fields in all_cases.items():
+        if args.case and name not in args.case:
+            continue
+        for case, stage, ms, mb in await run_case(name, fields, limits):
+            over = ms > args.budget_ms or mb > args.budget_mb
+            failures += over
+            if over or not name.startswith("fuzz-") or args.verbose:
+                print(f"{case:<22} {stage:<22} {ms:>9.1f} {mb:>8.1f}{'  OVER BUDGET' if over else ''}")
+    print(f"{failures} run(s) over budget ({args.budget_ms} ms, {args.budget_mb} MB)")
+    return 1 if failures else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size", type=int, default=2_000_000, help="characters per crafted field")
+    parser.add_argument("--fuzz", type=int, default=20, help="number of random fuzz cases")
+    parser.add_argument("--fuzz-size", type=int, default=200_000)
+    parser.add_argument("--budget-ms", type=float, default=2000.0, help="per agent / pipeline run")
+    parser.add_argument("--budget-mb", type=float, default=256.0, help="peak traced allocation per run")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--case", action="append", help="only run this case (repeatable)")
+    parser.add_argument("--verbose", action="store_true", help="also print passing fuzz runs")
+    args = parser.parse_args()
+    sys.exit(asyncio.run(_main(args)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,5 @@
+import os
+import tempfile
+
+# Stores open their SQLite files under the data dir on first use; keep test runs out of ./data.
+os.environ.setdefault("PANELAI_DATA_DIR", tempfile.mkdtemp(prefix="panelai-tests-"))
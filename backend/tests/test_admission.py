@@ -0,0 +1,132 @@
+import asyncio
+
+import pytest
+
+from app.admission import AdmissionController, Overloaded, _Lane
+
+
+def _controller(*, capacity=8, batch_limit=2, batch_queue=2, max_wait_s=5.0):
+    lanes = {
+        "live": _Lane("live", 0, limit=4, max_queue=8),
+        "batch": _Lane("batch", 2, limit=batch_limit, max_queue=batch_queue),
+    }
+    return AdmissionController(capacity=capacity, lanes=lanes, max_wait_s=max_wait_s)
+
+
+def test_lane_limit_caps_concurrency():
+    async def main():
+        admission = _controller(batch_queue=16)
+        running = peak = 0
+
+        async def job():
+            nonlocal running, peak
+            async with admission.slot("batch"):
+                running += 1
+                peak = max(peak, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(*[job() for _ in range(10)])
+        return peak, admission.stats()["batch"]
+
+    peak, stats = asyncio.run(main())
+    assert peak == 2
+    assert stats["active"] == 0 and stats["queued"] == 0
+
+
+def test_full_queue_raises_overloaded_unless_unbounded():
+    async def main():
+        admission = _controller(batch_limit=1, batch_queue=1)
+        release = asyncio.Event()
+
+        async def hold(**kwargs):
+            async with admission.slot("batch", **kwargs):
+                await release.wait()
+
+        tasks = [asyncio.create_task(hold()) for _ in range(2)]  # one running, one queued
+        await asyncio.sleep(0)
+        with pytest.raises(Overloaded):
+            async with admission.slot("batch"):
+                pass
+        tasks.append(asyncio.create_task(hold(bounded=False)))
+        await asyncio.sleep(0)
+        queued = admission.stats()["batch"]["queued"]
+        release.set()
+        await asyncio.gather(*tasks)
+        return queued
+
+    assert asyncio.run(main()) == 2
+
+
+def test_higher_priority_lane_served_first():
+    async def main():
+        admission = _controller(capacity=1, batch_queue=8)
+        order = []
+        gate = asyncio.Event()
+
+        async def run(lane, name):
+            async with admission.slot(lane):
+                if name == "first":
+                    await gate.wait()
+                order.append(name)
+
+        first = asyncio.create_task(run("batch", "first"))
+        await asyncio.sleep(0)
+        waiting = [asyncio.create_task(run("batch", "batch")), asyncio.create_task(run("live", "live"))]
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(first, *waiting)
+        return order
+
+    assert asyncio.run(main()) == ["first", "live", "batch"]
+
+
+def test_tenants_are_served_round_robin():
+    async def main():
+        admission = _controller(capacity=1, batch_limit=1, batch_queue=16)
+        order = []
+        gate = asyncio.Event()
+
+        async def run(tenant, n):
+            async with admission.slot("batch", tenant):
+                if n < 0:
+                    await gate.wait()
+                else:
+                    order.append(f"{tenant}{n}")
+
+        first = asyncio.create_task(run("x", -1))
+        await asyncio.sleep(0)
+        # A noisy tenant queues three requests before a quiet one queues one.
+        waiting = [asyncio.create_task(run("a", i)) for i in range(3)] + [asyncio.create_task(run("b", 0))]
+        await asyncio.sleep(0)
+        gate.set()
+        await asyncio.gather(first, *waiting)
+        return order
+
+    assert asyncio.run(main()) == ["a0", "b0", "a1", "a2"]
+
+
+def test_interactive_endpoints_shed_load_when_the_lane_is_full():
+    from fastapi.testclient import TestClient
+
+    from app import main
+
+    body = {
+        "job_description": "# Backend Engineer\n- Python\n",
+        "resume": "- Built payment services in Python\n",
+        "transcript": "Interviewer: How?\nCandidate: Python.\n",
+    }
+    dossier = {**body, "rounds": [{"transcript": body["transcript"]}]}
+    with TestClient(main.app) as client:
+        admission = AdmissionController(
+            capacity=8, lanes={"interactive": _Lane("interactive", 1, limit=1, max_queue=1)}, max_wait_s=0.1
+        )
+        main.app.state.admission = admission
+        assert client.post("/evaluate", json=body).status_code == 200
+        assert admission.stats()["interactive"]["active"] == 0
+
+        admission._lanes["interactive"].active = 1  # another request holds the only slot
+        for path, payload in (("/evaluate", body), ("/evaluate-dossier", dossier)):
+            resp = client.post(path, json=payload)
+            assert resp.status_code == 503
+            assert int(resp.headers["retry-after"]) >= 1
@@ -0,0 +1,66 @@
+import uuid
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.agents.contradictions import ContradictionHunterAgent
+from app.agents.gap_analysis import GapAnalysisAgent
+from app.agents.transcript_evidence import TranscriptEvidenceAgent
+
+ASSIST = {
+    "job_description": "# Backend Engineer\n- Must have Python and PostgreSQL experience\n",
+    "resume": "- Built payment services in Python\n",
+    "transcript": "Interviewer: How did you scale it?\nCandidate: I'm not sure, I haven't used sharding.\n",
+    "config": {"memo": False},
+}
+
+
+@pytest.fixture()
+def client():
+    with TestClient(main.app) as c:
+        yield c
+
+
+def _assist(client, session_id, version, tenant="t", transcript=ASSIST["transcript"]):
+    body = {**ASSIST, "transcript": transcript, "session_id": session_id, "transcript_version": version}
+    assert client.post("/assist", json=body, headers={"x-tenant-id": tenant}).status_code == 200
+
+
+def test_finalize_reuses_the_session_analysis(client, monkeypatch):
+    session = uuid.uuid4().hex
+    _assist(client, session, 1)
+
+    async def fail(self, ctx):
+        raise AssertionError(f"{self.name} re-ran on finalize")
+
+    for agent in (TranscriptEvidenceAgent, GapAnalysisAgent, ContradictionHunterAgent):
+        monkeypatch.setattr(agent, "run", fail)
+    resp = client.post(
+        f"/assist/sessions/{session}/evaluate", json={"transcript_version": 1, "label": "ada"}, headers={"x-tenant-id": "t"}
+    )
+    assert resp.status_code == 200
+    assert resp.json()["verdict"]
+
+
+def test_finalize_unknown_or_foreign_session_is_404(client):
+    session = uuid.uuid4().hex
+    assert client.post(f"/assist/sessions/{session}/evaluate", json={}, headers={"x-tenant-id": "t"}).status_code == 404
+    _assist(client, session, 1, tenant="owner")
+    assert client.post(f"/assist/sessions/{session}/evaluate", json={}, headers={"x-tenant-id": "t"}).status_code == 404
+
+
+def test_finalize_stale_version_is_409(client):
+    session = uuid.uuid4().hex
+    _assist(client, session, 1)
+    _assist(client, session, 2, transcript=ASSIST["transcript"] + "Interviewer: Anything else?\n")
+    resp = client.post(f"/assist/sessions/{session}/evaluate", json={"transcript_version": 1}, headers={"x-tenant-id": "t"})
+    assert resp.status_code == 409
+
+
+def test_unchanged_transcript_under_a_newer_version_can_be_finalized(client):
+    session = uuid.uuid4().hex
+    _assist(client, session, 1)
+    _assist(client, session, 2)  # same inputs: joins the version 1 run
+    resp = client.post(f"/assist/sessions/{session}/evaluate", json={"transcript_version": 2}, headers={"x-tenant-id": "t"})
+    assert resp.status_code == 200
@@ -0,0 +1,100 @@
+import json
+import threading
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from app.capture import REPLAY_HEADER, CaptureLog, CaptureMiddleware, capture_record
+
+BODY = {
+    "job_description": "# Backend Engineer",
+    "resume": "Ada Lovelace, ada@example.com",
+    "transcript": "Candidate: hi",
+    "config": {"rubric": "default"},
+    "session_id": "sess-1",
+}
+
+
+def _record(mode):
+    return capture_record(
+        mode=mode, endpoint="/assist", tenant="acme", body=BODY, ts=1.0, status=200, latency_ms=5.0, ttfb_ms=1.0
+    )
+
+
+def test_redact_keeps_only_shape():
+    record = _record("redact")
+    assert record["sizes"] == {"job_description": 18, "resume": 29, "transcript": 13}
+    assert record["config"] == {"rubric": "default"}
+    assert "texts" not in record and "hashes" not in record
+    dumped = json.dumps(record)
+    assert "acme" not in dumped and "sess-1" not in dumped and "Lovelace" not in dumped
+
+
+def test_hash_is_stable_and_full_keeps_text():
+    hashed = _record("hash")
+    assert hashed["hashes"] == _record("hash")["hashes"]
+    assert "Lovelace" not in json.dumps(hashed)
+    full = _record("full")
+    assert full["texts"]["resume"] == BODY["resume"] and full["tenant"] == "acme"
+
+
+def _client(tmp_path, mode="redact", replay_token=""):
+    app = FastAPI()
+
+    @app.post("/assist")
+    async def assist(request: Request):
+        await request.json()
+        return {"ok": True}
+
+    log = CaptureLog(tmp_path / "capture.jsonl")
+    return TestClient(CaptureMiddleware(app, mode=mode, log=log, replay_token=replay_token)), log.path
+
+
+def test_middleware_logs_requests_but_not_replays(tmp_path):
+    client, path = _client(tmp_path, replay_token="s3cret")
+    assert client.post("/assist", json=BODY, headers={"x-tenant-id": "acme"}).status_code == 200
+    assert client.post("/assist", json=BODY, headers={REPLAY_HEADER: "s3cret"}).status_code == 200
+    lines = path.read_text().splitlines()
+    assert len(lines) == 1
+    record = json.loads(lines[0])
+    assert record["endpoint"] == "/assist" and record["status"] == 200 and record["mode"] == "redact"
+
+
+def test_replay_header_without_the_token_is_captured(tmp_path):
+    for i, (token, sent) in enumerate((("s3cret", "guess"), ("", "1"), ("", ""))):
+        (tmp_path / str(i)).mkdir()
+        client, path = _client(tmp_path / str(i), replay_token=token)
+        client.post("/assist", json=BODY, headers={REPLAY_HEADER: sent})
+        assert len(path.read_text().splitlines()) == 1
+
+
+def test_log_writes_run_off_the_event_loop(tmp_path, monkeypatch):
+    threads = []
+    real = CaptureLog.append
+
+    def append(self, record):
+        threads.append(threading.get_ident())
+        real(self, record)
+
+    monkeypatch.setattr(CaptureLog, "append", append)
+    client, _ = _client(tmp_path)
+    with client:
+        loop_thread = client.portal.call(threading.get_ident)
+        client.post("/assist", json=BODY)
+    assert threads and threads[0] != loop_thread
+
+
+def test_capture_off_writes_nothing(tmp_path):
+    client, path = _client(tmp_path, mode="off")
+    client.post("/assist", json=BODY)
+    assert not path.exists()
+
+
+def test_log_rotates_past_max_bytes(tmp_path):
+    log = CaptureLog(tmp_path / "capture.jsonl", max_bytes=200)
+    for i in range(10):
+        log.append({"i": i, "pad": "x" * 50})
+    rotated = tmp_path / "capture.jsonl.1"
+    assert rotated.exists()
+    assert log.path.stat().st_size <= 200 and rotated.stat().st_size <= 200
+    assert json.loads(log.path.read_text().splitlines()[-1])["i"] == 9
@@ -0,0 +1,39 @@
+import asyncio
+
+from app.agents.base import PanelContext
+from app.agents.contradictions import ContradictionHunterAgent, skill_matcher
+from app.agents.transcript_evidence import TranscriptEvidenceAgent
+
+RESUME = "- Built services in Python and Node.js\n- Ran Kubernetes and PostgreSQL\n"
+TRANSCRIPT = (
+    "Interviewer: Tell me about Kubernetes.\n"
+    "Candidate: I'm not sure, I haven't used kubernetes much.\n"
+    "Interviewer: And Node.js?\n"
+    "Candidate: Node.js for the build tools; pythonic code in Python.\n"
+    "Interviewer: I'm not sure that answers it.\n"
+)
+
+
+def test_mentions_are_word_bounded_and_case_insensitive():
+    matcher = skill_matcher(RESUME)
+    assert matcher.mentions("we used kubernetes, NODE.JS and python") == ["Kubernetes", "Node.js", "Python"]
+    assert matcher.mentions("pythonic nodejs my_python") == []
+
+
+def test_skill_chunks_index_the_evidence_chunks():
+    ctx = PanelContext(job_description="", resume=RESUME, transcript=TRANSCRIPT)
+    evidence = asyncio.run(TranscriptEvidenceAgent().run(ctx))
+    result = asyncio.run(ContradictionHunterAgent().run(ctx))
+    chunks = evidence.artifacts["chunks"]
+    skill_chunks = result.artifacts["skill_chunks"]
+    assert set(skill_chunks) == {"Kubernetes", "Node.js", "Python"}
+    for skill, idxs in skill_chunks.items():
+        assert all(skill.lower() in chunks[i].lower() for i in idxs)
+
+
+def test_red_flags_are_candidate_speech_only():
+    ctx = PanelContext(job_description="", resume=RESUME, transcript=TRANSCRIPT)
+    findings = asyncio.run(ContradictionHunterAgent().run(ctx)).findings
+    assert len(findings) == 1
+    assert findings[0].severity == "high" and findings[0].claim == "Kubernetes"
+    assert TRANSCRIPT[findings[0].evidence_span.start : findings[0].evidence_span.end].startswith("I'm not sure")
@@ -0,0 +1,98 @@
+from fastapi.testclient import TestClient
+
+from app import main
+from app.delta import AssistSnapshots, assign_ids, assist_etag, diff_assist, discrepancy_key, followup_key
+from app.models import AssistDelta, AssistResult, Discrepancy, FollowUp
+
+JD = "# Backend Engineer\n- Must have Python and PostgreSQL experience\n- Kubernetes\n- Kafka\n"
+RESUME = "- Built payment services in Python\n- Scaled PostgreSQL clusters\n- Ran Kubernetes and Kafka\n"
+LINES = [
+    "Interviewer: Tell me about payments.",
+    "Candidate: I built payment services in Python.",
+    "Interviewer: Kubernetes?",
+    "Candidate: I'm not sure, I haven't used Kubernetes.",
+    "Interviewer: Kafka?",
+    "Candidate: No idea, never used Kafka.",
+    "Interviewer: Postgres?",
+    "Candidate: I scaled PostgreSQL clusters with read replicas.",
+]
+
+
+def apply(state, delta):
+    """What a client does with a delta: patch its copy of the last result."""
+    if delta.full:
+        state = {"discrepancies": {}, "followups": {}, "risks": []}
+    for kind, order in (("discrepancies", delta.discrepancy_order), ("followups", delta.followup_order)):
+        items = dict(state[kind])
+        for item_id in getattr(delta, f"{kind}_removed"):
+            del items[item_id]
+        for item in getattr(delta, f"{kind}_added") + getattr(delta, f"{kind}_changed"):
+            items[item.id] = item
+        assert set(items) == set(order)
+        state[kind] = {i: items[i] for i in order}
+    if delta.risks is not None:
+        state["risks"] = delta.risks
+    return state
+
+
+def _view(result):
+    return {
+        "discrepancies": {d.id: d for d in result.discrepancies},
+        "followups": {f.id: f for f in result.followups},
+        "risks": result.risks,
+    }
+
+
+def _disc(claim, evidence="e", severity="medium"):
+    return Discrepancy(severity=severity, category="gap", claim=claim, evidence=evidence, explanation="x")
+
+
+def test_diff_round_trips():
+    base = AssistResult(
+        discrepancies=assign_ids([_disc("a"), _disc("b"), _disc("a")], discrepancy_key),
+        followups=assign_ids([FollowUp(question="q1"), FollowUp(question="q2")], followup_key),
+        risks=["r1"],
+    )
+    current = AssistResult(
+        discrepancies=assign_ids([_disc("c"), _disc("a", evidence="new", severity="high"), _disc("a")], discrepancy_key),
+        followups=assign_ids([FollowUp(question="q2", reason="because")], followup_key),
+        risks=["r1", "r2"],
+    )
+    first = diff_assist(base, etag=assist_etag(base), base=None, base_etag=None)
+    assert first.full
+    state = apply(None, first)
+    delta = diff_assist(current, etag=assist_etag(current), base=base, base_etag=first.etag)
+    assert not delta.full and delta.discrepancies_removed == [base.discrepancies[1].id]
+    assert apply(state, delta) == _view(current)
+
+
+def test_snapshots_are_scoped_by_tenant_and_session():
+    snapshots = AssistSnapshots()
+    result = AssistResult(discrepancies=[], followups=[])
+    snapshots.put("a", "s1", "etag", result)
+    assert snapshots.get("a", "s1", "etag") is result
+    assert snapshots.get("b", "s1", "etag") is None
+    assert snapshots.get("a", "s2", "etag") is None
+    assert snapshots.get("a", None, "etag") is None
+
+
+def test_live_deltas_rebuild_the_full_result():
+    with TestClient(main.app) as client:
+        headers = {"x-tenant-id": "t-delta"}
+        state, since = None, None
+        for n in range(2, len(LINES) + 1, 2):
+            body = {"job_description": JD, "resume": RESUME, "transcript": "\n".join(LINES[:n]), "session_id": "s1"}
+            delta = client.post("/assist/delta", json={**body, "since": since}, headers=headers)
+            assert delta.status_code == 200
+            delta = AssistDelta.model_validate(delta.json())
+            assert delta.full == (since is None)
+            full = AssistResult.model_validate(client.post("/assist", json=body, headers=headers).json())
+            state, since = apply(state, delta), delta.etag
+            assert state == _view(full)
+            assert since == assist_etag(full)
+
+        # Another tenant (or session) presenting the same ETag gets a full response.
+        for other in ({"x-tenant-id": "t-other"}, headers):
+            session = "s1" if other is not headers else "s2"
+            resp = client.post("/assist/delta", json={**body, "session_id": session, "since": since}, headers=other)
+            assert resp.json()["full"] is True
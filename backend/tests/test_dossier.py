@@ -0,0 +1,90 @@
+import asyncio
+
+from app.agents.base import PanelContext
+from app.agents.transcript_turns import transcript_index
+from app.dossier import InterviewRound, _analyze_round, _merge_contradictions, _merge_evidence, _Shifter, combine_transcripts, run_dossier
+from app.llm.factory import build_provider
+from app.llm.registry import ProviderRegistry
+
+JD = "# Backend Engineer\n- Must have Python and PostgreSQL experience\n- Designed distributed systems\n- Kubernetes\n"
+RESUME = "# Candidate\n- Built payment services in Python\n- Scaled PostgreSQL clusters\n- Ran Kubernetes in production\n"
+ROUNDS = [
+    InterviewRound(
+        "Round 1",
+        "Alex",
+        "Interviewer: Tell me about payments.\nCandidate: I built payment services in Python.\n"
+        "Interviewer: And Postgres?\nCandidate: I scaled PostgreSQL clusters with read replicas.\n",
+    ),
+    InterviewRound(
+        "Round 2",
+        "Sam",
+        "Interviewer:\nHow do you run Kubernetes?\nCandidate:\nI'm not sure, I haven't used Kubernetes much.\n"
+        "Note: a platform team ran it.\n",
+    ),
+    InterviewRound(
+        "Round 3",
+        "",
+        "Interviewer: Distributed systems?\nCandidate: I designed a distributed ledger in Python.\n",
+    ),
+]
+
+
+def _ctx():
+    return PanelContext(
+        job_description=JD,
+        resume=RESUME,
+        transcript="",
+        config={"memo": False, "store": False, "store_trace": False, "near_duplicates": False},
+        providers=ProviderRegistry(default=build_provider("heuristic")),
+        tenant="t-dossier",
+    )
+
+
+def _norm(text):
+    return " ".join(text.split())
+
+
+def _assert_in_turn(combined, turns, span):
+    assert span.turn is not None
+    assert _norm(combined[span.start : span.end]) in _norm(turns[span.turn].text)
+
+
+def test_merged_spans_point_at_their_turn():
+    combined, offsets = combine_transcripts(ROUNDS)
+    index = transcript_index(combined)
+    shift = _Shifter(index)
+
+    async def analyze():
+        return await asyncio.gather(*[_analyze_round(_ctx(), r) for r in ROUNDS])
+
+    per_round = [results for results, _ in asyncio.run(analyze())]
+    evidence = _merge_evidence(ROUNDS, per_round, offsets, shift)
+    spans = [s for s in evidence.artifacts["chunk_spans"] if s is not None]
+    contradictions = _merge_contradictions(ROUNDS, per_round, offsets, shift)
+    spans += [f.evidence_span for f in contradictions.findings if f.evidence_span is not None]
+    assert len(spans) >= 5
+    for span in spans:
+        _assert_in_turn(combined, index.turns, span)
+    assert evidence.artifacts["turns_count"] == len(index.turns)
+
+    chunks = evidence.artifacts["chunks"]
+    skill_chunks = contradictions.artifacts["skill_chunks"]
+    assert "Kubernetes" in skill_chunks and "Python" in skill_chunks
+    for skill, idxs in skill_chunks.items():
+        assert idxs and all(skill.lower() in chunks[i].lower() for i in idxs)
+
+
+def test_dossier_result_spans_point_at_their_turn():
+    result = asyncio.run(run_dossier(ctx=_ctx(), rounds=list(ROUNDS)))
+    combined, _ = combine_transcripts(ROUNDS)
+    turns = transcript_index(combined).turns
+    spans = [d.evidence_span for d in result.discrepancies if d.evidence_span and d.evidence_span.doc == "transcript"]
+    assert spans
+    for span in spans:
+        _assert_in_turn(combined, turns, span)
+
+
+def test_round_offsets_point_at_each_round():
+    combined, offsets = combine_transcripts(ROUNDS)
+    for r, offset in zip(ROUNDS, offsets):
+        assert combined[offset:].startswith(r.transcript.rstrip("\n"))
@@ -0,0 +1,51 @@
+from fastapi.testclient import TestClient
+
+from app import main
+
+REQUEST = {
+    "job_description": "# Backend Engineer\n- Must have Python and PostgreSQL experience\n- Kubernetes operations\n",
+    "resume": "- Built payment services in Python\n",
+    "transcript": "Interviewer: How?\nCandidate: Python services on PostgreSQL read replicas.\n",
+    "label": "zephyrine-candidate",
+}
+
+
+def _evaluate(client, tenant):
+    resp = client.post("/evaluate", json=REQUEST, headers={"x-tenant-id": tenant})
+    assert resp.status_code == 200
+    return resp.json()
+
+
+def test_stored_evaluation_is_scoped_to_the_tenant():
+    with TestClient(main.app) as client:
+        result = _evaluate(client, "owner")
+        eval_id = result["artifacts"]["evaluation_id"]
+        stored = client.get(f"/evaluations/{eval_id}", headers={"x-tenant-id": "owner"})
+        assert stored.status_code == 200
+        assert stored.json()["label"] == "zephyrine-candidate"
+        assert stored.json()["result"]["verdict"] == result["verdict"]
+        assert client.get(f"/evaluations/{eval_id}", headers={"x-tenant-id": "intruder"}).status_code == 404
+
+
+def test_search_filters_and_tenant_scope():
+    with TestClient(main.app) as client:
+        eval_id = _evaluate(client, "searcher")["artifacts"]["evaluation_id"]
+        own = {"x-tenant-id": "searcher"}
+
+        def ids(headers, **params):
+            return [i["id"] for i in client.get("/evaluations", params=params, headers=headers).json()["items"]]
+
+        assert eval_id in ids(own, q="zephyr")
+        assert eval_id in ids(own, gap="kubernetes")
+        assert eval_id not in ids(own, q="zephyrine haskell")
+        assert eval_id not in ids({"x-tenant-id": "other"}, q="zephyrine")
+
+
+def test_search_pages_newest_first():
+    with TestClient(main.app) as client:
+        headers = {"x-tenant-id": "pager"}
+        made = [_evaluate(client, "pager")["artifacts"]["evaluation_id"] for _ in range(3)]
+        first = client.get("/evaluations", params={"limit": 2}, headers=headers).json()
+        second = client.get("/evaluations", params={"limit": 2, "offset": first["next_offset"]}, headers=headers).json()
+        assert [i["id"] for i in first["items"] + second["items"]] == made[::-1]
+        assert second["next_offset"] is None
@@ -0,0 +1,66 @@
+import random
+import re
+import string
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.agents.transcript_evidence import _MAX_CHUNK_CHARS, _chunk_transcript_spans
+
+_TS = re.compile(r"\[\d\d:\d\d:\d\d\]")
+rng = random.Random(3)
+
+
+def _words(n):
+    return " ".join("".join(rng.choices(string.ascii_lowercase, k=rng.randint(1, 12))) for _ in range(n))
+
+
+CASES = [
+    "Interviewer: hi?\nCandidate: " + _words(3000) + "\nInterviewer: ok?\n",
+    "Interviewer: hi?\nCandidate: "
+    + "\n".join(f"[00:0{i % 10}:1{i % 10}] " + _words(80) for i in range(60))
+    + "\nInterviewer: bye",
+    "Candidate: " + "x" * 7000 + " " + _words(500),
+    _words(5000),
+    "Candidate: " + "   ".join(_words(1) for _ in range(3000)),
+]
+
+
+def _plain(words):
+    return [w for w in words if not _TS.fullmatch(w)]
+
+
+@pytest.mark.parametrize("transcript", CASES)
+def test_chunk_spans_slice_their_text(transcript):
+    for text, span in _chunk_transcript_spans(transcript):
+        assert _plain(transcript[span.start : span.end].split()) == _plain(text.split())
+        assert len(text) <= _MAX_CHUNK_CHARS
+
+
+BODY = {
+    "job_description": "# Backend Engineer\n- Must have Python, Kubernetes and PostgreSQL experience\n",
+    "resume": "- Built payment services in Python\n- Ran Kubernetes in production\n- Scaled PostgreSQL clusters\n",
+    "transcript": "Interviewer: Kubernetes?\nCandidate: I'm not sure, I haven't used Kubernetes.\n"
+    "Interviewer: Postgres?\nCandidate: No idea, never used PostgreSQL replicas.\n",
+    "config": {"store": False, "store_trace": False},
+}
+
+
+@pytest.mark.parametrize("mode", ["both", "span", "text"])
+def test_discrepancy_spans_point_into_their_document(mode):
+    with TestClient(main.app) as client:
+        result = client.post("/evaluate", json={**BODY, "config": {**BODY["config"], "evidence_mode": mode}}).json()
+    spanned = [d for d in result["discrepancies"] if d["evidence_span"]]
+    if mode == "text":
+        assert not spanned and all(d["evidence"] for d in result["discrepancies"])
+        return
+    assert spanned
+    for d in spanned:
+        span = d["evidence_span"]
+        piece = BODY[span["doc"]][span["start"] : span["end"]]
+        assert piece.strip()
+        if mode == "both":
+            assert " ".join(piece.split()) == " ".join(d["evidence"].split())
+        else:
+            assert d["evidence"] == ""
@@ -0,0 +1,34 @@
+from app.agents import gap_analysis
+from app.agents.gap_analysis import _spoken_terms, _terms_of, compile_jd_profile
+
+JD = "# Role\n- Java services\n- Designed distributed systems\n- Go and Kubernetes\n"
+
+
+def _coverage(resume_text):
+    return compile_jd_profile(JD).coverage(frozenset(_terms_of(resume_text)))
+
+
+def test_whole_words_only():
+    cov = _coverage("JavaScript frontends, golang tooling")
+    assert "Java services" in cov.gaps and "Go and Kubernetes" in cov.gaps
+
+
+def test_suffix_folding_and_hyphen_parts():
+    cov = _coverage("I design highly-distributed system services in Java; ran Kubernetes and Go")
+    assert cov.gaps == []
+    assert cov.ratio == 1.0
+
+
+def test_distinctive_terms_weigh_more():
+    profile = compile_jd_profile("- Python APIs\n- Python data pipelines\n")
+    apis, pipelines = profile.matchers
+    assert apis.weights[apis.terms.index("python")] == 0.5
+    assert apis.weights[apis.terms.index("apis")] == 1.0
+    assert pipelines.score(frozenset({"python"})) < pipelines.score(frozenset({"pipelin", "data"}))
+
+
+def test_incremental_spoken_terms_equal_a_fresh_tokenization():
+    text = "we designed the ledger, sharded postgres and ran kubernetes-based jobs"
+    gap_analysis._TRANSCRIPT_TERMS.clear()
+    for cut in range(1, len(text) + 1):
+        assert _spoken_terms(text[:cut]) == frozenset(_terms_of(text[:cut])), text[:cut]
@@ -0,0 +1,39 @@
+from fastapi.testclient import TestClient
+
+from app import main
+from app.jd_profiles import JDProfileStore
+
+JD = "# Backend Engineer\n- Must have Python and PostgreSQL experience\n- Designed distributed systems\n"
+BODY = {
+    "resume": "- Built payment services in Python\n- Scaled PostgreSQL clusters\n",
+    "transcript": "Interviewer: How did you scale it?\nCandidate: Read replicas on PostgreSQL, designed the sharding.\n",
+    "config": {"store": False, "store_trace": False, "memo": False},
+}
+
+
+def test_registration_is_content_addressed_per_tenant(tmp_path):
+    store = JDProfileStore(tmp_path / "p.sqlite3")
+    first, _, created = store.register(tenant="a", job_description=JD)
+    again, _, created_again = store.register(tenant="a", job_description=JD.replace("\n", "\n\n  "))
+    other, _, _ = store.register(tenant="b", job_description=JD)
+    assert created and not created_again
+    assert again.profile_id == first.profile_id != other.profile_id
+    assert store.get("b", first.profile_id) is None
+
+
+def test_stored_profile_matches_like_the_compiled_one(tmp_path):
+    profile, _, _ = JDProfileStore(tmp_path / "p.sqlite3").register(tenant="a", job_description=JD)
+    reloaded, _ = JDProfileStore(tmp_path / "p.sqlite3").get("a", profile.profile_id)  # cold cache
+    assert reloaded.requirements == profile.requirements
+    assert reloaded.matchers == profile.matchers
+
+
+def test_evaluating_by_profile_id_equals_inline_jd():
+    with TestClient(main.app) as client:
+        pid = client.post("/jd-profiles", json={"job_description": JD}).json()["id"]
+        by_id = client.post("/evaluate", json={**BODY, "jd_profile_id": pid}).json()
+        inline = client.post("/evaluate", json={**BODY, "job_description": JD}).json()
+        assert client.post("/evaluate", json={**BODY, "jd_profile_id": "nope"}).status_code == 404
+    assert by_id["verdict"] == inline["verdict"]
+    assert by_id["scores"] == inline["scores"]
+    assert by_id["artifacts"]["gaps"] == inline["artifacts"]["gaps"]
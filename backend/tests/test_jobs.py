@@ -0,0 +1,144 @@
+import asyncio
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import jobs, main
+from app.admission import AdmissionController, _Lane
+from app.jobs import JobStore, JobWorkerPool
+from app.llm.factory import build_provider
+from app.llm.registry import ProviderRegistry
+
+REQUEST = {
+    "job_description": "# Backend Engineer\n- Python and PostgreSQL\n",
+    "resume": "- Built payment services in Python\n",
+    "transcript": "Interviewer: How?\nCandidate: With Python and PostgreSQL read replicas.\n",
+}
+
+
+@pytest.fixture()
+def store(tmp_path):
+    return JobStore(tmp_path / "jobs.sqlite3", lease_s=0.3, max_attempts=2)
+
+
+def test_get_is_scoped_to_the_tenant(store):
+    status, _ = store.submit(request=REQUEST, tenant="a")
+    assert store.get("a", status.job_id)["id"] == status.job_id
+    assert store.get("b", status.job_id) is None
+
+
+def test_job_endpoints_are_scoped_to_the_tenant():
+    with TestClient(main.app) as client:
+        job = client.post("/jobs", json=REQUEST, headers={"x-tenant-id": "owner"}).json()
+        for path in (f"/jobs/{job['job_id']}", f"/jobs/{job['job_id']}/result"):
+            assert client.get(path, headers={"x-tenant-id": "intruder"}).status_code == 404
+        deadline = time.time() + 10
+        while client.get(f"/jobs/{job['job_id']}", headers={"x-tenant-id": "owner"}).json()["status"] != "succeeded":
+            assert time.time() < deadline
+            time.sleep(0.05)
+        assert client.get(f"/jobs/{job['job_id']}/result", headers={"x-tenant-id": "owner"}).status_code == 200
+
+
+def _pool(store, admission=None):
+    return JobWorkerPool(store, workers=0, providers=ProviderRegistry(default=build_provider("heuristic")), admission=admission)
+
+
+def test_lease_is_renewed_while_waiting_for_a_batch_slot(store):
+    admission = AdmissionController(capacity=1, lanes={"batch": _Lane("batch", 2, limit=1, max_queue=0)}, max_wait_s=0)
+    status, _ = store.submit(request={**REQUEST, "config": {"store": False}}, tenant="a")
+
+    async def main():
+        release = asyncio.Event()
+
+        async def hog():
+            async with admission.slot("batch", bounded=False):
+                await release.wait()
+
+        hogging = asyncio.create_task(hog())
+        await asyncio.sleep(0)
+        row = await asyncio.to_thread(store.claim)
+        running = asyncio.create_task(_pool(store, admission).run_one(row))
+        # Several lease lengths pass while the job waits behind the hog.
+        await asyncio.sleep(store.lease_s * 4)
+        second = await asyncio.to_thread(store.claim)
+        release.set()
+        await asyncio.gather(hogging, running)
+        return second
+
+    assert asyncio.run(main()) is None  # never handed to a second worker
+    row = store.get("a", status.job_id)
+    assert row["status"] == "succeeded" and row["attempts"] == 1
+
+
+def test_expired_lease_is_retried_then_failed(store):
+    status, _ = store.submit(request=REQUEST, tenant="a")
+    first = store.claim()
+    assert first["attempts"] == 1 and store.claim() is None
+    time.sleep(store.lease_s + 0.05)
+    second = store.claim()  # the first worker died: retried
+    assert second["id"] == status.job_id and second["attempts"] == 2
+    # The stale first attempt can't finish or renew a job it no longer holds.
+    store.finish(status.job_id, first["attempts"], result="{}")
+    assert not store.renew(status.job_id, first["attempts"])
+    assert store.get("a", status.job_id)["status"] == "running"
+    time.sleep(store.lease_s + 0.05)
+    assert store.claim() is None  # max_attempts reached
+    row = store.get("a", status.job_id)
+    assert row["status"] == "failed" and "lease expired" in row["error"]
+
+
+def test_failed_panel_is_recorded_once(store, monkeypatch):
+    async def boom(*, ctx, seed=None):
+        raise RuntimeError("provider down")
+
+    monkeypatch.setattr(jobs, "run_panel", boom)
+    status, _ = store.submit(request=REQUEST, tenant="a")
+    asyncio.run(_pool(store).run_one(store.claim()))
+    row = store.get("a", status.job_id)
+    assert row["status"] == "failed" and "provider down" in row["error"] and row["attempts"] == 1
+
+
+def test_idempotency_key_returns_the_existing_job_per_tenant(store):
+    first, created = store.submit(request=REQUEST, tenant="a", idempotency_key="k1")
+    again, created_again = store.submit(request=REQUEST, tenant="a", idempotency_key="k1")
+    other, created_other = store.submit(request=REQUEST, tenant="b", idempotency_key="k1")
+    assert created and not created_again and created_other
+    assert again.job_id == first.job_id != other.job_id
+
+
+def test_cancelled_job_is_released_off_the_event_loop(store, monkeypatch):
+    on_loop = []
+
+    async def forever(*, ctx, seed=None):
+        await asyncio.sleep(30)
+
+    real_release = store.release
+
+    def release(job_id, attempt):
+        on_loop.append(_on_loop_thread())
+        real_release(job_id, attempt)
+
+    monkeypatch.setattr(jobs, "run_panel", forever)
+    monkeypatch.setattr(store, "release", release)
+    status, _ = store.submit(request=REQUEST, tenant="a")
+
+    async def main():
+        running = asyncio.create_task(_pool(store).run_one(store.claim()))
+        await asyncio.sleep(0.05)
+        running.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await running
+
+    asyncio.run(main())
+    assert on_loop == [False]
+    row = store.get("a", status.job_id)
+    assert row["status"] == "queued" and store.claim()["id"] == status.job_id
+
+
+def _on_loop_thread():
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
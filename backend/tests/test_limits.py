@@ -0,0 +1,63 @@
+import asyncio
+import random
+
+from app import limits
+from app.agents.base import PanelContext
+from app.limits import InputLimits, cap_inputs, cap_text
+from app.llm.factory import build_provider
+from app.llm.registry import ProviderRegistry
+from app.orchestrator import run_panel
+
+JD = "# Backend Engineer\n- Must have Python and PostgreSQL experience\n"
+RESUME = "- Built payment services in Python\n"
+
+
+def test_short_text_is_returned_as_is():
+    text = "Candidate: hi\n"
+    assert cap_text(text, 100) is text
+    assert cap_text(text, 0) is text
+
+
+def test_cut_prefers_a_nearby_line_break():
+    text = "a" * 60 + "\n" + "b" * 60
+    assert cap_text(text, 80) == "a" * 60
+    no_breaks = "c" * 200
+    assert cap_text(no_breaks, 80) == "c" * 80
+    far_break = "d" * 10 + "\n" + "e" * 200
+    assert cap_text(far_break, 80) == far_break[:80]
+
+
+def test_cut_is_stable_as_the_text_grows():
+    rng = random.Random(3)
+    text = ""
+    cuts = set()
+    while len(text) < 5_000:
+        text += rng.choice(["Candidate: ", "Interviewer: ", "ok ", "sharding ", "\n"])
+        if len(text) > 1_000:
+            cuts.add(cap_text(text, 1_000))
+    assert len(cuts) == 1
+    assert len(cuts.pop()) <= 1_000
+
+
+def test_cap_inputs_reports_what_was_cut():
+    ctx = PanelContext(job_description=JD, resume=RESUME, transcript="Candidate: ok\n" * 100)
+    capped, report = cap_inputs(ctx, InputLimits(job_description=0, resume=1_000, transcript=140))
+    assert capped.resume is ctx.resume and capped.job_description is ctx.job_description
+    assert report == {"transcript": {"chars": 1_400, "kept": len(capped.transcript), "limit": 140}}
+    assert len(capped.transcript) <= 140 and capped.transcript.endswith("ok")
+
+    same, none = cap_inputs(ctx, InputLimits(job_description=0, resume=0, transcript=0))
+    assert same is ctx and none == {}
+
+
+def test_panel_result_reports_truncation(monkeypatch):
+    monkeypatch.setattr(limits, "_LIMITS", InputLimits(transcript=200))
+    ctx = PanelContext(
+        job_description=JD,
+        resume=RESUME,
+        transcript="Interviewer: How?\nCandidate: Python and PostgreSQL replicas.\n" * 50,
+        config={"memo": False, "store": False, "store_trace": False, "near_duplicates": False},
+        providers=ProviderRegistry(default=build_provider("heuristic")),
+    )
+    result = asyncio.run(run_panel(ctx=ctx))
+    assert result.artifacts["truncated"]["transcript"]["limit"] == 200
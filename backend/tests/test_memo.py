@@ -0,0 +1,77 @@
+import asyncio
+from dataclasses import dataclass, replace
+from typing import ClassVar
+
+from app.agents.base import AgentResult, PanelContext
+from app.agents.memo import AgentMemo, memo_key
+from app.agents.resume_claims import ResumeClaimsAgent
+from app.llm.factory import build_provider
+from app.llm.registry import ProviderRegistry
+
+CTX = PanelContext(
+    job_description="# Backend Engineer\n- Python\n",
+    resume="- Built payment services in Python\n",
+    transcript="Interviewer: How?\nCandidate: Python.\n",
+    config={"rubric": "default"},
+    providers=ProviderRegistry(default=build_provider("heuristic")),
+)
+
+
+@dataclass
+class CountingAgent:
+    name: str = "counting"
+    depends_on: ClassVar[tuple[str, ...] | None] = ("resume", "config.rubric")
+    calls: int = 0
+
+    async def run(self, ctx: PanelContext) -> AgentResult:
+        self.calls += 1
+        return AgentResult(artifacts={"calls": self.calls, "items": []})
+
+
+def test_key_covers_only_declared_inputs():
+    agent = ResumeClaimsAgent()
+    base = memo_key(agent, CTX)
+    assert memo_key(agent, replace(CTX, transcript="Candidate: something else")) == base
+    assert memo_key(agent, replace(CTX, job_description="# Other role")) == base
+    assert memo_key(agent, replace(CTX, resume="- Wrote compilers\n")) != base
+
+
+def test_config_entries_are_keyed_individually():
+    agent = CountingAgent()
+    base = memo_key(agent, CTX)
+    assert memo_key(agent, replace(CTX, config={"rubric": "default", "debate_rounds": 3})) == base
+    assert memo_key(agent, replace(CTX, config={"rubric": "strict"})) != base
+
+
+def test_undeclared_agents_are_never_memoized():
+    agent = CountingAgent()
+    agent.depends_on = None
+    assert memo_key(agent, CTX) is None
+
+
+def test_hit_when_unrelated_inputs_change():
+    memo, agent = AgentMemo(), CountingAgent()
+    first, hit = asyncio.run(memo.run(agent, CTX))
+    assert not hit
+    again, hit = asyncio.run(memo.run(agent, replace(CTX, transcript="Candidate: new answer")))
+    assert hit and agent.calls == 1
+    again.artifacts["items"].append("mutated")  # hits are copies
+    assert asyncio.run(memo.run(agent, CTX))[0].artifacts["items"] == []
+    asyncio.run(memo.run(agent, replace(CTX, resume="- Wrote compilers\n")))
+    assert agent.calls == 2
+
+
+def test_memo_can_be_turned_off_per_request():
+    memo, agent = AgentMemo(), CountingAgent()
+    off = replace(CTX, config={"rubric": "default", "memo": False})
+    asyncio.run(memo.run(agent, off))
+    _, hit = asyncio.run(memo.run(agent, off))
+    assert not hit and agent.calls == 2
+
+
+def test_lru_is_bounded():
+    memo = AgentMemo(max_entries=2)
+    for key in ("a", "b", "c"):
+        memo.put(key, AgentResult())
+    assert memo.get("a") is None
+    assert memo.get("c") is not None
@@ -0,0 +1,74 @@
+import asyncio
+import uuid
+
+from app.agents.base import PanelContext
+from app.agents.near_duplicates import NearDuplicateAgent
+
+RESUME = "- Built payment services in Python handling ten thousand requests per second\n- Scaled PostgreSQL clusters\n"
+TRANSCRIPT = (
+    "Interviewer: How did you scale the payment service?\n"
+    "Candidate: We sharded the ledger by merchant id, added read replicas for reporting and moved "
+    "idempotency keys into Redis so retries from the gateway never double charged a customer.\n"
+)
+
+
+def _run(tenant, *, candidate="", resume=RESUME, transcript=TRANSCRIPT):
+    ctx = PanelContext(
+        job_description="",
+        resume=resume,
+        transcript=transcript,
+        config={"near_duplicates": True},
+        tenant=tenant,
+        candidate=candidate,
+    )
+    return asyncio.run(NearDuplicateAgent().run(ctx))
+
+
+def test_edited_resume_of_the_same_candidate_is_not_a_duplicate():
+    tenant = uuid.uuid4().hex
+    _run(tenant, candidate="Ada Lovelace")
+    again = _run(tenant, candidate="ada  lovelace", resume=RESUME + "- Mentored two engineers\n")
+    assert again.artifacts["matches"] == 0
+
+
+def test_other_candidate_with_the_same_answer_is_flagged():
+    tenant = uuid.uuid4().hex
+    _run(tenant, candidate="Ada Lovelace")
+    other = _run(tenant, candidate="Grace Hopper", resume="- Wrote compilers\n")
+    assert other.artifacts["matches"] >= 1
+    assert other.findings[0].evidence_span is not None
+
+
+def test_unlabelled_runs_are_owned_by_the_resume():
+    tenant = uuid.uuid4().hex
+    _run(tenant)
+    assert _run(tenant).artifacts["matches"] == 0
+    assert _run(tenant, resume="- Wrote compilers\n").artifacts["matches"] >= 1
+
+
+def test_tenants_do_not_see_each_other():
+    _run(uuid.uuid4().hex, candidate="Ada Lovelace")
+    assert _run(uuid.uuid4().hex, candidate="Grace Hopper").artifacts["matches"] == 0
+
+
+def test_finding_quotes_only_this_candidates_text():
+    tenant = uuid.uuid4().hex
+    first = "Interviewer: Scaling?\nCandidate: " + TRANSCRIPT.split("Candidate: ")[1].replace("Redis", "Memcached")
+    _run(tenant, candidate="Ada Lovelace", transcript=first)
+    other = _run(tenant, candidate="Grace Hopper", resume="- Wrote compilers\n")
+    finding = other.findings[0]
+    assert "Memcached" not in (finding.evidence or "") + (finding.explanation or "")
+    span = finding.evidence_span
+    assert TRANSCRIPT[span.start : span.end] == finding.evidence
+
+
+def test_hot_bucket_reads_the_newest_entries(tmp_path, monkeypatch):
+    from app import near_dup
+
+    monkeypatch.setattr(near_dup, "_MAX_BUCKET_HITS", 2)
+    index = near_dup.NearDuplicateIndex(tmp_path / "nd.sqlite3")
+    text = "we sharded the ledger by merchant id and added read replicas for reporting queries"
+    for i in range(5):
+        index.check_and_add(tenant="t", owner=f"o{i}", docs=[("answer", text)])
+    matches = [index.check_and_add(tenant="t", owner="probe", docs=[("answer", text)])[0].match_id for _ in range(3)]
+    assert matches == [5, 5, 5]
@@ -0,0 +1,118 @@
+import asyncio
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main, ranking
+from app.agents.gap_analysis import compile_jd_profile
+from app.models import RankCandidate
+
+JD = "# Backend Engineer\n- Must have Python and PostgreSQL experience\n- Designed distributed systems\n"
+
+
+def _candidates(n):
+    return [
+        {
+            "id": f"c{i}",
+            "resume": f"- Built payment service {i} in Python\n- Scaled PostgreSQL clusters",
+            "transcript": f"Interviewer: How did you scale it?\nCandidate: Read replicas and partitioning, case {i}.",
+        }
+        for i in range(n)
+    ]
+
+
+@pytest.fixture()
+def client():
+    with TestClient(main.app) as c:
+        yield c
+
+
+def test_top_k_panels_each_hold_a_batch_slot(client, monkeypatch):
+    running = peak = 0
+    real = main.run_panel
+    admission = client.app.state.admission
+
+    async def counted(*, ctx, seed=None):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        assert admission.stats()["batch"]["active"] >= running
+        try:
+            await asyncio.sleep(0.01)
+            return await real(ctx=ctx, seed=seed)
+        finally:
+            running -= 1
+
+    monkeypatch.setattr(main, "run_panel", counted)
+    resp = client.post("/rank", json={"job_description": JD, "candidates": _candidates(20), "top_k": 20})
+    assert resp.status_code == 200, resp.text
+    ranked = resp.json()["ranked"]
+    assert sum(1 for r in ranked if r["evaluation"]) == 20
+    assert peak <= admission.stats()["batch"]["limit"]
+    assert admission.stats()["batch"] == {**admission.stats()["batch"], "active": 0, "queued": 0}
+
+
+def test_duplicate_candidate_ids_are_rejected(client):
+    candidates = _candidates(3)
+    candidates[2]["id"] = "c0"
+    resp = client.post("/rank", json={"job_description": JD, "candidates": candidates, "top_k": 3})
+    assert resp.status_code == 400
+    assert "c0" in resp.json()["detail"]
+
+
+def test_failed_panel_cancels_the_others(client, monkeypatch):
+    cancelled = 0
+
+    async def flaky(*, ctx, seed=None):
+        nonlocal cancelled
+        if "case 0." in ctx.transcript:
+            raise RuntimeError("panel failed")
+        try:
+            await asyncio.sleep(30)
+        except asyncio.CancelledError:
+            cancelled += 1
+            raise
+
+    monkeypatch.setattr(main, "run_panel", flaky)
+    client_no_raise = TestClient(client.app, raise_server_exceptions=False)
+    t0 = time.perf_counter()
+    resp = client_no_raise.post("/rank", json={"job_description": JD, "candidates": _candidates(4), "top_k": 4})
+    assert resp.status_code == 500
+    assert time.perf_counter() - t0 < 10  # not waiting for the sibling panels
+    assert cancelled >= 1
+
+
+def _rank_candidates(n):
+    skills = ["Python", "PostgreSQL", "distributed systems", "Kafka", "Rust"]
+    return [
+        RankCandidate(
+            id=f"c{i}",
+            resume="\n".join(f"- Built {s} services" for s in skills[: i % 5 + 1]),
+            transcript="Candidate: " + " and ".join(skills[: i % 3 + 1]),
+        )
+        for i in range(n)
+    ]
+
+
+def test_ranking_is_best_first_and_stable(monkeypatch):
+    monkeypatch.setenv("PANELAI_RANK_WORKERS", "1")
+    ranked = ranking.rank_candidates(compile_jd_profile(JD), _rank_candidates(10))
+    assert [r.rank for r in ranked] == list(range(1, 11))
+    assert all(a.score >= b.score for a, b in zip(ranked, ranked[1:]))
+    for a, b in zip(ranked, ranked[1:]):
+        if a.score == b.score:
+            assert int(a.id[1:]) < int(b.id[1:])  # ties keep input order
+
+
+def test_process_pool_ranks_like_inline(monkeypatch):
+    profile = compile_jd_profile(JD)
+    candidates = _rank_candidates(ranking._PARALLEL_MIN + 6)
+    monkeypatch.setenv("PANELAI_RANK_WORKERS", "1")
+    inline = ranking.rank_candidates(profile, candidates)
+    monkeypatch.setenv("PANELAI_RANK_WORKERS", "2")
+    try:
+        pooled = ranking.rank_candidates(profile, candidates)
+    finally:
+        ranking.shutdown_pool()
+    assert [r.model_dump() for r in pooled] == [r.model_dump() for r in inline]
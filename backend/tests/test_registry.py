@@ -0,0 +1,25 @@
+import pytest
+
+from app.llm.factory import build_provider
+from app.llm.registry import ProviderRegistry, _parse_routes
+
+
+def test_routes_share_one_provider_per_spec(monkeypatch):
+    monkeypatch.setenv("PANELAI_LLM_PROVIDER", "heuristic")
+    monkeypatch.setenv("OPENAI_API_KEY", "test-key")  # providers are built, never called
+    monkeypatch.setenv("PANELAI_LLM_ROUTES", "resume-claims=openai:gpt-4o-mini, Judge=openai:gpt-4o-mini, hm=openai:gpt-4o")
+    registry = ProviderRegistry.from_env()
+    assert registry.for_role("resume-claims") is registry.for_role("judge")
+    assert registry.for_role("hm") is not registry.for_role("judge")
+    assert registry.for_role("gap-analysis") is registry.default
+    assert len(registry.distinct()) == 3
+    assert registry.for_role("hm").model == "gpt-4o"
+
+
+def test_route_parsing_skips_malformed_parts():
+    assert _parse_routes("a=heuristic, b=, =openai, c") == {"a": "heuristic"}
+
+
+def test_unknown_provider_kind_is_rejected():
+    with pytest.raises(ValueError):
+        build_provider("nope:model")
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main, responses
+from app.models import AgentMessage, EvaluationResult
+
+
+def _result():
+    trace = [AgentMessage(agent="judge", stage="panel", content="é" * 50, meta={"n": i}) for i in range(200)]
+    return EvaluationResult(
+        verdict="hire",
+        overall_reasoning="ok",
+        scores=[],
+        discrepancies=[],
+        strengths=["Python"],
+        risks=[],
+        next_interview_questions=[],
+        trace=trace,
+        artifacts={"k": {1: "v"}, "ratio": 0.25},
+    )
+
+
+def test_dump_json_is_pydantics_compact_json():
+    model = _result()
+    assert responses.dump_json(model) == model.model_dump_json().encode("utf-8")
+
+
+def test_gzip_fallback_without_brotli(monkeypatch):
+    monkeypatch.setattr(responses, "brotli", None)
+    assert responses.negotiate_encoding("br, gzip;q=0.5") == "gzip"
+    assert responses.negotiate_encoding("br") is None
+    assert responses.negotiate_encoding("identity, gzip;q=0") is None
+
+
+def test_brotli_preferred_when_installed():
+    if responses.brotli is None:
+        pytest.skip("brotli not installed")
+    assert responses.negotiate_encoding("gzip, br") == "br"
+
+
+def test_large_responses_are_compressed_and_round_trip():
+    body = {
+        "job_description": "# Backend Engineer\n- Python and PostgreSQL\n",
+        "resume": "- Built payment services in Python\n",
+        "transcript": "Interviewer: How?\nCandidate: With Python and PostgreSQL read replicas.\n",
+        "config": {"store": False, "store_trace": False, "trace": "full"},
+    }
+    with TestClient(main.app) as client:
+        plain = client.post("/evaluate", json=body, headers={"accept-encoding": "identity"})
+        packed = client.post("/evaluate", json=body, headers={"accept-encoding": "gzip"})
+    assert len(plain.content) >= 1024 and "content-encoding" not in plain.headers
+    assert packed.headers["content-encoding"] == "gzip"
+    assert packed.json()["verdict"] == plain.json()["verdict"]
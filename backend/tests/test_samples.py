@@ -0,0 +1,72 @@
+import os
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app import main
+from app.samples import SampleCatalog
+
+
+def _write(root, sample_id, role="Backend Engineer"):
+    d = root / sample_id
+    d.mkdir()
+    (d / "job_description.md").write_text(f"# Job Description — {role}\n- Python\n")
+    (d / "resume.md").write_text(f"# Candidate — {sample_id.title()}\n- Built things\n")
+    (d / "transcript.md").write_text("Interviewer: Hi\nCandidate: Hello\n")
+    return d
+
+
+@pytest.fixture()
+def catalog(tmp_path):
+    for i in range(5):
+        _write(tmp_path, f"sample-{i}", role="Data Engineer" if i % 2 else "Backend Engineer")
+    (tmp_path / "incomplete").mkdir()
+    return SampleCatalog(tmp_path, rescan_s=3600)
+
+
+def test_pages_are_sorted_and_skip_incomplete_samples(catalog):
+    first, total, _ = catalog.list(offset=0, limit=3)
+    rest, _, _ = catalog.list(offset=3, limit=3)
+    assert total == 5
+    assert [e.id for e in first + rest] == [f"sample-{i}" for i in range(5)]
+    assert first[0].title == "Backend Engineer" and first[0].candidate == "Sample-0"
+
+
+def test_query_filters_before_paging(catalog):
+    entries, total, _ = catalog.list(q="data", limit=1)
+    assert total == 2 and [e.id for e in entries] == ["sample-1"]
+
+
+def test_etag_changes_when_a_sample_changes(catalog, tmp_path):
+    _, _, etag = catalog.list()
+    before = catalog.entry("sample-2").etag
+    path = tmp_path / "sample-2" / "transcript.md"
+    path.write_text("Interviewer: Hi\nCandidate: Hello again\n")
+    os.utime(path, ns=(0, 10**18))
+    assert catalog.entry("sample-2").etag != before
+    assert catalog.content(catalog.entry("sample-2"))["transcript"].endswith("again\n")
+    assert catalog.list()[2] != etag
+
+
+def test_new_sample_shows_up_without_waiting_for_rescan(catalog, tmp_path):
+    catalog.list()
+    _write(tmp_path, "sample-9")
+    os.utime(tmp_path, ns=(0, 10**18))
+    assert catalog.list()[1] == 6
+
+
+def test_endpoints_paginate_and_answer_304(catalog):
+    with TestClient(main.app) as client:
+        main.app.state.samples = catalog
+        page = client.get("/samples", params={"limit": 2})
+        assert page.status_code == 200
+        assert page.json()["next_offset"] == 2 and page.json()["total"] == 5
+        etag = page.headers["etag"]
+        assert client.get("/samples", params={"limit": 2}, headers={"if-none-match": etag}).status_code == 304
+        assert client.get("/samples", params={"limit": 3}, headers={"if-none-match": etag}).status_code == 200
+
+        one = client.get("/samples/sample-0")
+        assert one.json()["resume"].startswith("# Candidate")
+        assert client.get("/samples/sample-0", headers={"if-none-match": one.headers["etag"]}).status_code == 304
+        assert client.get("/samples/incomplete").status_code == 404
+        assert client.get("/samples/nope").status_code == 404
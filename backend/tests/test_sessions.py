@@ -0,0 +1,78 @@
+import asyncio
+
+from app.models import AssistResult
+from app.sessions import AssistSessions
+
+
+def _result(tag):
+    return AssistResult(discrepancies=[], followups=[], risks=[tag])
+
+
+def test_same_inputs_share_one_run():
+    async def main():
+        sessions = AssistSessions()
+        calls = 0
+
+        async def compute():
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.02)
+            return _result("v1")
+
+        results = await asyncio.gather(*[sessions.run("s", version=1, key="k", compute=compute) for _ in range(5)])
+        return calls, results
+
+    calls, results = asyncio.run(main())
+    assert calls == 1 and all(r.risks == ["v1"] for r in results)
+
+
+def test_newer_version_cancels_and_stale_waiters_get_the_newest():
+    async def main():
+        sessions = AssistSessions()
+        cancelled = []
+
+        def compute(tag, delay):
+            async def run():
+                try:
+                    await asyncio.sleep(delay)
+                except asyncio.CancelledError:
+                    cancelled.append(tag)
+                    raise
+                return _result(tag)
+
+            return run
+
+        old = asyncio.create_task(sessions.run("s", version=1, key="k1", compute=compute("v1", 1.0)))
+        await asyncio.sleep(0.01)
+        new = asyncio.create_task(sessions.run("s", version=2, key="k2", compute=compute("v2", 0.02)))
+        # An out-of-order request for an older version joins the newest run instead of computing.
+        late = asyncio.create_task(sessions.run("s", version=1, key="k1", compute=compute("late", 0.0)))
+        return await asyncio.gather(old, new, late), cancelled
+
+    (old, new, late), cancelled = asyncio.run(main())
+    assert cancelled == ["v1"]
+    assert old.risks == new.risks == late.risks == ["v2"]
+
+
+def test_run_is_cancelled_when_every_waiter_leaves():
+    async def main():
+        sessions = AssistSessions()
+        started = asyncio.Event()
+        cancelled = asyncio.Event()
+
+        async def compute():
+            started.set()
+            try:
+                await asyncio.sleep(10)
+            except asyncio.CancelledError:
+                cancelled.set()
+                raise
+            return _result("never")
+
+        waiter = asyncio.create_task(sessions.run("s", version=1, key="k", compute=compute))
+        await started.wait()
+        waiter.cancel()
+        await asyncio.wait_for(cancelled.wait(), 1)
+        return True
+
+    assert asyncio.run(main())
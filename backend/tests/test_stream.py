@@ -0,0 +1,72 @@
+import asyncio
+import json
+
+from fastapi.testclient import TestClient
+
+from app import main
+from app.agents.base import PanelContext
+from app.models import EvaluationResult
+from app.orchestrator import run_panel
+
+BODY = {
+    "job_description": "# Backend Engineer\n- Must have Python and PostgreSQL experience\n",
+    "resume": "- Built payment services in Python\n- Scaled PostgreSQL clusters\n",
+    "transcript": "Interviewer: How did you scale it?\nCandidate: I'm not sure, I haven't used sharding.\n",
+    "config": {"store": False, "store_trace": False},
+}
+
+
+def _events(text):
+    out = []
+    for block in text.strip().split("\n\n"):
+        lines = dict(line.split(": ", 1) for line in block.splitlines())
+        out.append((lines["event"], json.loads(lines["data"])))
+    return out
+
+
+def test_stream_emits_progress_then_the_same_verdict():
+    with TestClient(main.app) as client:
+        resp = client.post("/evaluate/stream", json=BODY)
+        plain = client.post("/evaluate", json=BODY).json()
+    assert resp.headers["content-type"].startswith("text/event-stream")
+    events = _events(resp.text)
+    names = [name for name, _ in events]
+    assert names[-1] == "done" and names[-2] == "verdict"
+    assert "finding" in names and "vote" in names
+    assert names.index("finding") < names.index("signals") < names.index("vote")
+    verdict = events[-2][1]
+    assert verdict["verdict"] == plain["verdict"]
+    assert verdict["scores"] == plain["scores"]
+
+
+def test_stream_rejects_missing_inputs_before_streaming():
+    with TestClient(main.app) as client:
+        assert client.post("/evaluate/stream", json={**BODY, "transcript": " "}).status_code == 400
+
+
+def test_stream_error_hides_exception_details_unless_debug(monkeypatch):
+    async def broken(*, ctx, seed=None):
+        raise RuntimeError("secret connection string")
+
+    monkeypatch.setattr(main, "run_panel", broken)
+    with TestClient(main.app) as client:
+        monkeypatch.setenv("PANELAI_DEBUG", "0")
+        hidden = dict(_events(client.post("/evaluate/stream", json=BODY).text))["error"]
+        monkeypatch.setenv("PANELAI_DEBUG", "1")
+        shown = dict(_events(client.post("/evaluate/stream", json=BODY).text))["error"]
+    assert hidden == {"detail": "Internal Server Error"}
+    assert "secret connection string" in shown["error"]
+
+
+def test_plain_runs_build_no_event_payloads(monkeypatch):
+    def fail(self, *args, **kwargs):
+        raise AssertionError("model_dump called without a stream consumer")
+
+    ctx = PanelContext(
+        job_description=BODY["job_description"],
+        resume=BODY["resume"],
+        transcript=BODY["transcript"],
+        config={"memo": False, **BODY["config"]},
+    )
+    monkeypatch.setattr(EvaluationResult, "model_dump", fail)
+    assert asyncio.run(run_panel(ctx=ctx)).verdict
@@ -0,0 +1,29 @@
+from app.models import AgentMessage
+from app.traces import TraceStore, summarize_trace, trace_view
+
+TRACE = [
+    AgentMessage(agent="resume-claims", stage="analysis", content="Running"),
+    AgentMessage(agent="resume-claims", stage="analysis", content="Completed"),
+    AgentMessage(agent="judge", stage="cross-exam-1", content="x" * 500, meta={"target_discrepancy": 0}),
+]
+
+
+def test_store_keeps_at_most_max_rows(tmp_path):
+    store = TraceStore(tmp_path / "traces.sqlite3", max_rows=3)
+    ids = [store.save(tenant="t", trace=TRACE) for _ in range(10)]
+    assert [store.get("t", i) is not None for i in ids] == [False] * 7 + [True] * 3
+    assert store.get("other", ids[-1]) is None
+
+
+def test_zero_max_rows_means_no_cap(tmp_path):
+    store = TraceStore(tmp_path / "traces.sqlite3", max_rows=0)
+    ids = [store.save(tenant="t", trace=TRACE) for _ in range(5)]
+    assert all(store.get("t", i) for i in ids)
+
+
+def test_trace_levels():
+    assert trace_view(TRACE, "full") == TRACE
+    assert trace_view(TRACE, "none") == []
+    summary = summarize_trace(TRACE)
+    assert [m.content for m in summary][0] == "Completed"
+    assert len(summary[1].content) == 200
@@ -0,0 +1,88 @@
+import pytest
+
+from app.agents.transcript_turns import TranscriptBuilder, candidate_text, parse_transcript
+
+INLINE = (
+    "Interviewer: Tell me about the migration.\n"
+    "Candidate: I moved billing to Postgres.\n"
+    "Note: I led the cutover myself.\n"
+    "Interviewer: How long did it take?\n"
+    "Candidate: Six weeks, with a dual-write phase.\n"
+)
+OWN_LINE = (
+    "Interviewer:\n"
+    "Tell me about the migration.\n"
+    "Candidate:\n"
+    "I moved billing to Postgres.\n"
+    "Note: I led the cutover myself.\n"
+    "Interviewer:\n"
+    "How long did it take?\n"
+    "Candidate:\n"
+    "Six weeks, with a dual-write phase.\n"
+)
+HEADINGS = "## Round 1\n" + INLINE + "\n## Round 2 (Sam)\n" + OWN_LINE
+
+
+@pytest.mark.parametrize("transcript", [INLINE, OWN_LINE])
+def test_note_inside_answer_stays_candidate_text(transcript):
+    index = parse_transcript(transcript)
+    assert [t.role for t in index.turns] == ["interviewer", "candidate", "interviewer", "candidate"]
+    assert "Note: I led the cutover myself." in index.turns[1].text
+    assert "I led the cutover myself." in candidate_text(transcript)
+
+
+def test_names_seen_on_their_own_line_are_speakers():
+    transcript = "Interviewer: Ready?\nAlex Kim:\nYes.\nInterviewer: Go on.\nAlex Kim: Note: it was hard.\n"
+    index = parse_transcript(transcript)
+    assert [t.speaker for t in index.turns] == ["Interviewer", "Alex Kim", "Interviewer", "Alex Kim"]
+    assert index.turns[3].text == "Note: it was hard."
+    assert index.turns[3].role == "candidate"
+
+
+def test_named_speakers_only_still_split():
+    index = parse_transcript("Alex: Why Postgres?\nJordan: Mature tooling.\nAlex: And scaling?\nJordan: Sharding.\n")
+    assert [t.role for t in index.turns] == ["interviewer", "candidate", "interviewer", "candidate"]
+
+
+def test_headings_are_turns_of_their_own():
+    index = parse_transcript(HEADINGS)
+    headings = [t for t in index.turns if t.text.startswith("##")]
+    assert [t.text for t in headings] == ["## Round 1", "## Round 2 (Sam)"]
+    assert all(t.role == "unknown" for t in headings)
+    assert "##" not in index.candidate_text
+
+
+def _fields(index):
+    return [(t.index, t.speaker, t.text, t.start, t.end, t.timestamp, t.role, t.line_start) for t in index.turns]
+
+
+@pytest.mark.parametrize("transcript", [INLINE, OWN_LINE, HEADINGS])
+def test_incremental_parse_equals_full_parse(transcript):
+    # Every prefix, fed one character at a time, like a live transcript growing.
+    previous = None
+    for cut in range(1, len(transcript) + 1):
+        previous = parse_transcript(transcript[:cut], previous=previous)
+        full = parse_transcript(transcript[:cut])
+        assert _fields(previous) == _fields(full), transcript[:cut]
+        assert previous.candidate_text == full.candidate_text
+        assert previous.speakers == full.speakers
+
+
+@pytest.mark.parametrize("transcript", [INLINE, OWN_LINE, HEADINGS])
+def test_builder_matches_full_parse(transcript):
+    builder = TranscriptBuilder()
+    for i in range(0, len(transcript), 7):
+        builder.feed(transcript[i : i + 7])
+    text = builder.finish()
+    assert text == transcript.strip()
+    assert candidate_text(text) == parse_transcript(text).candidate_text
+    assert "Six weeks" in candidate_text(text)
+
+
+@pytest.mark.parametrize("transcript", [INLINE, OWN_LINE])
+def test_turn_offsets_point_at_their_text(transcript):
+    index = parse_transcript(transcript)
+    for turn in index.turns:
+        assert transcript[turn.start : turn.end].split() == turn.text.split()
+        if turn.speaker:
+            assert transcript[turn.line_start :].startswith(turn.speaker + ":")
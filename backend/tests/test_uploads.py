@@ -0,0 +1,125 @@
+import asyncio
+import io
+import json
+import random
+
+import pytest
+from fastapi import FastAPI, File, HTTPException, UploadFile
+from fastapi.testclient import TestClient
+
+from app import main, uploads
+from app.agents.transcript_turns import TranscriptBuilder, parse_transcript, transcript_index
+from app.uploads import UploadBudget, UploadLimits, read_upload_text
+
+TRANSCRIPT = (
+    "## Round 1 (Grace)\n"
+    "Interviewer: How did you scale the ledger?\n"
+    "Candidate: We sharded by merchant — read replicas for reporting.\n"
+    "Note: this line is not a speaker\n"
+    "[00:12:03] Priya Raman: And the retries?\n"
+    "Candidate: Idempotency keys in Redis; naïve retries double charged.\n"
+) * 20
+
+
+def _read(data: bytes, limits: UploadLimits, **kwargs):
+    upload = UploadFile(io.BytesIO(data), filename="transcript.md")
+    return asyncio.run(read_upload_text(upload, UploadBudget(limits), **kwargs))
+
+
+def test_streamed_parse_equals_parsing_the_whole_text(monkeypatch):
+    monkeypatch.setattr(uploads, "CHUNK_BYTES", 7)  # splits lines and multi-byte characters
+    data = ("\n\n  " + TRANSCRIPT + "\n  ").encode()
+    builder = TranscriptBuilder()
+    _read(data, UploadLimits(), on_text=builder.feed)
+    text = builder.finish()
+    assert text == data.decode().strip()
+    assert transcript_index(text) == parse_transcript(text)
+
+
+def test_random_piece_sizes_parse_like_the_whole_text():
+    rng = random.Random(7)
+    for _ in range(20):
+        builder, pos = TranscriptBuilder(), 0
+        while pos < len(TRANSCRIPT):
+            step = rng.randint(1, 90)
+            builder.feed(TRANSCRIPT[pos : pos + step])
+            pos += step
+        text = builder.finish()
+        assert transcript_index(text).turns == parse_transcript(text).turns
+
+
+def test_per_file_and_per_request_budgets():
+    limits = UploadLimits(max_file_bytes=100, max_request_bytes=150)
+    assert _read(b"x" * 100, limits) == "x" * 100
+    with pytest.raises(HTTPException) as exc:
+        _read(b"x" * 101, limits)
+    assert exc.value.status_code == 413
+
+    budget = UploadBudget(limits)
+    asyncio.run(read_upload_text(UploadFile(io.BytesIO(b"a" * 90), filename="resume.md"), budget))
+    with pytest.raises(HTTPException) as exc:
+        asyncio.run(read_upload_text(UploadFile(io.BytesIO(b"b" * 90), filename="transcript.md"), budget))
+    assert exc.value.status_code == 413 and "in total" in exc.value.detail
+
+
+def test_evaluate_files_rejects_oversized_uploads():
+    files = {
+        "resume": ("resume.md", b"- Built payment services in Python\n"),
+        "job_description": ("jd.md", b"# Backend Engineer\n- Python\n"),
+    }
+    with TestClient(main.app) as client:
+        big_file = {**files, "transcript": ("t.md", b"Candidate: ok\n" * (main.UPLOAD_LIMITS.max_file_bytes // 14 + 1))}
+        resp = client.post("/evaluate-files", files=big_file)
+        assert resp.status_code == 413 and resp.json()["detail"].startswith("t.md exceeds")
+
+        body = b"x" * (main.UPLOAD_LIMITS.max_request_bytes + 1)
+        resp = client.post("/evaluate-files", files={**files, "transcript": ("t.md", body)})
+        assert resp.status_code == 413 and "Request body" in resp.json()["detail"]
+
+        ok = client.post("/evaluate-files", files={**files, "transcript": ("t.md", TRANSCRIPT.encode())})
+        assert ok.status_code == 200
+
+
+def _multipart(boundary, parts):
+    out = b""
+    for name, filename, data in parts:
+        out += (
+            f'--{boundary}\r\nContent-Disposition: form-data; name="{name}"; filename="{filename}"\r\n'
+            "Content-Type: text/plain\r\n\r\n"
+        ).encode() + data + b"\r\n"
+    return out + f"--{boundary}--\r\n".encode()
+
+
+def test_oversized_part_stops_the_read_mid_body():
+    inner = FastAPI()
+
+    @inner.post("/evaluate-files")
+    async def handler(resume: UploadFile = File(...), transcript: UploadFile = File(...)):
+        return {"ok": True}
+
+    body = _multipart("b0undary", [("resume", "cv.md", b"r" * 100), ("transcript", "t.md", b"t" * 50_000)])
+    chunks = [body[i : i + 1024] for i in range(0, len(body), 1024)]
+    read = 0
+
+    async def receive():
+        nonlocal read
+        read += 1
+        return {"type": "http.request", "body": chunks[read - 1], "more_body": read < len(chunks)}
+
+    sent = []
+
+    async def send(message):
+        sent.append(message)
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/evaluate-files",
+        "headers": [(b"content-type", b"multipart/form-data; boundary=b0undary")],
+        "query_string": b"",
+    }
+    app = uploads.RequestSizeLimitMiddleware(inner, paths=("/evaluate-files",), max_bytes=10**6, max_part_bytes=4096)
+    asyncio.run(app(scope, receive, send))
+    assert sent[0]["status"] == 413
+    assert json.loads(sent[1]["body"])["detail"] == "t.md exceeds 4096 bytes"
+    assert read < len(chunks) // 4
@@ -0,0 +1,48 @@
+import asyncio
+import time
+
+from app.llm import usage
+from app.llm.provider import LLMResponse
+from app.llm.usage import MeteredProvider, TenantBudgets, UsageLedger, new_ledger
+
+
+class _Fixed:
+    name = "fixed"
+    model = "m"
+
+    async def complete(self, *, system, user):
+        return LLMResponse(text="ok", prompt_tokens=100, completion_tokens=20)
+
+
+def test_ledger_totals_per_agent_stage_and_cost():
+    ledger = UsageLedger(budget=250, prices={"m": (1.0, 2.0)})
+
+    async def calls():
+        await MeteredProvider(_Fixed(), ledger, agent="judge", stage="panel").complete(system="", user="")
+        await MeteredProvider(_Fixed(), ledger, agent="judge", stage="cross-exam").complete(system="", user="")
+        assert not ledger.exhausted and ledger.remaining == 10
+        await MeteredProvider(_Fixed(), ledger, agent="hm", stage="panel").complete(system="", user="")
+
+    asyncio.run(calls())
+    summary = ledger.summary()
+    assert summary["total_tokens"] == 360 and summary["exhausted"] is True
+    assert summary["by_agent"]["judge"]["calls"] == 2
+    assert summary["by_stage"]["panel"]["total_tokens"] == 240
+    assert summary["cost_usd"] == round(3 * (100 * 1.0 + 20 * 2.0) / 1_000_000, 6)
+
+
+def test_request_budget_is_capped_by_the_tenant_remainder(monkeypatch):
+    budgets = TenantBudgets(budget=1000, window_s=3600)
+    monkeypatch.setattr(usage, "_TENANT_BUDGETS", budgets)
+    budgets.charge("t", 700)
+    assert new_ledger(config={"token_budget": 500}, tenant="t").budget == 300
+    assert new_ledger(config={"token_budget": 200}, tenant="t").budget == 200
+    assert new_ledger(config={}, tenant="other").budget == 1000
+
+
+def test_tenant_spend_expires_with_the_window():
+    budgets = TenantBudgets(budget=100, window_s=0.05)
+    budgets.charge("t", 100)
+    assert budgets.remaining("t") == 0
+    time.sleep(0.1)
+    assert budgets.remaining("t") == 100
@@ -0,0 +1,80 @@
+import asyncio
+import subprocess
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+from fastapi.testclient import TestClient
+
+from app import main, warmup
+from app.llm.factory import build_provider
+from app.llm.registry import ProviderRegistry
+from app.samples import SampleCatalog
+from app.warmup import Readiness, warm_up
+
+
+def _state(tmp_path):
+    return SimpleNamespace(
+        samples=SampleCatalog(tmp_path), providers=ProviderRegistry(default=build_provider("heuristic"))
+    )
+
+
+def test_warm_up_runs_every_step_then_marks_ready(tmp_path):
+    readiness = Readiness()
+    asyncio.run(warm_up(_state(tmp_path), readiness))
+    assert readiness.ready and not readiness.errors
+    assert list(readiness.steps) == ["samples", "stores", "providers", "pipeline"]
+    assert readiness.as_dict()["status"] == "ready"
+
+
+def test_failed_step_is_reported_but_does_not_block_readiness(tmp_path, monkeypatch):
+    async def broken():
+        raise RuntimeError("pool unavailable")
+
+    state = _state(tmp_path)
+    state.providers = SimpleNamespace(warm_up=broken)
+    readiness = Readiness()
+    asyncio.run(warm_up(state, readiness))
+    assert readiness.ready
+    assert "pool unavailable" in readiness.errors["providers"]
+
+
+def test_ready_is_503_until_warm_up_finishes(monkeypatch):
+    gate = asyncio.Event()
+    real = warmup.warm_up
+
+    async def slow(state, readiness):
+        await gate.wait()
+        await real(state, readiness)
+
+    monkeypatch.setenv("PANELAI_WARMUP", "1")
+    monkeypatch.setattr(main, "warm_up", slow)
+    with TestClient(main.app) as client:
+        assert client.get("/health").status_code == 200
+        resp = client.get("/ready")
+        assert resp.status_code == 503 and resp.json()["status"] == "warming"
+        client.portal.call(gate.set)
+        for _ in range(200):
+            if client.get("/ready").status_code == 200:
+                break
+            client.portal.call(asyncio.sleep, 0.05)
+        assert client.get("/ready").json()["status"] == "ready"
+
+
+def test_warm_up_can_be_turned_off(monkeypatch):
+    monkeypatch.setenv("PANELAI_WARMUP", "0")
+    with TestClient(main.app) as client:
+        assert client.get("/ready").status_code == 200
+
+
+def test_provider_modules_are_imported_on_first_use():
+    code = "import sys, app.main; print('app.llm.openai_provider' in sys.modules)"
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        cwd=Path(__file__).resolve().parents[1],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={"PATH": "", "PANELAI_LLM_PROVIDER": "heuristic"},
+    )
+    assert out.stdout.strip() == "False"
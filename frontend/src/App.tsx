@@ -1,4 +1,4 @@
-import React, { useEffect, useMemo, useState } from 'react';
+import React, { useEffect, useRef, useState } from 'react';
 import {
   BrainCircuit,
   Cloud,
@@ -11,7 +11,22 @@ import {
   Swords,
   Target
 } from 'lucide-react';
-import { assist, checkHealth, evaluate, fetchSamples, type AssistResult, type EvaluationResult, type Sample } from './api';
+import {
+  assist,
+  checkHealth,
+  evaluate,
+  evaluateAssistSession,
+  fetchSample,
+  fetchSamples,
+  fetchTrace,
+  type AgentMessage,
+  type AssistResult,
+  type EvaluationResult,
+  type Sample,
+  type SampleSummary
+} from './api';
+
+const SAMPLE_PAGE = 50;
 
 type Mode = 'sample' | 'manual';
 type EvalView = 'panel' | 'live';
@@ -19,8 +34,10 @@ type EvalView = 'panel' | 'live';
 export function App() {
   const [mode, setMode] = useState<Mode>('sample');
   const [evalView, setEvalView] = useState<EvalView>('panel');
-  const [samples, setSamples] = useState<Sample[]>([]);
+  const [samples, setSamples] = useState<SampleSummary[]>([]);
+  const [samplesNext, setSamplesNext] = useState<number | null>(null);
   const [sampleId, setSampleId] = useState<string>('');
+  const [selectedSample, setSelectedSample] = useState<Sample | null>(null);
 
   const [jobDescription, setJobDescription] = useState('');
   const [resume, setResume] = useState('');
@@ -39,23 +56,43 @@ export function App() {
   const [assistUpdatedAt, setAssistUpdatedAt] = useState<number>(0);
   const [backendStatus, setBackendStatus] = useState<'unknown' | 'ok' | 'down'>('unknown');
   const [resultTab, setResultTab] = useState<'overview' | 'discrepancies' | 'trace' | 'questions'>('overview');
+  // Responses carry a trace summary; the full trace is fetched when the Trace tab is opened.
+  const [fullTrace, setFullTrace] = useState<AgentMessage[] | null>(null);
 
   const [appendText, setAppendText] = useState('');
   const [micSupported, setMicSupported] = useState(false);
   const [micListening, setMicListening] = useState(false);
   const [micInterim, setMicInterim] = useState('');
 
+  // Live assist session: the backend drops work for older transcript versions.
+  const assistSessionId = useRef<string>(Math.random().toString(36).slice(2) + Date.now().toString(36));
+  const assistVersion = useRef(0);
+  // Inputs of the last assist run that succeeded; "Run evaluation" on the same inputs finalizes the session.
+  const assistedInputs = useRef<{ jd: string; resume: string; transcript: string; version: number } | null>(null);
+
   useEffect(() => {
-    fetchSamples()
-      .then((s) => {
-        setSamples(s);
-        if (s.length) {
-          setSampleId(s[0].id);
+    fetchSamples({ limit: SAMPLE_PAGE })
+      .then((page) => {
+        setSamples(page.items);
+        setSamplesNext(page.next_offset);
+        if (page.items.length) {
+          setSampleId(page.items[0].id);
         }
       })
       .catch((e) => setError(String(e)));
   }, []);
 
+  async function loadMoreSamples() {
+    if (samplesNext === null) return;
+    try {
+      const page = await fetchSamples({ offset: samplesNext, limit: SAMPLE_PAGE });
+      setSamples((prev: SampleSummary[]) => [...prev, ...page.items]);
+      setSamplesNext(page.next_offset);
+    } catch (e) {
+      setError(String(e));
+    }
+  }
+
   useEffect(() => {
     checkHealth()
       .then(() => setBackendStatus('ok'))
@@ -66,10 +103,18 @@ export function App() {
     setMicSupported(Boolean(window.SpeechRecognition || window.webkitSpeechRecognition));
   }, []);
 
-  const selectedSample = useMemo(
-    () => samples.find((s: Sample) => s.id === sampleId) || null,
-    [samples, sampleId]
-  );
+  useEffect(() => {
+    if (!sampleId) return;
+    let cancelled = false;
+    fetchSample(sampleId)
+      .then((s) => {
+        if (!cancelled) setSelectedSample(s);
+      })
+      .catch((e) => setError(String(e)));
+    return () => {
+      cancelled = true;
+    };
+  }, [sampleId]);
 
   useEffect(() => {
     if (mode !== 'sample') return;
@@ -79,20 +124,35 @@ export function App() {
     setTranscript(selectedSample.transcript);
   }, [mode, selectedSample]);
 
+  useEffect(() => {
+    const traceId = result?.artifacts?.trace_id;
+    if (resultTab !== 'trace' || fullTrace || typeof traceId !== 'string') return;
+    fetchTrace(traceId)
+      .then(setFullTrace)
+      .catch(() => setFullTrace(null));
+  }, [resultTab, result, fullTrace]);
+
   async function onRun() {
     setBusy(true);
     setError('');
     setResult(null);
+    setFullTrace(null);
     try {
       if (!jobDescription.trim() || !resume.trim() || !transcript.trim()) {
         throw new Error('Please provide Job Description, Resume, and Transcript (upload or paste).');
       }
-      const res = await evaluate({
-        job_description: jobDescription,
-        resume,
-        transcript,
-        config: { cross_exam_rounds: 1 }
-      });
+      const config = { cross_exam_rounds: 1 };
+      const assisted = assistedInputs.current;
+      const res =
+        assisted &&
+        assisted.jd === jobDescription &&
+        assisted.resume === resume &&
+        assisted.transcript === transcript
+          ? await evaluateAssistSession(assistSessionId.current, {
+              transcript_version: assisted.version,
+              config
+            }).catch(() => evaluate({ job_description: jobDescription, resume, transcript, config }))
+          : await evaluate({ job_description: jobDescription, resume, transcript, config });
       setResult(res);
       setResultTab('overview');
     } catch (e) {
@@ -109,14 +169,19 @@ export function App() {
       if (!jobDescription.trim() || !resume.trim()) {
         throw new Error('Please provide Job Description and Resume to start Live Interview assist.');
       }
+      assistVersion.current += 1;
+      const inputs = { jd: jobDescription, resume, transcript, version: assistVersion.current };
       const res = await assist({
         job_description: jobDescription,
         resume,
         transcript,
-        config: { mode: 'assist' }
+        config: { mode: 'assist' },
+        session_id: assistSessionId.current,
+        transcript_version: assistVersion.current
       });
       setAssistResult(res);
       setAssistUpdatedAt(Date.now());
+      assistedInputs.current = inputs;
     } catch (e) {
       setAssistError(String(e));
     } finally {
@@ -492,16 +557,23 @@ export function App() {
                   </div>
 
                   {mode === 'sample' && (
-                    <select
-                      value={sampleId}
-                      onChange={(e: React.ChangeEvent<HTMLSelectElement>) => setSampleId(e.target.value)}
-                    >
-                      {samples.map((s: Sample) => (
-                        <option key={s.id} value={s.id}>
-                          {s.id}
-                        </option>
-                      ))}
-                    </select>
+                    <>
+                      <select
+                        value={sampleId}
+                        onChange={(e: React.ChangeEvent<HTMLSelectElement>) => setSampleId(e.target.value)}
+                      >
+                        {samples.map((s: SampleSummary) => (
+                          <option key={s.id} value={s.id}>
+                            {s.title ? `${s.id} — ${s.title}` : s.id}
+                          </option>
+                        ))}
+                      </select>
+                      {samplesNext !== null && (
+                        <button type="button" onClick={loadMoreSamples}>
+                          More samples
+                        </button>
+                      )}
+                    </>
                   )}
                 </div>
 
@@ -934,7 +1006,7 @@ export function App() {
                 <div className="tabPanel" id="trace">
                   <div className="muted">Showing the most recent 80 events.</div>
                   <div className="trace compactScroll">
-                    {result.trace.slice(-80).map((m, idx) => {
+                    {(fullTrace ?? result.trace).slice(-80).map((m, idx) => {
                       const content = clamp(m.content, 320);
                       return (
                         <div className="traceItem" key={idx}>
@@ -1,9 +1,18 @@
+export type EvidenceSpan = {
+  doc: 'transcript' | 'resume' | 'job_description';
+  start: number;
+  end: number;
+  turn: number | null;
+};
+
 export type Discrepancy = {
+  id?: string;
   severity: 'low' | 'medium' | 'high';
   category: string;
   claim: string;
   evidence: string;
   explanation: string;
+  evidence_span?: EvidenceSpan | null;
 };
 
 export type DimensionScore = {
@@ -32,10 +41,12 @@ export type EvaluationResult = {
 };
 
 export type FollowUp = {
+  id?: string;
   question: string;
   reason: string;
   evidence: string;
   evidence_score: number;
+  evidence_span?: EvidenceSpan | null;
 };
 
 export type AssistResult = {
@@ -45,6 +56,22 @@ export type AssistResult = {
   artifacts: Record<string, unknown>;
 };
 
+export type AssistDelta = {
+  etag: string;
+  base_etag: string | null;
+  full: boolean;
+  discrepancies_added: Discrepancy[];
+  discrepancies_changed: Discrepancy[];
+  discrepancies_removed: string[];
+  discrepancy_order: string[];
+  followups_added: FollowUp[];
+  followups_changed: FollowUp[];
+  followups_removed: string[];
+  followup_order: string[];
+  risks: string[] | null;
+  artifacts: Record<string, unknown>;
+};
+
 export type Sample = {
   id: string;
   job_description: string;
@@ -58,12 +85,38 @@ export async function checkHealth(): Promise<{ status: string }> {
   return resp.json();
 }
 
-export async function fetchSamples(): Promise<Sample[]> {
-  const resp = await fetch('/samples');
+export type SampleSummary = {
+  id: string;
+  title: string;
+  candidate: string;
+  bytes: number;
+  updated_at: number;
+};
+
+export type SampleList = {
+  items: SampleSummary[];
+  total: number;
+  next_offset: number | null;
+};
+
+// Responses carry ETags with `Cache-Control: no-cache`, so the browser revalidates and gets 304s.
+export async function fetchSamples(params: { offset?: number; limit?: number; q?: string } = {}): Promise<SampleList> {
+  const query = new URLSearchParams();
+  if (params.offset) query.set('offset', String(params.offset));
+  if (params.limit) query.set('limit', String(params.limit));
+  if (params.q) query.set('q', params.q);
+  const qs = query.toString();
+  const resp = await fetch(qs ? `/samples?${qs}` : '/samples');
   if (!resp.ok) throw new Error(`Failed to load samples: ${resp.status}`);
   return resp.json();
 }
 
+export async function fetchSample(id: string): Promise<Sample> {
+  const resp = await fetch(`/samples/${encodeURIComponent(id)}`);
+  if (!resp.ok) throw new Error(`Failed to load sample: ${resp.status}`);
+  return resp.json();
+}
+
 export async function evaluate(payload: {
   job_description: string;
   resume: string;
@@ -82,11 +135,35 @@ export async function evaluate(payload: {
   return resp.json();
 }
 
+export async function evaluateAssistSession(
+  sessionId: string,
+  payload: { transcript_version?: number; config?: Record<string, unknown> }
+): Promise<EvaluationResult> {
+  const resp = await fetch(`/assist/sessions/${encodeURIComponent(sessionId)}/evaluate`, {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify(payload)
+  });
+  if (!resp.ok) {
+    const text = await resp.text();
+    throw new Error(`Evaluate failed: ${resp.status} ${text}`);
+  }
+  return resp.json();
+}
+
+export async function fetchTrace(traceId: string): Promise<AgentMessage[]> {
+  const resp = await fetch(`/traces/${encodeURIComponent(traceId)}`);
+  if (!resp.ok) throw new Error(`Failed to load trace: ${resp.status}`);
+  return resp.json();
+}
+
 export async function assist(payload: {
   job_description: string;
   resume: string;
   transcript: string;
   config?: Record<string, unknown>;
+  session_id?: string;
+  transcript_version?: number;
 }): Promise<AssistResult> {
   const resp = await fetch('/assist', {
     method: 'POST',
@@ -99,3 +176,54 @@ export async function assist(payload: {
   }
   return resp.json();
 }
+
+export type EvaluateStreamEvent = {
+  event: 'finding' | 'signals' | 'vote' | 'token' | 'cross_exam' | 'verdict' | 'done' | 'error';
+  data: any;
+};
+
+export async function evaluateStream(
+  payload: {
+    job_description: string;
+    resume: string;
+    transcript: string;
+    config?: Record<string, unknown>;
+  },
+  onEvent: (e: EvaluateStreamEvent) => void
+): Promise<EvaluationResult | null> {
+  const resp = await fetch('/evaluate/stream', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json', Accept: 'text/event-stream' },
+    body: JSON.stringify(payload)
+  });
+  if (!resp.ok || !resp.body) {
+    const text = await resp.text();
+    throw new Error(`Evaluate stream failed: ${resp.status} ${text}`);
+  }
+
+  const reader = resp.body.getReader();
+  const decoder = new TextDecoder();
+  let buffer = '';
+  let result: EvaluationResult | null = null;
+  for (;;) {
+    const { value, done } = await reader.read();
+    if (done) break;
+    buffer += decoder.decode(value, { stream: true });
+    let sep: number;
+    while ((sep = buffer.indexOf('\n\n')) >= 0) {
+      const block = buffer.slice(0, sep);
+      buffer = buffer.slice(sep + 2);
+      const event = /^event: (.*)$/m.exec(block)?.[1] as EvaluateStreamEvent['event'] | undefined;
+      const data = /^data: (.*)$/m.exec(block)?.[1];
+      if (!event || data === undefined) continue;
+      const parsed = JSON.parse(data);
+      if (event === 'verdict') result = parsed as EvaluationResult;
+      onEvent({ event, data: parsed });
+    }
+  }
+  return result;
+}
+
+export function spanText(doc: string, span: EvidenceSpan | null | undefined): string {
+  return span ? doc.slice(span.start, span.end) : '';
+}